@@ -4,36 +4,74 @@ PreliZ.
 Exploring and eliciting probability distributions
 """
 
-from os import path as os_path
-
-from matplotlib import rcParams as mpl_rcParams
-from matplotlib import style
-
-from preliz.distributions import *
-from preliz.distributions.plot import plot
-from preliz.distributions.catalog import catalog
-from preliz.predictive import *
-from preliz.ppls import *
-from preliz.unidimensional import *
-from preliz.multidimensional import *
-from preliz.internal.rcparams import rc_context, rcParams
-from preliz.internal.citations import citations
+from importlib import import_module
 
+from preliz.distributions import __all__ as _distributions_all
+from preliz.internal.mpl_styles import register_styles
+from preliz.internal.rcparams import rc_context, rcParams
 
 __version__ = "0.27.1"
 
 
-# Allow legend outside plot in maxent to be included in the saved figure
-mpl_rcParams["savefig.bbox"] = "tight"
+# Public names are imported on first access (PEP 562). Importing PreliZ is cheap, and
+# pytensor, matplotlib or the PPLs are only imported when something needs them.
+_lazy_attrs = {
+    **dict.fromkeys(_distributions_all, "preliz.distributions"),
+    "plot": "preliz.distributions.plot",
+    "catalog": "preliz.distributions.catalog",
+    "ppa": "preliz.predictive",
+    "ppe": "preliz.predictive",
+    "predictive_explorer": "preliz.predictive",
+    "from_prior": "preliz.ppls",
+    "from_pymc": "preliz.ppls",
+    "ChunkedSample": "preliz.unidimensional",
+    "combine": "preliz.unidimensional",
+    "combine_roulette": "preliz.unidimensional",
+    "match_lmoments": "preliz.unidimensional",
+    "match_moments": "preliz.unidimensional",
+    "match_moments_batch": "preliz.unidimensional",
+    "match_quantiles": "preliz.unidimensional",
+    "match_quantiles_batch": "preliz.unidimensional",
+    "maxent": "preliz.unidimensional",
+    "maxent_batch": "preliz.unidimensional",
+    "mle": "preliz.unidimensional",
+    "quartile": "preliz.unidimensional",
+    "quartile_batch": "preliz.unidimensional",
+    "QuartileInt": "preliz.unidimensional",
+    "Roulette": "preliz.unidimensional",
+    "dirichlet_mode": "preliz.multidimensional",
+    "citations": "preliz.internal.citations",
+    "warmup": "preliz.internal.warmup",
+}
+
+_submodules = [
+    "distributions",
+    "internal",
+    "multidimensional",
+    "ppls",
+    "predictive",
+    "unidimensional",
+]
+
+__all__ = [*_lazy_attrs, "style", "rc_context", "rcParams"]  # noqa: PLE0604
+
+register_styles()
+
+
+def __getattr__(name):
+    if name == "style":
+        # PreliZ's styles are added when matplotlib.style is imported, see register_styles
+        value = import_module("matplotlib.style")
+    elif name in _lazy_attrs:
+        value = getattr(import_module(_lazy_attrs[name]), name)
+    elif name in _submodules:
+        value = import_module(f"preliz.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    globals()[name] = value
+    return value
 
-# add PreliZ's styles to matplotlib's styles
-_preliz_style_path = os_path.join(os_path.dirname(__file__), "styles")
-if hasattr(style, "USER_LIBRARY_PATHS"):
-    style.USER_LIBRARY_PATHS.append(_preliz_style_path)
-else:
-    style.core.USER_LIBRARY_PATHS.append(_preliz_style_path)
-style.reload_library()
 
-# clean namespace
-del os_path, mpl_rcParams, _preliz_style_path
+def __dir__():
+    return [*globals(), *__all__, *_submodules]
@@ -1,111 +1,94 @@
-from preliz.distributions.asymmetric_laplace import AsymmetricLaplace
-from preliz.distributions.bernoulli import Bernoulli
-from preliz.distributions.beta import Beta
-from preliz.distributions.betabinomial import BetaBinomial
-from preliz.distributions.betascaled import BetaScaled
-from preliz.distributions.binomial import Binomial
-from preliz.distributions.categorical import Categorical
-from preliz.distributions.cauchy import Cauchy
-from preliz.distributions.censored import Censored
-from preliz.distributions.chi_squared import ChiSquared
-from preliz.distributions.continuous_multivariate import Dirichlet, MvNormal
-from preliz.distributions.discrete_uniform import DiscreteUniform
-from preliz.distributions.discrete_weibull import DiscreteWeibull
-from preliz.distributions.exgaussian import ExGaussian
-from preliz.distributions.exponential import Exponential
-from preliz.distributions.gamma import Gamma
-from preliz.distributions.geometric import Geometric
-from preliz.distributions.gumbel import Gumbel
-from preliz.distributions.halfcauchy import HalfCauchy
-from preliz.distributions.halfnormal import HalfNormal
-from preliz.distributions.halfstudentt import HalfStudentT
-from preliz.distributions.hurdle import Hurdle
-from preliz.distributions.hypergeometric import HyperGeometric
-from preliz.distributions.inversegamma import InverseGamma
-from preliz.distributions.kumaraswamy import Kumaraswamy
-from preliz.distributions.laplace import Laplace
-from preliz.distributions.logistic import Logistic
-from preliz.distributions.logitnormal import LogitNormal
-from preliz.distributions.loglogistic import LogLogistic
-from preliz.distributions.lognormal import LogNormal
-from preliz.distributions.mixture import Mixture
-from preliz.distributions.moyal import Moyal
-from preliz.distributions.negativebinomial import NegativeBinomial
-from preliz.distributions.normal import Normal
-from preliz.distributions.pareto import Pareto
-from preliz.distributions.poisson import Poisson
-from preliz.distributions.rice import Rice
-from preliz.distributions.skew_studentt import SkewStudentT
-from preliz.distributions.skewnormal import SkewNormal
-from preliz.distributions.studentt import StudentT
-from preliz.distributions.triangular import Triangular
-from preliz.distributions.truncated import Truncated
-from preliz.distributions.truncatednormal import TruncatedNormal
-from preliz.distributions.uniform import Uniform
-from preliz.distributions.vonmises import VonMises
-from preliz.distributions.wald import Wald
-from preliz.distributions.weibull import Weibull
-from preliz.distributions.zi_binomial import ZeroInflatedBinomial
-from preliz.distributions.zi_negativebinomial import ZeroInflatedNegativeBinomial
-from preliz.distributions.zi_poisson import ZeroInflatedPoisson
+"""Probability distributions.
 
-all_continuous = [
-    AsymmetricLaplace,
-    Beta,
-    BetaScaled,
-    Cauchy,
-    ChiSquared,
-    ExGaussian,
-    Exponential,
-    Gamma,
-    Gumbel,
-    HalfCauchy,
-    HalfNormal,
-    HalfStudentT,
-    InverseGamma,
-    Kumaraswamy,
-    Laplace,
-    Logistic,
-    LogLogistic,
-    LogNormal,
-    LogitNormal,
-    Moyal,
-    Normal,
-    Pareto,
-    Rice,
-    SkewNormal,
-    SkewStudentT,
-    StudentT,
-    Triangular,
-    TruncatedNormal,
-    Uniform,
-    VonMises,
-    Wald,
-    Weibull,
-]
-all_discrete = [
-    Bernoulli,
-    BetaBinomial,
-    Binomial,
-    Categorical,
-    DiscreteUniform,
-    DiscreteWeibull,
-    Geometric,
-    HyperGeometric,
-    NegativeBinomial,
-    Poisson,
-    ZeroInflatedBinomial,
-    ZeroInflatedNegativeBinomial,
-    ZeroInflatedPoisson,
-]
+Classes are imported on first access (PEP 562), so using a distribution only imports the
+modules it needs.
+"""
 
-all_continuous_multivariate = [Dirichlet, MvNormal]
+from importlib import import_module
 
-all_modifiers = [Mixture, Truncated, Censored, Hurdle]
+_continuous = {
+    "AsymmetricLaplace": "asymmetric_laplace",
+    "Beta": "beta",
+    "BetaScaled": "betascaled",
+    "Cauchy": "cauchy",
+    "ChiSquared": "chi_squared",
+    "ExGaussian": "exgaussian",
+    "Exponential": "exponential",
+    "Gamma": "gamma",
+    "Gumbel": "gumbel",
+    "HalfCauchy": "halfcauchy",
+    "HalfNormal": "halfnormal",
+    "HalfStudentT": "halfstudentt",
+    "InverseGamma": "inversegamma",
+    "Kumaraswamy": "kumaraswamy",
+    "Laplace": "laplace",
+    "Logistic": "logistic",
+    "LogLogistic": "loglogistic",
+    "LogNormal": "lognormal",
+    "LogitNormal": "logitnormal",
+    "Moyal": "moyal",
+    "Normal": "normal",
+    "Pareto": "pareto",
+    "Rice": "rice",
+    "SkewNormal": "skewnormal",
+    "SkewStudentT": "skew_studentt",
+    "StudentT": "studentt",
+    "Triangular": "triangular",
+    "TruncatedNormal": "truncatednormal",
+    "Uniform": "uniform",
+    "VonMises": "vonmises",
+    "Wald": "wald",
+    "Weibull": "weibull",
+}
+_discrete = {
+    "Bernoulli": "bernoulli",
+    "BetaBinomial": "betabinomial",
+    "Binomial": "binomial",
+    "Categorical": "categorical",
+    "DiscreteUniform": "discrete_uniform",
+    "DiscreteWeibull": "discrete_weibull",
+    "Geometric": "geometric",
+    "HyperGeometric": "hypergeometric",
+    "NegativeBinomial": "negativebinomial",
+    "Poisson": "poisson",
+    "ZeroInflatedBinomial": "zi_binomial",
+    "ZeroInflatedNegativeBinomial": "zi_negativebinomial",
+    "ZeroInflatedPoisson": "zi_poisson",
+}
+_continuous_multivariate = {
+    "Dirichlet": "continuous_multivariate",
+    "MvNormal": "continuous_multivariate",
+}
+_modifiers = {
+    "Mixture": "mixture",
+    "Truncated": "truncated",
+    "Censored": "censored",
+    "Hurdle": "hurdle",
+}
 
-__all__ = (  # noqa: PLE0604
-    [s.__name__ for s in all_continuous]
-    + [s.__name__ for s in all_discrete]
-    + [s.__name__ for s in all_continuous_multivariate]
-    + [s.__name__ for s in all_modifiers]
-)
+_groups = {
+    "all_continuous": _continuous,
+    "all_discrete": _discrete,
+    "all_continuous_multivariate": _continuous_multivariate,
+    "all_modifiers": _modifiers,
+}
+
+__all__ = [*_continuous, *_discrete, *_continuous_multivariate, *_modifiers]  # noqa: PLE0604
+
+
+def __getattr__(name):
+    for group in _groups.values():
+        if name in group:
+            value = getattr(import_module(f"preliz.distributions.{group[name]}"), name)
+            break
+    else:
+        if name not in _groups:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = [__getattr__(dist_name) for dist_name in _groups[name]]
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return [*globals(), *__all__, *_groups]
@@ -48,6 +48,7 @@ class Bernoulli(Discrete):
     """
 
     parametrizations = [("p",), ("logit_p",)]
+    _suff_stats = ("moments",)
 
     def __init__(self, p=None, logit_p=None):
         super().__init__()
@@ -92,7 +93,13 @@ class Bernoulli(Discrete):
         self._update(mean)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.all((sample == 0) | (sample == 1)):
+            self._update(np.mean(sample))
+        else:
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        self._update(stats["mean"])
 
     def pdf(self, x):
         return ptd_pdf(x, self.p)
@@ -1,5 +1,6 @@
 """Beta distribution."""
 
+import numba as nb
 import numpy as np
 from pytensor_distributions import beta as ptd_beta
 
@@ -12,7 +13,7 @@ from preliz.internal.distribution_helper import (
     pytensor_rng_jit,
 )
 from preliz.internal.optimization import optimize_ml
-from preliz.internal.special import mean_and_std
+from preliz.internal.special import digamma, mean_and_std, trigamma
 
 
 class Beta(Continuous):
@@ -71,6 +72,7 @@ class Beta(Continuous):
     """
 
     parametrizations = [("alpha", "beta"), ("mu", "sigma"), ("mu", "nu")]
+    _suff_stats = ("moments", "log_moments", "log1m_moments")
 
     def __init__(self, alpha=None, beta=None, mu=None, sigma=None, nu=None):
         super().__init__()
@@ -146,9 +148,19 @@ class Beta(Continuous):
         self._update(alpha, beta)
 
     def _fit_mle(self, sample):
-        mean, std = mean_and_std(sample)
-        self._fit_moments(mean, std)
-        optimize_ml(self, sample)
+        if np.all((sample > 0) & (sample < 1)):
+            self._update(*nb_fit_mle(sample))
+        else:
+            mean, std = mean_and_std(sample)
+            self._fit_moments(mean, std)
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        self._update(
+            *nb_fit_suff_stats_vec(
+                stats["mean_log"], stats["mean_log1m"], stats["mean"], stats["var"]
+            )
+        )
 
     def pdf(self, x):
         return ptd_pdf(x, self.alpha, self.beta)
@@ -326,3 +338,52 @@ def ptd_lmoment4(alpha, beta):
 @pytensor_rng_jit
 def ptd_rvs(alpha, beta, size, rng):
     return ptd_beta.rvs(alpha, beta, size=size, random_state=rng)
+
+
+@nb.njit(cache=True)
+def nb_fit_mle(sample):
+    mean, std = mean_and_std(sample)
+    return nb_fit_suff_stats(np.mean(np.log(sample)), np.mean(np.log1p(-sample)), mean, std**2)
+
+
+@nb.njit(cache=True)
+def nb_fit_suff_stats(mean_log, mean_log1m, mean, var, tol=1e-10, max_iter=100):
+    """Newton's method, the sufficient statistics are the mean of log(x) and log(1 - x).
+
+    The mean and variance are only used for the initial guess.
+    """
+    common = mean * (1 - mean) / var - 1
+    if common > 0:
+        alpha, beta = mean * common, (1 - mean) * common
+    else:
+        alpha, beta = 1.0, 1.0
+
+    for _ in range(max_iter):
+        dg_sum = digamma(alpha + beta)
+        tg_sum = trigamma(alpha + beta)
+        grad_a = digamma(alpha) - dg_sum - mean_log
+        grad_b = digamma(beta) - dg_sum - mean_log1m
+        hess_aa = trigamma(alpha) - tg_sum
+        hess_bb = trigamma(beta) - tg_sum
+        det = hess_aa * hess_bb - tg_sum**2
+        step_a = (hess_bb * grad_a + tg_sum * grad_b) / det
+        step_b = (hess_aa * grad_b + tg_sum * grad_a) / det
+        # keep the parameters positive
+        while step_a >= alpha or step_b >= beta:
+            step_a /= 2
+            step_b /= 2
+        alpha -= step_a
+        beta -= step_b
+        if abs(step_a) <= tol * alpha and abs(step_b) <= tol * beta:
+            break
+    return alpha, beta
+
+
+@nb.guvectorize(
+    ["void(float64, float64, float64, float64, float64[:], float64[:])"],
+    "(),(),(),()->(),()",
+    cache=True,
+)
+def nb_fit_suff_stats_vec(mean_log, mean_log1m, mean, var, alpha, beta):
+    """Elementwise version of :func:`nb_fit_suff_stats`, for fits of several rows at once."""
+    alpha[0], beta[0] = nb_fit_suff_stats(mean_log, mean_log1m, mean, var)
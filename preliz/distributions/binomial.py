@@ -45,6 +45,8 @@ class Binomial(Discrete):
         Probability of success in each trial (0 < p < 1).
     """
 
+    _suff_stats = ("moments", "max")
+
     def __init__(self, n=None, p=None):
         super().__init__()
         self.support = (0, np.inf)
@@ -139,6 +141,9 @@ class Binomial(Discrete):
     def _fit_mle(self, sample):
         self._update(*nb_fit_mle(sample))
 
+    def _fit_suff_stats(self, stats):
+        self._update(*nb_fit_suff_stats(stats["mean"], stats["var"] ** 0.5, stats["max"]))
+
 
 @pytensor_jit
 def ptd_pdf(x, n, p):
@@ -227,9 +232,13 @@ def ptd_rvs(n, p, size, rng):
 
 @nb.njit(cache=True)
 def nb_fit_mle(sample):
-    # see https://doi.org/10.1016/j.jspi.2004.02.019 for details
     x_bar, x_std = mean_and_std(sample)
-    x_max = np.max(sample)
+    return nb_fit_suff_stats(x_bar, x_std, np.max(sample))
+
+
+@nb.njit(cache=True)
+def nb_fit_suff_stats(x_bar, x_std, x_max):
+    # see https://doi.org/10.1016/j.jspi.2004.02.019 for details
     n = np.ceil(x_max ** (1.5) * x_std / (x_bar**0.5 * (x_max - x_bar) ** 0.5))
     p = x_bar / n
     return n, p
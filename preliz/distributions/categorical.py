@@ -38,6 +38,7 @@ class Categorical(Discrete):
     """
 
     parametrizations = [("p",), ("logit_p",)]
+    _suff_stats = ("counts",)
 
     def __init__(self, p=None, logit_p=None):
         super().__init__()
@@ -120,8 +121,25 @@ class Categorical(Discrete):
         return ptd_rvs(self.p, size=size, rng=random_state)
 
     def _fit_mle(self, sample):
+        sample = np.asarray(sample)
+        if np.all(sample >= 0) and np.all(sample == np.floor(sample)):
+            n_cat = len(self.p) if self.p is not None else int(np.max(sample)) + 1
+            counts = np.bincount(sample.astype(int), minlength=n_cat)
+            if len(counts) == n_cat:
+                self.support = (0, n_cat - 1)
+                self._update(counts / len(sample))
+                return
         optimize_ml(self, sample)
 
+    def _fit_suff_stats(self, stats):
+        counts = stats["counts"]
+        if self.p is not None:
+            if len(counts) > len(self.p):
+                raise ValueError("The sample has more categories than the distribution")
+            counts = np.pad(counts, (0, len(self.p) - len(counts)))
+        self.support = (0, len(counts) - 1)
+        self._update(counts / stats["n"])
+
 
 @pytensor_jit
 def ptd_pdf(x, p):
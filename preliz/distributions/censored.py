@@ -2,8 +2,10 @@ import numpy as np
 
 from preliz.distributions.distributions import DistributionTransformer
 from preliz.distributions.truncated import Truncated
+from preliz.internal import quadrature
 from preliz.internal.distribution_helper import all_not_none
-from preliz.internal.special import xlogx, xprody
+from preliz.internal.special import xlogx
+from preliz.internal.truncated_moments import censored_moments
 
 
 class Censored(DistributionTransformer):
@@ -83,15 +85,14 @@ class Censored(DistributionTransformer):
         self.lower, self.upper = self.support
         self.params_support = (*self.dist.params_support, self.dist.support, self.dist.support)
 
+    def _moments(self):
+        moments = censored_moments(self.dist, self.lower, self.upper)
+        if moments is None:
+            moments = quadrature.moments(self)
+        return moments
+
     def mean(self):
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        mean_trunc = Truncated(self.dist, self.lower, self.upper).mean()
-        return xprody(self.lower, p_low) + mean_trunc * p_int + xprody(self.upper, p_up)
+        return self._moments()[0]
 
     def mode(self):
         if self.kind == "discrete":
@@ -107,64 +108,16 @@ class Censored(DistributionTransformer):
         return np.clip(self.dist.median(), self.lower, self.upper)
 
     def var(self):
-        mean = self.mean()
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        trunc = Truncated(self.dist, self.lower, self.upper)
-        mean_trunc = trunc.mean()
-        var_trunc = trunc.var() + (mean_trunc - mean) ** 2
-        return (
-            xprody((self.lower - mean) ** 2, p_low)
-            + var_trunc * p_int
-            + xprody((self.upper - mean) ** 2, p_up)
-        )
+        return self._moments()[1]
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        mean = self.mean()
-        std = self.std()
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        trunc = Truncated(self.dist, self.lower, self.upper)
-        mean_trunc = trunc.mean()
-        std_trunc = trunc.std()
-
-        skew_trunc = trunc.skewness() + ((mean_trunc - mean) / std_trunc) ** 3
-        return (
-            xprody(((self.lower - mean) / std) ** 3, p_low)
-            + skew_trunc * p_int
-            + xprody(((self.upper - mean) / std) ** 3, p_up)
-        )
+        return self._moments()[2]
 
     def kurtosis(self):
-        mean = self.mean()
-        std = self.std()
-        if self.kind == "discrete":
-            p_low = self.dist.cdf(self.lower - 1)
-        else:
-            p_low = self.dist.cdf(self.lower)
-        p_up = 1 - self.dist.cdf(self.upper)
-        p_int = 1 - (p_low + p_up)
-        trunc = Truncated(self.dist, self.lower, self.upper)
-        mean_trunc = trunc.mean()
-        std_trunc = trunc.std()
-
-        kurt_trunc = trunc.kurtosis() + 3 + ((mean_trunc - mean) / std_trunc) ** 4
-        return (
-            xprody(((self.lower - mean) / std) ** 4, p_low)
-            + kurt_trunc * p_int
-            + xprody(((self.upper - mean) / std) ** 4, p_up)
-        ) - 3
+        return self._moments()[3]
 
     def rvs(self, size=None, random_state=None):
         return np.clip(self.dist.rvs(size, random_state), self.lower, self.upper)
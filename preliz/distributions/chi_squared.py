@@ -1,9 +1,11 @@
+import numba as nb
 import numpy as np
 from pytensor_distributions import chisquared as ptd_chisquared
 
 from preliz.distributions.distributions import Continuous
 from preliz.internal.distribution_helper import eps, pytensor_jit, pytensor_rng_jit
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.special import inv_digamma
 
 
 class ChiSquared(Continuous):
@@ -40,6 +42,8 @@ class ChiSquared(Continuous):
         Degrees of freedom (nu > 0).
     """
 
+    _suff_stats = ("log_moments",)
+
     def __init__(self, nu=None):
         super().__init__()
         self.nu = nu
@@ -115,7 +119,13 @@ class ChiSquared(Continuous):
         self._update(mean)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.all(sample > 0):
+            self._update(nb_fit_mle(sample))
+        else:
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        self._update(nb_fit_suff_stats(stats["mean_log"]))
 
 
 @pytensor_jit
@@ -201,3 +211,13 @@ def ptd_lmoment4(nu):
 @pytensor_rng_jit
 def ptd_rvs(nu, size, rng):
     return ptd_chisquared.rvs(nu, size=size, random_state=rng)
+
+
+@nb.njit(cache=True)
+def nb_fit_mle(sample):
+    return 2 * inv_digamma(np.mean(np.log(sample)) - np.log(2))
+
+
+@nb.vectorize(nopython=True, cache=True)
+def nb_fit_suff_stats(mean_log):
+    return 2 * inv_digamma(mean_log - np.log(2))
@@ -4,19 +4,12 @@ import warnings
 from copy import copy
 
 import numpy as np
-
-try:
-    from ipywidgets import interactive, widgets
-except ImportError:
-    pass
 from scipy import stats
 
 from preliz.distributions.beta import Beta
 from preliz.distributions.distributions_multivariate import Continuous
 from preliz.distributions.normal import Normal
 from preliz.internal.distribution_helper import all_not_none
-from preliz.internal.plot_helper import check_inside_notebook, get_slider
-from preliz.internal.plot_helper_multivariate import plot_dirichlet, plot_mvnormal
 
 eps = np.finfo(float).eps
 
@@ -144,6 +137,8 @@ class Dirichlet(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_dirichlet
+
         return plot_dirichlet(
             self,
             "pdf",
@@ -199,6 +194,8 @@ class Dirichlet(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_dirichlet
+
         return plot_dirichlet(
             self,
             "cdf",
@@ -250,6 +247,8 @@ class Dirichlet(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_dirichlet
+
         return plot_dirichlet(
             self,
             "ppf",
@@ -305,6 +304,8 @@ class Dirichlet(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_dirichlet
+
         return plot_dirichlet(
             self,
             "sf",
@@ -356,6 +357,8 @@ class Dirichlet(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_dirichlet
+
         return plot_dirichlet(
             self,
             "isf",
@@ -413,7 +416,12 @@ class Dirichlet(Continuous):
         figsize : tuple
             Size of the figure
         """
+        from preliz.internal.plot_helper import check_inside_notebook, get_slider
+        from preliz.internal.plot_helper_multivariate import plot_dirichlet
+
         check_inside_notebook()
+        from ipywidgets import interactive, widgets
+
         if kind != "pdf" and baseline:
             warnings.warn("baseline is only applicable to PDF plots")
 
@@ -636,6 +644,8 @@ class MvNormal(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_mvnormal
+
         return plot_mvnormal(
             self,
             "pdf",
@@ -691,6 +701,8 @@ class MvNormal(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_mvnormal
+
         return plot_mvnormal(
             self,
             "cdf",
@@ -742,6 +754,8 @@ class MvNormal(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_mvnormal
+
         return plot_mvnormal(
             self,
             "ppf",
@@ -797,6 +811,8 @@ class MvNormal(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_mvnormal
+
         return plot_mvnormal(
             self,
             "sf",
@@ -848,6 +864,8 @@ class MvNormal(Continuous):
         -------
         ax : matplotlib axis
         """
+        from preliz.internal.plot_helper_multivariate import plot_mvnormal
+
         return plot_mvnormal(
             self,
             "isf",
@@ -906,7 +924,12 @@ class MvNormal(Continuous):
         figsize : tuple
             Size of the figure
         """
+        from preliz.internal.plot_helper import check_inside_notebook, get_slider
+        from preliz.internal.plot_helper_multivariate import plot_mvnormal
+
         check_inside_notebook()
+        from ipywidgets import interactive, widgets
+
         if kind != "pdf" and baseline:
             warnings.warn("baseline is only applicable to PDF plots")
         args = dict(zip(self.param_names, self.params))
@@ -3,29 +3,23 @@
 import warnings
 from collections import namedtuple
 from copy import copy
+from functools import cache
+from inspect import signature
 
-try:
-    from ipywidgets import interactive
-except ImportError:
-    pass
 import numpy as np
 
 from preliz.internal.distribution_helper import (
+    cached_stat,
     init_vals,
     valid_distribution,
+    valid_params,
     valid_scalar_params,
 )
 from preliz.internal.optimization import find_hdi, find_mode
-from preliz.internal.plot_helper import (
-    check_inside_notebook,
-    get_slider,
-    plot_cdf,
-    plot_isf,
-    plot_pdfpmf,
-    plot_ppf,
-    plot_sf,
-)
 from preliz.internal.rcparams import rcParams
+from preliz.internal.streaming import summarize, update_stats
+
+CACHED_STATS = ["entropy", "mean", "median", "mode", "std", "var", "skewness", "kurtosis"]
 
 
 class Distribution:
@@ -35,10 +29,20 @@ class Distribution:
     Not intended for direct instantiation.
     """
 
+    # sufficient statistics used by partial_fit, see preliz.internal.streaming
+    _suff_stats = None
+
     def __init__(self):
         self.is_frozen = False
         self.opt = None
 
+    def __init_subclass__(cls, **kwargs):
+        """Memoize the summary statistics defined by each family, see `cached_stat`."""
+        super().__init_subclass__(**kwargs)
+        for name in CACHED_STATS:
+            if name in cls.__dict__:
+                setattr(cls, name, cached_stat(cls.__dict__[name]))
+
     def _get_name(self):
         """Return the display name for this distribution."""
         name = self.__class__.__name__
@@ -56,9 +60,7 @@ class Distribution:
             (
                 f"{n}={v:.3g}, "
                 if np.isscalar(v) or np.ndim(v) == 0
-                else f"{n}=["
-                + "".join(f"{vi:.3g}, " for vi in np.atleast_1d(v)).strip(", ")
-                + "], "
+                else f"{n}=[" + "".join(f"{vi:.3g}, " for vi in np.ravel(v)).strip(", ") + "], "
             )
             for n, v in zip(self.param_names, self.params)
         ).strip(", ")
@@ -175,7 +177,7 @@ class Distribution:
         if not isinstance(fmt, str):
             raise ValueError("Invalid format string.")
 
-        if valid_scalar_params(self):
+        if valid_params(self):
             name = self.__class__.__name__
             if name == "Truncated":
                 name = "Truncated" + self.dist.__class__.__name__
@@ -187,12 +189,12 @@ class Distribution:
                 )
 
             attr = namedtuple(name, ["mean", "median", "std", "lower", "upper"])
-            mean = float(f"{self.mean():{fmt}}")
-            median = float(f"{self.median():{fmt}}")
-            std = float(f"{self.std():{fmt}}")
+            mean = _format_values(self.mean(), fmt)
+            median = _format_values(self.median(), fmt)
+            std = _format_values(self.std(), fmt)
 
             if isinstance(interval, tuple | list | np.ndarray):
-                c_int = self.ppf(interval)
+                c_int = self.ppf(self._broadcast_quantiles(interval))
             elif interval == "hdi":
                 c_int = self.hdi(mass, fmt=fmt)
             elif interval == "eti":
@@ -202,8 +204,8 @@ class Distribution:
                 lower_tail = c_int[0]
                 upper_tail = c_int[1]
             else:
-                lower_tail = float(f"{c_int[0]:{fmt}}")
-                upper_tail = float(f"{c_int[1]:{fmt}}")
+                lower_tail = _format_values(c_int[0], fmt)
+                upper_tail = _format_values(c_int[1], fmt)
             return attr(mean, median, std, lower_tail, upper_tail)
         else:
             return None
@@ -434,14 +436,14 @@ class Distribution:
         if not isinstance(fmt, str):
             raise ValueError("Invalid format string.")
 
-        if valid_scalar_params(self):
-            lower_tail, upper_tail = self.ppf([(1 - mass) / 2, 1 - (1 - mass) / 2])
+        if valid_params(self):
+            lower_tail, upper_tail = self._eti(mass)
             if self.kind == "continuous" and fmt != "none":
-                lower_tail = float(f"{lower_tail:{fmt}}")
-                upper_tail = float(f"{upper_tail:{fmt}}")
+                lower_tail = _format_values(lower_tail, fmt)
+                upper_tail = _format_values(upper_tail, fmt)
             elif self.kind == "discrete":
-                lower_tail = int(lower_tail)
-                upper_tail = int(upper_tail)
+                lower_tail = _to_int(lower_tail)
+                upper_tail = _to_int(upper_tail)
 
             return (lower_tail, upper_tail)
         else:
@@ -470,15 +472,90 @@ class Distribution:
         if self.__class__.__name__ == "Mixture":
             warnings.warn("HDI may not be correct for multimodal distributions")
 
-        if valid_scalar_params(self):
-            lower_tail, upper_tail = find_hdi(self, mass)
+        if valid_params(self):
+            lower_tail, upper_tail = self._hdi(mass)
             if self.kind == "continuous" and fmt != "none":
-                lower_tail = float(f"{lower_tail:{fmt}}")
-                upper_tail = float(f"{upper_tail:{fmt}}")
+                lower_tail = _format_values(lower_tail, fmt)
+                upper_tail = _format_values(upper_tail, fmt)
             return (lower_tail, upper_tail)
         else:
             return None
 
+    @cached_stat
+    def _eti(self, mass):
+        lower_tail, upper_tail = self.ppf(
+            self._broadcast_quantiles([(1 - mass) / 2, 1 - (1 - mass) / 2])
+        )
+        return lower_tail, upper_tail
+
+    @cached_stat
+    def _hdi(self, mass):
+        if valid_scalar_params(self, raise_error=False) or self.kind == "continuous":
+            lower_tail, upper_tail = find_hdi(self, mass)
+        else:
+            lower_tail, upper_tail = np.moveaxis(
+                self._map_params(lambda dist: find_hdi(dist, mass)), -1, 0
+            )
+        return lower_tail, upper_tail
+
+    def partial_fit(self, chunk, weights=None):
+        """Accumulate the sufficient statistics of a chunk of the sample.
+
+        Use it to compute the maximum likelihood estimate of samples that do not fit in
+        memory, or that arrive in batches. The parameters are updated when calling
+        :meth:`finalize`, after all chunks have been passed. Memory usage does not depend on
+        the size of the sample.
+
+        Parameters
+        ----------
+        chunk : array-like
+            Observations, can be of any size.
+        weights : array-like, optional
+            Frequency weights of the observations, for example the number of times each value
+            was observed. Defaults to None, i.e. each observation counts once.
+
+        Returns
+        -------
+        The distribution, to allow chaining calls.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            dist = pz.Gamma()
+            for chunk in chunks:
+                dist.partial_fit(chunk)
+            dist.finalize()
+        """
+        if self._suff_stats is None:
+            raise NotImplementedError(
+                f"The {self.__class__.__name__} distribution does not support streaming fits"
+            )
+        self._stream_stats = update_stats(
+            getattr(self, "_stream_stats", None), chunk, self._suff_stats, weights
+        )
+        return self
+
+    def finalize(self):
+        """Update the parameters with the statistics accumulated by :meth:`partial_fit`.
+
+        The accumulated statistics are discarded, so the distribution can be fitted again.
+
+        Returns
+        -------
+        The distribution, to allow chaining calls.
+        """
+        stats = getattr(self, "_stream_stats", None)
+        if stats is None or stats["n"] == 0:
+            raise ValueError("No observations, call partial_fit before finalize")
+        self._stream_stats = None
+        self._fit_suff_stats(summarize(stats))
+        if not all(np.all(np.isfinite(param)) for param in self.params):
+            raise ValueError(
+                f"The sample is not compatible with the {self.__class__.__name__} distribution"
+            )
+        return self
+
     def to_pymc(self, name=None, **kwargs):
         """
         Convert the PreliZ distribution to a PyMC distribution.
@@ -605,6 +682,7 @@ class Distribution:
         else:
             return lower >= s_l and upper <= s_u
 
+    @cached_stat
     def _finite_endpoints(self, support):
         """
         Return finite endpoints even for unbounded distributions.
@@ -629,6 +707,7 @@ class Distribution:
 
         return lower_ep, upper_ep
 
+    @cached_stat
     def xvals(self, support, n_points=None):
         """
         Provide x values in the support of the distribution.
@@ -708,6 +787,8 @@ class Distribution:
             Additional keyword arguments passed to matplotlib plot function.
             For example, ``color``, ``alpha``, ``linewidth``, etc.
         """
+        from preliz.internal.plot_helper import plot_pdfpmf
+
         if valid_scalar_params(self, raise_error=False):
             return plot_pdfpmf(
                 self,
@@ -787,7 +868,9 @@ class Distribution:
             Additional keyword arguments passed to matplotlib plot function.
             For example, ``color``, ``alpha``, ``linewidth``, etc.
         """
-        if valid_scalar_params(self):
+        from preliz.internal.plot_helper import plot_cdf
+
+        if valid_scalar_params(self, raise_error=False):
             return plot_cdf(
                 self,
                 moments,
@@ -857,7 +940,9 @@ class Distribution:
             Size of the figure
         ax : matplotlib axes
         """
-        if valid_scalar_params(self):
+        from preliz.internal.plot_helper import plot_ppf
+
+        if valid_scalar_params(self, raise_error=False):
             return plot_ppf(
                 self, moments, pointinterval, interval, levels, legend, figsize, ax, kwargs
             )
@@ -924,7 +1009,9 @@ class Distribution:
             Additional keyword arguments passed to matplotlib plot function.
             For example, ``color``, ``alpha``, ``linewidth``, etc.
         """
-        if valid_scalar_params(self):
+        from preliz.internal.plot_helper import plot_sf
+
+        if valid_scalar_params(self, raise_error=False):
             return plot_sf(
                 self,
                 moments,
@@ -994,7 +1081,9 @@ class Distribution:
             Size of the figure
         ax : matplotlib axes
         """
-        if valid_scalar_params(self):
+        from preliz.internal.plot_helper import plot_isf
+
+        if valid_scalar_params(self, raise_error=False):
             return plot_isf(
                 self, moments, pointinterval, interval, levels, legend, figsize, ax, kwargs
             )
@@ -1052,6 +1141,8 @@ class Distribution:
         figsize : tuple
             Size of the figure
         """
+        from preliz.internal.plot_helper import check_inside_notebook, get_slider
+
         check_inside_notebook()
 
         if valid_scalar_params(self, check_frozen=False):
@@ -1131,16 +1222,72 @@ class Distribution:
             if xy_lim != "auto" and kind != "cdf":
                 ax.set_ylim(*ylim)
 
+        from ipywidgets import interactive
+
         return interactive(plot, **sliders)
 
+    def _free_params_setter(self, none_idx, fixed):
+        """Return a function setting the free parameters of the distribution from a vector.
+
+        Used in the inner loop of optimizers, the returned function is equivalent to
+        ``self._parametrization(**get_params(self, values, none_idx, fixed))``. When the current
+        parametrization is the one expected by ``_update``, it calls ``_update`` directly,
+        skipping the keyword arguments and the conversions between parametrizations.
+        """
+        names = tuple(self.param_names)
+        values = [None] * len(names)
+        fixed_idx = [idx for idx in range(len(names)) if idx not in none_idx]
+        for idx, value in zip(fixed_idx, fixed):
+            values[idx] = value
+
+        if names == _update_arg_names(type(self))[: len(names)]:
+
+            def set_params(free_values):
+                for idx, value in zip(none_idx, free_values):
+                    values[idx] = value
+                self._update(*values)
+
+        else:
+
+            def set_params(free_values):
+                for idx, value in zip(none_idx, free_values):
+                    values[idx] = value
+                self._parametrization(**dict(zip(names, values)))
+
+        return set_params
+
     def _unpack_distribution(self):
         params_dict = self.params_dict
         arrays = [np.atleast_1d(v) for v in params_dict.values()]
 
-        broadcasted = np.broadcast_arrays(*arrays)
+        broadcasted = [array.ravel() for array in np.broadcast_arrays(*arrays)]
 
         return [{k: v_i for k, v_i in zip(params_dict.keys(), vals)} for vals in zip(*broadcasted)]
 
+    def _params_shape(self):
+        """Broadcasted shape of the parameters, () for scalar parameters."""
+        if valid_scalar_params(self, raise_error=False):
+            return ()
+        return np.broadcast_shapes(*(np.shape(param) for param in self.params))
+
+    def _broadcast_quantiles(self, q):
+        """Reshape `q` so the results of ppf have shape ``(len(q), *self._params_shape())``."""
+        return np.reshape(q, (-1,) + (1,) * len(self._params_shape()))
+
+    def _map_params(self, func):
+        """Apply `func` to a scalar copy of the distribution for each set of parameters.
+
+        Used for methods without a vectorized implementation, the results have shape
+        ``(*self._params_shape(), ...)``.
+        """
+        values = []
+        for param_set in self._unpack_distribution():
+            other = copy(self)
+            other._parametrization(**param_set)
+            values.append(func(other))
+        values = np.array(values)
+        return values.reshape(self._params_shape() + values.shape[1:])
+
 
 class Continuous(Distribution):
     """Base class for continuous distributions."""
@@ -1150,7 +1297,9 @@ class Continuous(Distribution):
         self.kind = "continuous"
 
     def mode(self):
-        return find_mode(self)
+        if valid_scalar_params(self, raise_error=False):
+            return find_mode(self)
+        return self._map_params(find_mode)
 
 
 class Discrete(Distribution):
@@ -1169,6 +1318,35 @@ class DistributionTransformer(Distribution):
         if not isinstance(self.dist, list):
             self.kind = self.dist.kind
 
+    def ppf(self, q):
+        """Percent point function (inverse of cdf).
+
+        If rcParams["stats.ppf_table"] is True, the inverse of the cdf is tabulated once per
+        frozen distribution and evaluated by interpolation. This speeds-up ``rvs`` and repeated
+        calls to ``ppf``.
+
+        Parameters
+        ----------
+        q : array_like
+            Values on which to evaluate the inverse of the cdf
+        """
+        if rcParams["stats.ppf_table"]:
+            from preliz.internal.ppf_table import tabulated_ppf
+
+            return tabulated_ppf(self, q, self._ppf)
+        return self._ppf(q)
+
+    def _ppf(self, q):
+        raise NotImplementedError
+
+
+@cache
+def _update_arg_names(cls):
+    """Names of the arguments of ``cls._update``, empty for classes without it."""
+    if not hasattr(cls, "_update"):
+        return ()
+    return tuple(signature(cls._update).parameters)[1:]
+
 
 def _continuous_xvals(lower_ep, upper_ep, n_points):
     return np.linspace(lower_ep, upper_ep, n_points)
@@ -1191,6 +1369,20 @@ def _discrete_xvals(lower_ep, upper_ep, n_points):
     return x_vals
 
 
+def _format_values(values, fmt):
+    if np.ndim(values) == 0:
+        return float(f"{values:{fmt}}")
+    return np.array([float(f"{value:{fmt}}") for value in np.ravel(values)]).reshape(
+        np.shape(values)
+    )
+
+
+def _to_int(values):
+    if np.ndim(values) == 0:
+        return int(values)
+    return np.asarray(values).astype(int)
+
+
 def _format_support_value(value):
     if value == np.inf:
         return "inf"
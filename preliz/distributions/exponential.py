@@ -49,6 +49,7 @@ class Exponential(Continuous):
     """
 
     parametrizations = [("lam",), ("scale",)]
+    _suff_stats = ("moments",)
 
     def __init__(self, lam=None, scale=None):
         super().__init__()
@@ -142,6 +143,9 @@ class Exponential(Continuous):
         mean = np.mean(sample)
         self._update(1 / mean)
 
+    def _fit_suff_stats(self, stats):
+        self._update(1 / stats["mean"])
+
 
 @pytensor_jit
 def ptd_pdf(x, lam):
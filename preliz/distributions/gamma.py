@@ -1,3 +1,4 @@
+import numba as nb
 import numpy as np
 from pytensor_distributions import gamma as ptd_gamma
 
@@ -10,6 +11,7 @@ from preliz.internal.distribution_helper import (
     pytensor_rng_jit,
 )
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.special import digamma, trigamma
 
 
 class Gamma(Continuous):
@@ -66,6 +68,7 @@ class Gamma(Continuous):
     """
 
     parametrizations = [("alpha", "beta"), ("mu", "sigma")]
+    _suff_stats = ("moments", "log_moments")
 
     def __init__(self, alpha=None, beta=None, mu=None, sigma=None):
         super().__init__()
@@ -172,7 +175,13 @@ class Gamma(Continuous):
         self._update(alpha, beta)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.all(sample > 0):
+            self._update(*nb_fit_mle(sample))
+        else:
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        self._update(*nb_fit_suff_stats_vec(stats["mean"], stats["mean_log"]))
 
 
 @pytensor_jit
@@ -258,3 +267,31 @@ def ptd_lmoment4(alpha, beta):
 @pytensor_rng_jit
 def ptd_rvs(alpha, beta, size, rng):
     return ptd_gamma.rvs(alpha, beta, size=size, random_state=rng)
+
+
+@nb.njit(cache=True)
+def nb_fit_mle(sample):
+    return nb_fit_suff_stats(np.mean(sample), np.mean(np.log(sample)))
+
+
+@nb.njit(cache=True)
+def nb_fit_suff_stats(mean, mean_log, tol=1e-10, max_iter=100):
+    """Minka's fixed point iteration, the sufficient statistics are the mean and mean log."""
+    log_ratio = np.log(mean) - mean_log
+    alpha = (3 - log_ratio + ((log_ratio - 3) ** 2 + 24 * log_ratio) ** 0.5) / (12 * log_ratio)
+    for _ in range(max_iter):
+        step = (mean_log - np.log(mean) + np.log(alpha) - digamma(alpha)) / (
+            alpha**2 * (1 / alpha - trigamma(alpha))
+        )
+        new_alpha = 1 / (1 / alpha + step)
+        if abs(new_alpha - alpha) <= tol * alpha:
+            alpha = new_alpha
+            break
+        alpha = new_alpha
+    return alpha, alpha / mean
+
+
+@nb.guvectorize(["void(float64, float64, float64[:], float64[:])"], "(),()->(),()", cache=True)
+def nb_fit_suff_stats_vec(mean, mean_log, alpha, beta):
+    """Elementwise version of :func:`nb_fit_suff_stats`, for fits of several rows at once."""
+    alpha[0], beta[0] = nb_fit_suff_stats(mean, mean_log)
@@ -37,6 +37,8 @@ class Geometric(Discrete):
         Probability of success on an individual trial (0 < p <= 1).
     """
 
+    _suff_stats = ("moments",)
+
     def __init__(self, p=None):
         super().__init__()
         self.support = (1, np.inf)
@@ -114,6 +116,9 @@ class Geometric(Discrete):
         p = 1 / np.mean(sample)
         self._update(p)
 
+    def _fit_suff_stats(self, stats):
+        self._update(1 / stats["mean"])
+
 
 @pytensor_jit
 def ptd_pdf(x, p):
@@ -57,6 +57,7 @@ class HalfNormal(Continuous):
     """
 
     parametrizations = [("sigma",), ("tau",)]
+    _suff_stats = ("moments",)
 
     def __init__(self, sigma=None, tau=None):
         super().__init__()
@@ -148,6 +149,9 @@ class HalfNormal(Continuous):
     def _fit_mle(self, sample):
         self._update(np.mean(sample**2) ** 0.5)
 
+    def _fit_suff_stats(self, stats):
+        self._update((stats["var"] + stats["mean"] ** 2) ** 0.5)
+
 
 @pytensor_jit
 def ptd_pdf(x, sigma):
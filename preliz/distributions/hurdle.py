@@ -1,7 +1,9 @@
 import numpy as np
 
 from preliz.distributions.distributions import DistributionTransformer
+from preliz.internal import quadrature
 from preliz.internal.distribution_helper import all_not_none, eps
+from preliz.internal.special import xlogx
 
 
 class Hurdle(DistributionTransformer):
@@ -75,12 +77,7 @@ class Hurdle(DistributionTransformer):
         self.params_support = (*self.dist.params_support, (0, 1))
 
     def mean(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        if self.kind == "discrete":
-            return np.sum(x_values * pdf)
-        else:
-            return np.trapezoid(x_values * pdf, x_values)
+        return quadrature.moments(self)[0]
 
     def mode(self):
         if self.kind == "discrete":
@@ -96,12 +93,7 @@ class Hurdle(DistributionTransformer):
         return self.ppf(0.5)
 
     def var(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        if self.kind == "discrete":
-            return np.sum((x_values - self.mean()) ** 2 * pdf)
-        else:
-            return np.trapezoid((x_values - self.mean()) ** 2 * pdf, x_values)
+        return quadrature.moments(self)[1]
 
     def std(self):
         return self.var() ** 0.5
@@ -132,7 +124,7 @@ class Hurdle(DistributionTransformer):
                 1 - self.psi * (1 - self.dist.cdf(x)) / (1 - self.dist.cdf(eps)),
             )
 
-    def ppf(self, q):
+    def _ppf(self, q):
         if self.kind == "discrete":
             lower = 0
         else:
@@ -162,12 +154,11 @@ class Hurdle(DistributionTransformer):
         return pdf_values
 
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        if self.kind == "discrete":
-            return -np.sum(np.exp(logpdf) * logpdf)
-        else:
-            return -np.trapezoid(np.exp(logpdf) * logpdf, x_values)
+        entropy = quadrature.entropy(self)
+        if self.kind == "continuous":
+            # the point mass at zero is not part of the differential entropy
+            entropy += xlogx(1 - self.psi)
+        return entropy
 
     def _fit_moments(self, mean, sigma):
         self.dist._fit_moments(mean, sigma)
@@ -65,6 +65,8 @@ class HyperGeometric(Discrete):
         self.k = np.int64(k)
         self.n = np.int64(n)
         self.params = (self.N, self.k, self.n)
+        # the bounds of k and n depend on N
+        self.params_support = ((eps, np.inf), (eps, self.N), (eps, self.N))
         self.support = (max(0, n - N + k), min(k, n))
         self.is_frozen = True
 
@@ -3,6 +3,8 @@ import numpy as np
 from pytensor_distributions import inversegamma as ptd_inversegamma
 
 from preliz.distributions.distributions import Continuous
+from preliz.distributions.gamma import nb_fit_mle as nb_fit_gamma
+from preliz.distributions.gamma import nb_fit_suff_stats_vec as nb_fit_gamma_suff_stats
 from preliz.internal.distribution_helper import (
     all_not_none,
     any_not_none,
@@ -64,6 +66,7 @@ class InverseGamma(Continuous):
     """
 
     parametrizations = [("alpha", "beta"), ("mu", "sigma")]
+    _suff_stats = ("inv_moments", "log_moments")
 
     def __init__(self, alpha=None, beta=None, mu=None, sigma=None):
         super().__init__()
@@ -161,7 +164,13 @@ class InverseGamma(Continuous):
         self._update(alpha, beta)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.all(sample > 0):
+            self._update(*nb_fit_gamma(1 / sample))
+        else:
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        self._update(*nb_fit_gamma_suff_stats(stats["mean_inv"], -stats["mean_log"]))
 
 
 @pytensor_jit
@@ -50,6 +50,8 @@ class LogNormal(Continuous):
         Standard deviation. (sigma > 0)).
     """
 
+    _suff_stats = ("log_moments",)
+
     def __init__(self, mu=None, sigma=None):
         super().__init__()
         self.support = (0, np.inf)
@@ -131,6 +133,9 @@ class LogNormal(Continuous):
         mu, sigma = mean_and_std(np.log(sample))
         self._update(mu, sigma)
 
+    def _fit_suff_stats(self, stats):
+        self._update(stats["mean_log"], stats["var_log"] ** 0.5)
+
 
 @pytensor_jit
 def ptd_pdf(x, mu, sigma):
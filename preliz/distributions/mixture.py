@@ -2,6 +2,7 @@ import numpy as np
 from scipy.special import logsumexp
 
 from preliz.distributions.distributions import DistributionTransformer
+from preliz.internal import quadrature
 from preliz.internal.distribution_helper import all_not_none, num_kurtosis, num_skewness
 from preliz.internal.optimization import find_ppf
 
@@ -84,7 +85,7 @@ class Mixture(DistributionTransformer):
             [dist.cdf(x) * weight for dist, weight in zip(self.dist, self.weights)], axis=0
         )
 
-    def ppf(self, q):
+    def _ppf(self, q):
         return find_ppf(self, q)
 
     def logpdf(self, x):
@@ -94,15 +95,7 @@ class Mixture(DistributionTransformer):
         return logsumexp(log_terms, axis=0)
 
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            weighted_logpdf = np.exp(logpdf) * logpdf
-        weighted_logpdf = np.where(np.isfinite(weighted_logpdf), weighted_logpdf, 0.0)
-        if self.kind == "discrete":
-            return -np.sum(weighted_logpdf)
-        else:
-            return -np.trapezoid(weighted_logpdf, x_values)
+        return quadrature.entropy(self)
 
     def mean(self):
         return np.sum(
@@ -1,3 +1,4 @@
+import numba as nb
 import numpy as np
 from pytensor_distributions import negativebinomial as ptd_negativebinomial
 
@@ -73,6 +74,7 @@ class NegativeBinomial(Discrete):
     """
 
     parametrizations = [("mu", "alpha"), ("p", "n")]
+    _suff_stats = ("counts",)
 
     def __init__(self, mu=None, alpha=None, p=None, n=None):
         super().__init__()
@@ -174,7 +176,18 @@ class NegativeBinomial(Discrete):
         optimize_mean_sigma(self, mean, sigma)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.all(sample >= 0) and np.all(sample == np.floor(sample)) and np.mean(sample) > 0:
+            self._update(*nb_fit_mle(sample))
+        else:
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        counts = stats["counts"]
+        if counts.ndim == 2:
+            # one row of counts per row of the sample
+            self._update(*np.transpose([nb_fit_counts(row) for row in counts]))
+        else:
+            self._update(*nb_fit_counts(counts))
 
 
 @pytensor_jit
@@ -260,3 +273,36 @@ def ptd_lmoment4(n, p):
 @pytensor_rng_jit
 def ptd_rvs(n, p, size, rng):
     return ptd_negativebinomial.rvs(n, p, size=size, random_state=rng)
+
+
+@nb.njit(cache=True)
+def nb_fit_mle(sample):
+    return nb_fit_counts(np.bincount(sample.astype(np.int64)))
+
+
+@nb.njit(cache=True)
+def nb_fit_counts(counts, lower=1e-8, upper=1e8):
+    """Maximum likelihood estimate of mu and alpha, from the counts of each value.
+
+    The estimate of mu is the mean, alpha is the root of the profile score
+    ``sum_j T_j / (alpha + j) + N * log(alpha / (alpha + mu))``, where ``T_j`` is the number of
+    observations larger than ``j``. The cost of each evaluation depends on the largest
+    observation, not on the size of the sample.
+    """
+    n_obs = np.sum(counts)
+    mu = np.sum(counts * np.arange(len(counts))) / n_obs
+    tail_counts = n_obs - np.cumsum(counts)[:-1]
+    j_vals = np.arange(len(tail_counts))
+
+    log_lower, log_upper = np.log(lower), np.log(upper)
+    # without overdispersion the likelihood increases with alpha
+    if np.sum(tail_counts / (upper + j_vals)) + n_obs * np.log(upper / (upper + mu)) >= 0:
+        return mu, upper
+    for _ in range(80):
+        log_mid = (log_lower + log_upper) / 2
+        alpha = np.exp(log_mid)
+        if np.sum(tail_counts / (alpha + j_vals)) + n_obs * np.log(alpha / (alpha + mu)) > 0:
+            log_lower = log_mid
+        else:
+            log_upper = log_mid
+    return mu, np.exp((log_lower + log_upper) / 2)
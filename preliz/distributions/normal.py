@@ -62,6 +62,7 @@ class Normal(Continuous):
     """
 
     parametrizations = [("mu", "sigma"), ("mu", "tau")]
+    _suff_stats = ("moments",)
 
     def __init__(self, mu=None, sigma=None, tau=None):
         super().__init__()
@@ -106,6 +107,9 @@ class Normal(Continuous):
     def _fit_mle(self, sample):
         self._update(*mean_and_std(sample))
 
+    def _fit_suff_stats(self, stats):
+        self._update(stats["mean"], stats["var"] ** 0.5)
+
     def pdf(self, x):
         return ptd_pdf(x, self.mu, self.sigma)
 
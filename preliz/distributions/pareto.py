@@ -1,3 +1,4 @@
+import numba as nb
 import numpy as np
 from pytensor_distributions import pareto as ptd_pareto
 
@@ -41,6 +42,8 @@ class Pareto(Continuous):
         Scale parameter (m > 0).
     """
 
+    _suff_stats = ("log_moments", "min")
+
     def __init__(self, alpha=None, m=None):
         super().__init__()
         self.support = (0, np.inf)
@@ -120,7 +123,14 @@ class Pareto(Continuous):
         self._update(alpha, m)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.all(sample > 0):
+            self._update(*nb_fit_mle(sample))
+        else:
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        m = stats["min"]
+        self._update(1 / (stats["mean_log"] - np.log(m)), m)
 
 
 @pytensor_jit
@@ -206,3 +216,10 @@ def ptd_lmoment4(alpha, m):
 @pytensor_rng_jit
 def ptd_rvs(alpha, m, size, rng):
     return ptd_pareto.rvs(alpha, m, size=size, random_state=rng)
+
+
+@nb.njit(cache=True)
+def nb_fit_mle(sample):
+    m = np.min(sample)
+    alpha = len(sample) / np.sum(np.log(sample / m))
+    return alpha, m
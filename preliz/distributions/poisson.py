@@ -42,6 +42,8 @@ class Poisson(Discrete):
     binomial distribution.
     """
 
+    _suff_stats = ("moments",)
+
     def __init__(self, mu=None):
         super().__init__()
         self.support = (0, np.inf)
@@ -118,6 +120,9 @@ class Poisson(Discrete):
     def _fit_mle(self, sample):
         self._update(np.mean(sample))
 
+    def _fit_suff_stats(self, stats):
+        self._update(stats["mean"])
+
 
 @pytensor_jit
 def ptd_pdf(x, mu):
@@ -1,3 +1,4 @@
+import numba as nb
 import numpy as np
 from pytensor_distributions import studentt as ptd_studentt
 
@@ -11,6 +12,7 @@ from preliz.internal.distribution_helper import (
     to_precision,
 )
 from preliz.internal.optimization import optimize_ml
+from preliz.internal.special import digamma
 
 
 class StudentT(Continuous):
@@ -175,7 +177,10 @@ class StudentT(Continuous):
         self._update(nu, mean, sigma)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.std(sample) > 0:
+            self._update(*nb_fit_mle(sample))
+        else:
+            optimize_ml(self, sample)
 
 
 @pytensor_jit
@@ -261,3 +266,47 @@ def ptd_lmoment4(nu, mu, sigma):
 @pytensor_rng_jit
 def ptd_rvs(nu, mu, sigma, size, rng):
     return ptd_studentt.rvs(nu, mu, sigma, size=size, random_state=rng)
+
+
+@nb.njit(cache=True)
+def _solve_nu(const, lower=1e-2, upper=1e6):
+    """Solve ``log(nu / 2) - digamma(nu / 2) + const = 0`` by bisection on ``log(nu)``."""
+    log_lower, log_upper = np.log(lower), np.log(upper)
+    if np.log(upper / 2) - digamma(upper / 2) + const >= 0:
+        return upper
+    for _ in range(60):
+        log_mid = (log_lower + log_upper) / 2
+        nu = np.exp(log_mid)
+        if np.log(nu / 2) - digamma(nu / 2) + const > 0:
+            log_lower = log_mid
+        else:
+            log_upper = log_mid
+    return np.exp((log_lower + log_upper) / 2)
+
+
+@nb.njit(cache=True)
+def nb_fit_mle(sample, tol=1e-8, max_iter=1000):
+    """ECME algorithm of Liu and Rubin (1995), the weights are updated at each iteration."""
+    mu = np.median(sample)
+    sigma = np.median(np.abs(sample - mu)) * 1.4826
+    if sigma == 0:
+        sigma = np.std(sample)
+    nu = 5.0
+    for _ in range(max_iter):
+        z_sq = ((sample - mu) / sigma) ** 2
+        weights = (nu + 1) / (nu + z_sq)
+        new_mu = np.sum(weights * sample) / np.sum(weights)
+        new_sigma = (np.sum(weights * (sample - new_mu) ** 2) / len(sample)) ** 0.5
+        const = (
+            1 + np.mean(np.log(weights) - weights) + digamma((nu + 1) / 2) - np.log((nu + 1) / 2)
+        )
+        new_nu = _solve_nu(const)
+        converged = (
+            abs(new_mu - mu) <= tol * new_sigma
+            and abs(new_sigma - sigma) <= tol * new_sigma
+            and abs(new_nu - nu) <= tol * new_nu
+        )
+        mu, sigma, nu = new_mu, new_sigma, new_nu
+        if converged:
+            break
+    return nu, mu, sigma
@@ -50,6 +50,8 @@ class Triangular(Continuous):
         Upper limit.
     """
 
+    _suff_stats = ("moments", "min", "max")
+
     def __init__(self, lower=None, c=None, upper=None):
         super().__init__()
         self.support = (-np.inf, np.inf)
@@ -138,6 +140,11 @@ class Triangular(Continuous):
         middle = (np.mean(sample) * 3) - lower - upper
         self._update(lower, middle, upper)
 
+    def _fit_suff_stats(self, stats):
+        lower = stats["min"]
+        upper = stats["max"]
+        self._update(lower, stats["mean"] * 3 - lower - upper, upper)
+
 
 @pytensor_jit
 def ptd_pdf(x, lower, c, upper):
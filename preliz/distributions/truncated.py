@@ -1,7 +1,9 @@
 import numpy as np
 
 from preliz.distributions.distributions import DistributionTransformer
-from preliz.internal.distribution_helper import all_not_none, num_kurtosis, num_skewness
+from preliz.internal import quadrature
+from preliz.internal.distribution_helper import all_not_none
+from preliz.internal.truncated_moments import truncated_moments
 
 
 class Truncated(DistributionTransformer):
@@ -79,13 +81,14 @@ class Truncated(DistributionTransformer):
         )
         self.params_support = (*self.dist.params_support, self.dist.support, self.dist.support)
 
+    def _moments(self):
+        moments = truncated_moments(self.dist, self.lower, self.upper)
+        if moments is None:
+            moments = quadrature.moments(self)
+        return moments
+
     def mean(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        if self.kind == "discrete":
-            return np.sum(x_values * pdf)
-        else:
-            return np.trapezoid(x_values * pdf, x_values)
+        return self._moments()[0]
 
     def mode(self):
         if self.kind == "discrete":
@@ -101,21 +104,16 @@ class Truncated(DistributionTransformer):
         return self.ppf(0.5)
 
     def var(self):
-        x_values = self.xvals("full")
-        pdf = self.pdf(x_values)
-        if self.kind == "discrete":
-            return np.sum((x_values - self.mean()) ** 2 * pdf)
-        else:
-            return np.trapezoid((x_values - self.mean()) ** 2 * pdf, x_values)
+        return self._moments()[1]
 
     def std(self):
         return self.var() ** 0.5
 
     def skewness(self):
-        return num_skewness(self)
+        return self._moments()[2]
 
     def kurtosis(self):
-        return num_kurtosis(self)
+        return self._moments()[3]
 
     def rvs(self, size=None, random_state=None):
         random_state = np.random.default_rng(random_state)
@@ -131,7 +129,7 @@ class Truncated(DistributionTransformer):
         vals = (self.dist.cdf(x) - lcdf) / (self.dist.cdf(self.upper) - lcdf)
         return np.where(x < lower, 0, np.where(x > self.upper, 1, vals))
 
-    def ppf(self, q):
+    def _ppf(self, q):
         q = np.asarray(q)
         lower = adjust_lower(self.kind, self.lower)
         lcdf = self.dist.cdf(lower)
@@ -145,12 +143,7 @@ class Truncated(DistributionTransformer):
         return np.where((x < self.lower) | (x > self.upper), -np.inf, vals)
 
     def entropy(self):
-        x_values = self.xvals("restricted")
-        logpdf = self.logpdf(x_values)
-        if self.kind == "discrete":
-            return -np.sum(np.exp(logpdf) * logpdf)
-        else:
-            return -np.trapezoid(np.exp(logpdf) * logpdf, x_values)
+        return quadrature.entropy(self)
 
     def _fit_moments(self, mean, sigma):
         self.dist._fit_moments(mean, sigma)
@@ -39,6 +39,8 @@ class Uniform(Continuous):
         Upper limit (upper > lower).
     """
 
+    _suff_stats = ("min", "max")
+
     def __init__(self, lower=None, upper=None):
         super().__init__()
         self._parametrization(lower, upper)
@@ -130,6 +132,9 @@ class Uniform(Continuous):
         upper = np.max(sample)
         self._update(lower, upper)
 
+    def _fit_suff_stats(self, stats):
+        self._update(stats["min"], stats["max"])
+
 
 @pytensor_jit
 def ptd_pdf(x, lower, upper):
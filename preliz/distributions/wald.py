@@ -57,6 +57,7 @@ class Wald(Continuous):
     """
 
     parametrizations = [("mu", "lam"), ("mu", "phi"), ("lam", "phi")]
+    _suff_stats = ("moments", "inv_moments")
 
     def __init__(self, mu=None, lam=None, phi=None):
         super().__init__()
@@ -170,7 +171,15 @@ class Wald(Continuous):
         self._update(mean, lam)
 
     def _fit_mle(self, sample):
-        optimize_ml(self, sample)
+        if np.all(sample > 0):
+            mu = np.mean(sample)
+            self._update(mu, 1 / (np.mean(1 / sample) - 1 / mu))
+        else:
+            optimize_ml(self, sample)
+
+    def _fit_suff_stats(self, stats):
+        mu = stats["mean"]
+        self._update(mu, 1 / (stats["mean_inv"] - 1 / mu))
 
 
 @pytensor_jit
@@ -1,3 +1,4 @@
+import numba as nb
 import numpy as np
 from pytensor_distributions import weibull as ptd_weibull
 
@@ -124,9 +125,12 @@ class Weibull(Continuous):
         self._update(alpha, beta)
 
     def _fit_mle(self, sample):
-        mean, std = mean_and_std(sample)
-        self._fit_moments(mean, std)
-        optimize_ml(self, sample)
+        if np.all(sample > 0):
+            self._update(*nb_fit_mle(sample))
+        else:
+            mean, std = mean_and_std(sample)
+            self._fit_moments(mean, std)
+            optimize_ml(self, sample)
 
 
 @pytensor_jit
@@ -212,3 +216,27 @@ def ptd_lmoment4(alpha, beta):
 @pytensor_rng_jit
 def ptd_rvs(alpha, beta, size, rng):
     return ptd_weibull.rvs(alpha, beta, size=size, random_state=rng)
+
+
+@nb.njit(cache=True)
+def nb_fit_mle(sample, tol=1e-10, max_iter=100):
+    """Newton's method on the profile likelihood of the shape."""
+    # scale the sample to avoid overflows when computing x**alpha
+    x_max = np.max(sample)
+    log_x = np.log(sample / x_max)
+    mean_log = np.mean(log_x)
+    std_log = np.std(log_x)
+    alpha = 1.2 / std_log if std_log > 0 else 1.0
+    for _ in range(max_iter):
+        x_alpha = np.exp(alpha * log_x)
+        sum_0 = np.sum(x_alpha)
+        ratio_1 = np.sum(x_alpha * log_x) / sum_0
+        ratio_2 = np.sum(x_alpha * log_x**2) / sum_0
+        step = (ratio_1 - 1 / alpha - mean_log) / (ratio_2 - ratio_1**2 + 1 / alpha**2)
+        while step >= alpha:
+            step /= 2
+        alpha -= step
+        if abs(step) <= tol * alpha:
+            break
+    beta = x_max * np.mean(np.exp(alpha * log_x)) ** (1 / alpha)
+    return alpha, beta
@@ -0,0 +1,172 @@
+"""Compiled derivatives of the objectives used by the optimizers.
+
+The methods of most distributions are defined by pytensor graphs (the ``ptd_*`` functions of each
+module), so instead of approximating derivatives with finite differences the optimizers can use
+the exact gradient with respect to the free parameters. Each graph is differentiated and compiled
+once per distribution, method and set of free parameters, and stored in the on-disk cache like
+any other compiled function.
+
+The functions in this module return None when a derivative is not available, for example for
+modifiers like Truncated, for methods computed numerically, or when the parameters being
+optimized are not the ones used by the ``ptd_*`` functions (e.g. a Gamma parametrized in terms of
+mu and sigma). Optimizers then fall back to finite differences.
+"""
+
+import sys
+from inspect import signature
+
+import numpy as np
+from pytensor.gradient import grad
+
+from preliz.internal.distribution_helper import pytensor_jit
+from preliz.internal.streaming import ChunkedSample
+
+_GRADIENTS = {}
+
+
+def stat_gradient(dist, method, none_idx):
+    """Differentiate a statistic, like ``entropy`` or ``mean``.
+
+    Returns
+    -------
+    callable or None
+        Function without arguments returning the value of the statistic and its gradient
+        with respect to the free parameters, evaluated at the current parameters of `dist`.
+    """
+    compiled = _compiled_gradient(dist, method, none_idx, "stat")
+    if compiled is None:
+        return None
+
+    def value_and_grad():
+        value, *grads = compiled(*_param_values(dist))
+        return value, np.array(grads)
+
+    return _probe(dist, method, none_idx, "stat", value_and_grad)
+
+
+def x_jacobian(dist, method, none_idx, x_vals):
+    """Differentiate a function evaluated at `x_vals`, like ``cdf`` or ``pdf``.
+
+    Returns
+    -------
+    callable or None
+        Function without arguments returning the values of ``method(x_vals)`` and their
+        Jacobian, with shape ``(len(x_vals), len(none_idx))``, evaluated at the current
+        parameters of `dist`.
+    """
+    compiled = _compiled_gradient(dist, method, none_idx, "x")
+    if compiled is None:
+        return None
+    x_vals = np.asarray(x_vals)
+
+    def value_and_jac():
+        # free parameters are broadcasted to the shape of x_vals, so the gradient of the sum
+        # with respect to each of them holds the derivatives of each element
+        params = [
+            np.full(x_vals.shape, value) if idx in none_idx else value
+            for idx, value in enumerate(_param_values(dist))
+        ]
+        values, *grads = compiled(x_vals, *params)
+        return values, np.stack(grads, axis=-1)
+
+    return _probe(dist, method, none_idx, "x", value_and_jac)
+
+
+def loglik_gradient(dist, none_idx, sample, weights=None):
+    """Differentiate the log-likelihood of `sample`, optionally with frequency `weights`.
+
+    Returns
+    -------
+    callable or None
+        Function without arguments returning the sum of ``logpdf(sample)`` and its gradient
+        with respect to the free parameters, evaluated at the current parameters of `dist`.
+        For a :class:`~preliz.ChunkedSample` the sums are accumulated
+        chunk by chunk.
+    """
+    kind = "sum" if weights is None else "weighted_sum"
+    compiled = _compiled_gradient(dist, "logpdf", none_idx, kind)
+    if compiled is None:
+        return None
+    data = () if weights is None else (np.asarray(weights, dtype=float),)
+
+    def chunk_value_and_grad(chunk):
+        value, *grads = compiled(chunk, *data, *_param_values(dist))
+        return np.array([value, *grads])
+
+    if isinstance(sample, ChunkedSample):
+
+        def value_and_grad():
+            value, *grads = sample.reduce(chunk_value_and_grad)
+            return value, np.array(grads)
+
+    else:
+        sample = np.asarray(sample)
+
+        def value_and_grad():
+            value, *grads = chunk_value_and_grad(sample)
+            return value, np.array(grads)
+
+    return _probe(dist, "logpdf", none_idx, kind, value_and_grad)
+
+
+def _param_values(dist):
+    return [np.asarray(value, dtype=float) for value in dist.params]
+
+
+def _probe(dist, method, none_idx, kind, func):
+    """Evaluate `func` once, discarding derivatives that can not be compiled or evaluated."""
+    try:
+        _, grads = func()
+    except Exception:  # the graph can not be differentiated, do not try again
+        _GRADIENTS[_gradient_key(dist, method, none_idx, kind)] = None
+        return None
+    if not np.all(np.isfinite(grads)):
+        return None
+    return func
+
+
+def _gradient_key(dist, method, none_idx, kind):
+    return (type(dist), tuple(dist.param_names), method, tuple(none_idx), kind)
+
+
+def _compiled_gradient(dist, method, none_idx, kind):
+    key = _gradient_key(dist, method, none_idx, kind)
+    if key not in _GRADIENTS:
+        _GRADIENTS[key] = _build_gradient(dist, method, none_idx, kind)
+    return _GRADIENTS[key]
+
+
+def _build_gradient(dist, method, none_idx, kind):
+    module = sys.modules[type(dist).__module__]
+    builder = getattr(getattr(module, f"ptd_{method}", None), "__wrapped__", None)
+    if builder is None:
+        return None
+
+    arg_names = tuple(signature(builder).parameters)
+    n_x = 0 if kind == "stat" else 1
+    if arg_names[n_x:] != tuple(dist.param_names):
+        return None
+    # the weights are passed after the values
+    n_data = n_x + (kind == "weighted_sum")
+
+    def gradient(*args):
+        params = list(args[n_data:])
+        out = builder(*args[:n_x], *params)
+        if kind == "stat":
+            total = out
+        elif kind == "weighted_sum":
+            total = (out * args[1]).sum()
+        else:
+            total = out.sum()
+        grads = grad(
+            total,
+            [params[idx] for idx in none_idx],
+            disconnected_inputs="ignore",
+            return_disconnected="zero",
+        )
+        return [out if kind in ("stat", "x") else total, *grads]
+
+    # the compilation cache is keyed on the name of the function
+    gradient.__module__ = builder.__module__
+    gradient.__qualname__ = f"{builder.__qualname__}.{kind}_grad{tuple(none_idx)}"
+    return pytensor_jit(gradient)
@@ -0,0 +1,161 @@
+"""Persistent on-disk cache for compiled PyTensor functions.
+
+Compiled functions are pickled together with their rewritten graph, so loading them skips the
+graph rewrites and most of the NUMBA compilation. Entries are stored in a directory per
+PreliZ/PyTensor/PyTensor-distributions/Numba versions, keyed by the source of the function that
+builds the graph, and evicted, least recently used first, when the total size of
+the cache exceeds ``rcParams["compile.cache_max_mb"]``.
+
+The cache is disabled by default, use ``rcParams["compile.cache"] = True`` to enable it.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from sys import modules
+
+from preliz.internal.rcparams import rcParams
+
+
+def get_cache_dir():
+    """Return the root directory of the cache.
+
+    The location is ``rcParams["compile.cache_dir"]`` if set, otherwise
+    ``$XDG_CACHE_HOME/preliz`` or ``$HOME/.cache/preliz``.
+    """
+    cache_dir = rcParams["compile.cache_dir"]
+    if cache_dir is None:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache")), "preliz")
+    return Path(cache_dir)
+
+
+def _versions_tag():
+    import numba
+    import pytensor
+    import pytensor_distributions
+
+    preliz_version = getattr(modules.get("preliz"), "__version__", "unknown")
+    ptd_version = getattr(pytensor_distributions, "__version__", None)
+    if ptd_version is None:
+        try:
+            ptd_version = metadata.version("pytensor_distributions")
+        except metadata.PackageNotFoundError:
+            ptd_version = "unknown"
+    return (
+        f"preliz-{preliz_version}_pytensor-{pytensor.__version__}"
+        f"_ptd-{ptd_version}_numba-{numba.__version__}"
+    )
+
+
+def _source(func):
+    """Source of `func`, so editing a graph builder in a development install is a new key."""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        code = getattr(func, "__code__", None)
+        return repr((code.co_code, code.co_consts)) if code is not None else ""
+
+
+def cache_key(func, signature, compile_kwargs):
+    """Hash a decorated function and its source, its input signature and compilation arguments."""
+    raw = repr(
+        (
+            func.__module__,
+            func.__qualname__,
+            _source(func),
+            signature,
+            sorted((key, str(value)) for key, value in compile_kwargs.items()),
+        )
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _entry_path(key):
+    return get_cache_dir() / _versions_tag() / f"{key}.pkl"
+
+
+def load(key):
+    """Return the compiled function stored under `key` or None if not available."""
+    if not rcParams["compile.cache"]:
+        return None
+
+    path = _entry_path(key)
+    try:
+        with open(path, "rb") as fh:
+            compiled_func = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception:  # corrupted or incompatible entry, recompile
+        path.unlink(missing_ok=True)
+        return None
+
+    # update the modification time, it is used to evict the least recently used entries
+    os.utime(path)
+    return compiled_func
+
+
+def store(key, compiled_func):
+    """Store a compiled function under `key` and evict old entries if needed."""
+    if not rcParams["compile.cache"]:
+        return
+
+    path = _entry_path(key)
+    tmp_name = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as fh:
+            tmp_name = fh.name
+            pickle.dump(compiled_func, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        # atomic, so concurrent processes never read a partially written entry
+        os.replace(tmp_name, path)
+    except Exception:  # the cache is an optimization, never fail because of it
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+        return
+
+    evict()
+
+
+def evict(max_mb=None):
+    """Remove the least recently used entries until the cache is smaller than `max_mb`.
+
+    Parameters
+    ----------
+    max_mb : float
+        Maximum size of the cache in megabytes. Defaults to None, which results in the value of
+        rcParams["compile.cache_max_mb"] being used.
+    """
+    if max_mb is None:
+        max_mb = rcParams["compile.cache_max_mb"]
+    max_size = max_mb * 2**20
+
+    entries = []
+    for path in get_cache_dir().glob("*/*.pkl"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+    for version_dir in get_cache_dir().glob("*"):
+        try:
+            version_dir.rmdir()  # only succeeds for empty directories
+        except OSError:
+            pass
+
+
+def clear():
+    """Remove all the entries in the cache."""
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
@@ -8,6 +8,9 @@ from pytensor.compile import Function, In
 from pytensor.tensor import tensor
 from pytensor.tensor.random.type import random_generator_type
 
+from preliz.internal import compile_cache, quadrature
+from preliz.internal.rcparams import rcParams
+
 eps = np.finfo(float).eps
 
 
@@ -58,6 +61,25 @@ def valid_scalar_params(self, check_frozen=True, raise_error=True):
     return False
 
 
+def valid_params(self, check_frozen=True):
+    """Like `valid_scalar_params` but also accepts arrays of integers or floats."""
+    if not self.is_frozen:
+        if check_frozen:
+            raise ValueError(
+                "Undefined distribution, "
+                "you need to first define its parameters or use one of the fit methods"
+            )
+        return False
+
+    if valid_scalar_params(self, raise_error=False):
+        return True
+
+    if all(np.issubdtype(np.asarray(param).dtype, np.number) for param in self.params):
+        return True
+
+    raise ValueError("parameters must be integers, floats or arrays of them")
+
+
 def valid_distribution(self):
     if self.__class__.__name__ != "Categorical":
         return True
@@ -84,25 +106,79 @@ def process_extra(input_string):
 
 
 def num_skewness(dist):
-    mean = dist.mean()
-    std = dist.std()
-    x_values = dist.xvals("full")
-    pdf = dist.pdf(x_values)
-    if dist.kind == "discrete":
-        return np.sum(((x_values - mean) / std) ** 3 * pdf)
-    else:
-        return np.trapezoid(((x_values - mean) / std) ** 3 * pdf, x_values)
+    return quadrature.moments(dist)[2]
 
 
 def num_kurtosis(dist):
-    mean = dist.mean()
-    std = dist.std()
-    x_values = dist.xvals("full")
-    pdf = dist.pdf(x_values)
-    if dist.kind == "discrete":
-        return np.sum(((x_values - mean) / std) ** 4 * pdf) - 3
-    else:
-        return np.trapezoid(((x_values - mean) / std) ** 4 * pdf, x_values) - 3
+    return quadrature.moments(dist)[3]
+
+
+# settings that change the value of numerically computed statistics, or their default arguments
+STATS_RCPARAMS = (
+    "stats.ci_kind",
+    "stats.ci_prob",
+    "stats.quad_tol",
+    "stats.ppf_rtol",
+    "stats.ppf_xtol",
+    "stats.ppf_table",
+    "stats.ppf_table_tol",
+)
+
+
+def params_key(dist):
+    """Hashable representation of the current parameters of `dist`.
+
+    Modifiers like Censored, Truncated or Hurdle keep a copy of the parameters of the
+    distributions they modify, which can be changed inplace, so the key of a modifier includes
+    the keys of its base distributions.
+    """
+    key = (
+        tuple(dist.param_names),
+        tuple((np.shape(param), np.asarray(param, dtype=float).tobytes()) for param in dist.params),
+    )
+    base = getattr(dist, "dist", None)
+    if base is not None:
+        bases = base if isinstance(base, list | tuple) else [base]
+        key += tuple(params_key(base) if base.is_frozen else None for base in bases)
+    return key
+
+
+def cached_stat(method):
+    """Memoize `method` on frozen distributions.
+
+    Results are stored per instance and keyed on the current parameters, including the ones of
+    the base distributions of modifiers, and on the rcParams in ``STATS_RCPARAMS``, so they are
+    discarded when ``_update`` or ``_parametrization`` change the parameters. Caching is disabled
+    with ``rcParams["stats.cache"] = False``, for example inside optimization loops where the
+    parameters change on every call.
+    """
+    name = method.__qualname__
+
+    @wraps(method)
+    def inner(self, *args, **kwargs):
+        if not (self.is_frozen and rcParams["stats.cache"]):
+            return method(self, *args, **kwargs)
+
+        key = (params_key(self), tuple(rcParams[name] for name in STATS_RCPARAMS))
+        cache = self.__dict__.get("_stats_cache")
+        if cache is None or cache[0] != key:
+            cache = (key, {})
+            self._stats_cache = cache
+
+        call = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            value = cache[1][call]
+        except KeyError:
+            value = method(self, *args, **kwargs)
+            cache[1][call] = value
+        except TypeError:  # unhashable arguments
+            return method(self, *args, **kwargs)
+        # return copies, so modifying the result inplace does not modify the cache
+        if isinstance(value, tuple):
+            return tuple(np.copy(val) if isinstance(val, np.ndarray) else val for val in value)
+        return np.copy(value) if isinstance(value, np.ndarray) else value
+
+    return inner
 
 
 def pytensor_jit(func, **compile_kwargs):
@@ -124,14 +200,19 @@ def pytensor_jit(func, **compile_kwargs):
             return signature_to_function[signature](*args)
         except KeyError:
             pass
-        symbolic_args = [
-            tensor(shape=tuple(1 if b else None for b in bcast_pattern), dtype=dtype)
-            for (bcast_pattern, dtype) in signature
-        ]
-        symbolic_out = func(*symbolic_args)
-        signature_to_function[signature] = compiled_func = function(
-            symbolic_args, symbolic_out, **compile_kwargs
-        )
+
+        key = compile_cache.cache_key(func, signature, compile_kwargs)
+        compiled_func = compile_cache.load(key)
+        if compiled_func is None:
+            symbolic_args = [
+                tensor(shape=tuple(1 if b else None for b in bcast_pattern), dtype=dtype)
+                for (bcast_pattern, dtype) in signature
+            ]
+            symbolic_out = func(*symbolic_args)
+            compiled_func = function(symbolic_args, symbolic_out, **compile_kwargs)
+            compile_cache.store(key, compiled_func)
+
+        signature_to_function[signature] = compiled_func
         return compiled_func(*args)
 
     return inner_func
@@ -169,28 +250,34 @@ def pytensor_rng_jit(_func=None, **compile_kwargs):
             except KeyError:
                 pass
 
-            symbolic_args = [
-                tensor(shape=tuple(1 if b else None for b in bcast_pattern), dtype=dtype)
-                for (bcast_pattern, dtype) in signature[:-1]
-            ]
-            symbolic_size = (
-                None if size is None else tensor(shape=(len(size),), dtype="int64", name="size")
-            )
-            symbolic_rng = random_generator_type("rng")
-            symbolic_out = func(*symbolic_args, size=symbolic_size, rng=symbolic_rng)
-
-            # We allow PyTensor to modify the RNG
-            mutable_rng = In(symbolic_rng, mutable=True)
-            if size is None:
-                symbolic_inputs = [*symbolic_args, mutable_rng]
-            else:
-                symbolic_inputs = [*symbolic_args, symbolic_size, mutable_rng]
-
-            signature_to_function[signature] = compiled_func = function(
-                symbolic_inputs,
-                symbolic_out,
-                **compile_kwargs,
-            )
+            key = compile_cache.cache_key(func, signature, compile_kwargs)
+            compiled_func = compile_cache.load(key)
+            if compiled_func is None:
+                symbolic_args = [
+                    tensor(shape=tuple(1 if b else None for b in bcast_pattern), dtype=dtype)
+                    for (bcast_pattern, dtype) in signature[:-1]
+                ]
+                symbolic_size = (
+                    None if size is None else tensor(shape=(len(size),), dtype="int64", name="size")
+                )
+                symbolic_rng = random_generator_type("rng")
+                symbolic_out = func(*symbolic_args, size=symbolic_size, rng=symbolic_rng)
+
+                # We allow PyTensor to modify the RNG
+                mutable_rng = In(symbolic_rng, mutable=True)
+                if size is None:
+                    symbolic_inputs = [*symbolic_args, mutable_rng]
+                else:
+                    symbolic_inputs = [*symbolic_args, symbolic_size, mutable_rng]
+
+                compiled_func = function(
+                    symbolic_inputs,
+                    symbolic_out,
+                    **compile_kwargs,
+                )
+                compile_cache.store(key, compiled_func)
+
+            signature_to_function[signature] = compiled_func
             return compiled_func(*args, rng) if size is None else compiled_func(*args, size, rng)
 
         return inner_func
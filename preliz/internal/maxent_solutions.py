@@ -0,0 +1,108 @@
+"""Closed-form maximum entropy solutions for common families.
+
+:func:`preliz.maxent` consults ``MAXENT_SOLUTIONS`` before falling back to the generic numerical
+optimization. Each entry maps the name of a distribution to a list of solvers, a solver returns
+the values of the free parameters (in the order given by ``none_idx``) or None if it does not
+apply to the problem, for example because the wrong parameters are fixed.
+"""
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+from preliz.internal.optimization import get_params
+
+
+def _free_names(dist, none_idx):
+    return [dist.param_names[idx] for idx in none_idx]
+
+
+def _to_vector(dist, none_idx, values):
+    return np.array([values[name] for name in _free_names(dist, none_idx)], dtype=float)
+
+
+def _standard_ppf(dist, none_idx, fixed, values, q):
+    """Evaluate the ppf of `dist` with the free parameters set to `values`."""
+    dist._parametrization(**get_params(dist, _to_vector(dist, none_idx, values), none_idx, fixed))
+    return dist.ppf(q)
+
+
+def _symmetric_location_scale(loc, scale):
+    """Solver for location-scale families symmetric around the location.
+
+    The entropy only depends on the scale, and the largest scale with `mass` inside the
+    interval is obtained by centering the distribution in the interval.
+    """
+
+    def solver(dist, lower, upper, mass, none_idx, fixed):
+        if sorted(_free_names(dist, none_idx)) != sorted([loc, scale]) or mass == 1:
+            return None
+        half_width = _standard_ppf(dist, none_idx, fixed, {loc: 0.0, scale: 1.0}, 0.5 + mass / 2)
+        return _to_vector(
+            dist, none_idx, {loc: (lower + upper) / 2, scale: (upper - lower) / 2 / half_width}
+        )
+
+    return solver
+
+
+def _scale_from_zero(name, rate=False):
+    """Solver for scale (or rate) families when the interval starts at zero.
+
+    The entropy increases with the scale, and the mass constraint `cdf(upper) = mass` has a
+    single solution.
+    """
+
+    def solver(dist, lower, upper, mass, none_idx, fixed):
+        if _free_names(dist, none_idx) != [name] or lower != dist.support[0] or mass == 1:
+            return None
+        quantile = _standard_ppf(dist, none_idx, fixed, {name: 1.0}, mass)
+        return _to_vector(dist, none_idx, {name: quantile / upper if rate else upper / quantile})
+
+    return solver
+
+
+def _uniform(dist, lower, upper, mass, none_idx, fixed):
+    """Solver for the Uniform distribution, centered in the interval."""
+    if _free_names(dist, none_idx) != ["lower", "upper"]:
+        return None
+    pad = (upper - lower) * (1 / mass - 1) / 2
+    return _to_vector(dist, none_idx, {"lower": lower - pad, "upper": upper + pad})
+
+
+MAXENT_SOLUTIONS = {
+    "Cauchy": [_symmetric_location_scale("alpha", "beta")],
+    "Exponential": [_scale_from_zero("lam", rate=True), _scale_from_zero("scale")],
+    "Gamma": [_scale_from_zero("beta", rate=True)],
+    "HalfCauchy": [_scale_from_zero("beta")],
+    "HalfNormal": [_scale_from_zero("sigma")],
+    "HalfStudentT": [_scale_from_zero("sigma")],
+    "Laplace": [_symmetric_location_scale("mu", "b")],
+    "Logistic": [_symmetric_location_scale("mu", "s")],
+    "Normal": [_symmetric_location_scale("mu", "sigma")],
+    "StudentT": [_symmetric_location_scale("mu", "sigma")],
+    "Uniform": [_uniform],
+    "Weibull": [_scale_from_zero("beta")],
+}
+
+
+def maxent_closed_form(dist, lower, upper, mass, none_idx, fixed):
+    """Solve the maxent problem in closed form if a solution is registered for `dist`.
+
+    Returns
+    -------
+    OptimizeResult or None
+        None if no solution applies, otherwise the distribution is updated inplace and an
+        OptimizeResult like the one from :func:`optimize_max_ent` is returned.
+    """
+    for solver in MAXENT_SOLUTIONS.get(dist.__class__.__name__, []):
+        x = solver(dist, lower, upper, mass, none_idx, fixed)
+        if x is not None and np.all(np.isfinite(x)):
+            dist._parametrization(**get_params(dist, x, none_idx, fixed))
+            return OptimizeResult(
+                x=x,
+                fun=-dist.entropy(),
+                success=True,
+                status=0,
+                message="Closed-form solution",
+                nit=0,
+            )
+    return None
@@ -0,0 +1,245 @@
+"""Moment matching for common families, in closed form, and for many problems at once.
+
+:func:`preliz.match_moments` consults ``MOMENT_SOLUTIONS`` before falling back to the generic
+numerical optimization, and :func:`solve_moments_batch` solves the problems of
+:func:`preliz.match_moments_batch`. Each entry of ``MOMENT_SOLUTIONS`` maps the name of a
+distribution to a list of solvers, a solver inverts the moments in ``moments`` when the free
+parameters are the ones in ``names``. It takes arrays of targets, with one value per problem, and
+returns the parameters, nan for problems without a valid solution. The number of moments equals
+the number of free parameters, so the solution matches the moments exactly.
+"""
+
+from copy import copy
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+from preliz.internal.maxent_solutions import _free_names
+from preliz.internal.optimization import (
+    fit_moments_starts,
+    get_fixed_params,
+    get_params,
+    optimize_batch,
+    optimize_moments,
+)
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def _valid(condition, **params):
+    return {name: np.where(condition, value, np.nan) for name, value in params.items()}
+
+
+def _normal(dist, m, v):
+    return {"mu": m, "sigma": np.sqrt(v)}
+
+
+def _gamma(dist, m, v):
+    return _valid(m > 0, alpha=m**2 / v, beta=m / v)
+
+
+def _beta(dist, m, v):
+    kappa = m * (1 - m) / v - 1
+    return _valid((m > 0) & (m < 1) & (kappa > 0), alpha=m * kappa, beta=(1 - m) * kappa)
+
+
+def _lognormal(dist, m, v):
+    sigma2 = np.log1p(v / m**2)
+    return _valid(m > 0, mu=np.log(m) - sigma2 / 2, sigma=np.sqrt(sigma2))
+
+
+def _inverse_gamma(dist, m, v):
+    alpha = m**2 / v + 2
+    return _valid(m > 0, alpha=alpha, beta=m * (alpha - 1))
+
+
+def _laplace(dist, m, v):
+    return {"mu": m, "b": np.sqrt(v / 2)}
+
+
+def _logistic(dist, m, v):
+    return {"mu": m, "s": np.sqrt(3 * v) / np.pi}
+
+
+def _gumbel(dist, m, v):
+    beta = np.sqrt(6 * v) / np.pi
+    return {"mu": m - EULER_GAMMA * beta, "beta": beta}
+
+
+def _uniform(dist, m, v):
+    half_width = np.sqrt(3 * v)
+    return {"lower": m - half_width, "upper": m + half_width}
+
+
+def _student_t(dist, m, v):
+    nu = dist.nu
+    return _valid(nu > 2, mu=m, sigma=np.sqrt(v * (nu - 2) / nu))
+
+
+def _wald(dist, m, v):
+    return _valid(m > 0, mu=m, lam=m**3 / v)
+
+
+def _negative_binomial(dist, m, v):
+    return _valid((m > 0) & (v > m), mu=m, alpha=m**2 / (v - m))
+
+
+def _poisson(dist, m):
+    return _valid(m > 0, mu=m)
+
+
+def _exponential(dist, m):
+    return _valid(m > 0, lam=1 / m)
+
+
+def _exgaussian(dist, m, v, s):
+    # the skewness of the exponential component is 2, so s is in (0, 2)
+    nu = np.sqrt(v) * np.cbrt(s / 2)
+    return _valid((s > 0) & (s < 2), mu=m - nu, sigma=np.sqrt(v - nu**2), nu=nu)
+
+
+def _skew_normal(dist, m, v, s):
+    # the skewness of the SkewNormal is bounded by the one of the HalfNormal
+    max_skewness = np.sqrt(2) * (4 - np.pi) / (np.pi - 2) ** 1.5
+    abs_s = np.abs(s) ** (2 / 3)
+    delta = np.sign(s) * np.sqrt(np.pi / 2 * abs_s / (abs_s + ((4 - np.pi) / 2) ** (2 / 3)))
+    sigma = np.sqrt(v / (1 - 2 * delta**2 / np.pi))
+    return _valid(
+        np.abs(s) < max_skewness,
+        mu=m - sigma * delta * np.sqrt(2 / np.pi),
+        sigma=sigma,
+        alpha=delta / np.sqrt(1 - delta**2),
+    )
+
+
+MOMENT_SOLUTIONS = {
+    "Beta": [(("alpha", "beta"), "mv", _beta)],
+    "ExGaussian": [(("mu", "sigma", "nu"), "mvs", _exgaussian)],
+    "Exponential": [(("lam",), "m", _exponential)],
+    "Gamma": [(("alpha", "beta"), "mv", _gamma)],
+    "Gumbel": [(("mu", "beta"), "mv", _gumbel)],
+    "InverseGamma": [(("alpha", "beta"), "mv", _inverse_gamma)],
+    "Laplace": [(("mu", "b"), "mv", _laplace)],
+    "Logistic": [(("mu", "s"), "mv", _logistic)],
+    "LogNormal": [(("mu", "sigma"), "mv", _lognormal)],
+    "NegativeBinomial": [(("mu", "alpha"), "mv", _negative_binomial)],
+    "Normal": [(("mu", "sigma"), "mv", _normal)],
+    "Poisson": [(("mu",), "m", _poisson)],
+    "SkewNormal": [(("mu", "sigma", "alpha"), "mvs", _skew_normal)],
+    "StudentT": [(("mu", "sigma"), "mv", _student_t)],
+    "Uniform": [(("lower", "upper"), "mv", _uniform)],
+    "Wald": [(("mu", "lam"), "mv", _wald)],
+}
+
+
+def moments_closed_form(dist, moments, targets, none_idx):
+    """Solve moment matching problems in closed form if a solution is registered for `dist`.
+
+    Parameters
+    ----------
+    moments : str
+        Moments to match, as in :func:`preliz.match_moments`.
+    targets : array
+        Values of the moments, with one problem per row.
+
+    Returns
+    -------
+    array or None
+        None if no solution applies, otherwise the values of the free parameters, with one row
+        per problem and nan for problems without a valid solution.
+    """
+    # the standard deviation is matched through the variance
+    if "v" in moments and "d" in moments or len(set(moments)) != len(moments):
+        return None
+    values = dict(zip(moments.replace("d", "v"), targets.T))
+    if "d" in moments:
+        values["v"] = values["v"] ** 2
+
+    free_names = _free_names(dist, none_idx)
+    for names, solved_moments, solver in MOMENT_SOLUTIONS.get(dist.__class__.__name__, []):
+        if sorted(free_names) != sorted(names) or sorted(values) != sorted(solved_moments):
+            continue
+        with np.errstate(all="ignore"):
+            params = solver(dist, *(values[moment] for moment in solved_moments))
+            params = _valid(values["v"] > 0, **params) if "v" in values else params
+        return np.column_stack([params[name] for name in free_names]).astype(float)
+    return None
+
+
+def solve_moments_batch(dist, moments, targets, means, stds):
+    """Match the moments of `dist` to each row of `targets`.
+
+    Parameters
+    ----------
+    moments : str
+        Moments to match, as in :func:`preliz.match_moments`.
+    targets : array
+        Values of the moments, with one problem per row.
+    means, stds : array
+        Mean and standard deviation of each problem, used to start the numerical optimization.
+
+    Returns
+    -------
+    x : array
+        Values of the free parameters, with one row per problem.
+    opts : list
+        OptimizeResult of each problem.
+    """
+    none_idx, fixed = get_fixed_params(dist)
+    n_problems = len(targets)
+
+    x = moments_closed_form(dist, moments, targets, none_idx)
+    if x is None:
+        x = np.full((n_problems, len(none_idx)), np.nan)
+    closed = np.all(np.isfinite(x), axis=1)
+
+    solve = ~closed
+    nit = np.zeros(n_problems, dtype=int)
+    failed = np.zeros(n_problems, dtype=bool)
+    if np.any(solve):
+        sub_targets = targets[solve]
+        start = fit_moments_starts(dist, means[solve], stds[solve], none_idx)
+        max_iter = 100
+        x[solve], cost, nit[solve] = optimize_batch(
+            dist,
+            lambda rows: _moment_values(dist, moments) - sub_targets[rows].T,
+            start,
+            none_idx,
+            fixed,
+            max_iter=max_iter,
+        )
+        failed[solve] = ~np.isfinite(cost) | (nit[solve] >= max_iter)
+
+    # problems the batched solver could not solve are solved one by one, as match_moments would
+    for idx in np.flatnonzero(failed):
+        row_dist = copy(dist)
+        row_dist._parametrization(**get_params(row_dist, [None] * len(none_idx), none_idx, fixed))
+        row_dist._fit_moments(means[idx], stds[idx])
+        with np.errstate(all="ignore"):
+            opt = optimize_moments(row_dist, moments, targets[idx], none_idx, fixed)
+        if np.isfinite(opt.fun):
+            x[idx] = opt.x
+            nit[idx] += opt.nit
+            failed[idx] = False
+
+    dist._parametrization(**get_params(dist, list(x.T), none_idx, fixed))
+    with np.errstate(all="ignore"):
+        cost = np.sum((_moment_values(dist, moments) - targets.T) ** 2, axis=0)
+
+    opts = [
+        OptimizeResult(
+            x=x[idx],
+            fun=cost[idx],
+            success=not failed[idx],
+            nit=nit[idx],
+            message="Closed-form solution" if closed[idx] else "",
+        )
+        for idx in range(n_problems)
+    ]
+    return x, opts
+
+
+def _moment_values(dist, moments):
+    """Moments of a distribution with array parameters, with one column per problem."""
+    # some moments do not depend on the parameters, and are scalars
+    return np.array(np.broadcast_arrays(*dist.moments(moments)), dtype=float)
@@ -0,0 +1,51 @@
+"""Add PreliZ's styles to matplotlib's styles, without importing matplotlib.
+
+Importing PreliZ does not import matplotlib. If ``matplotlib.style`` is already imported the
+styles are added right away, otherwise they are added as soon as it is, so
+``plt.style.use("preliz-doc")`` works after ``import preliz`` in any order.
+"""
+
+import sys
+from importlib.abc import MetaPathFinder
+from importlib.util import find_spec
+from os import path as os_path
+
+STYLE_PATH = os_path.join(os_path.dirname(os_path.dirname(__file__)), "styles")
+
+
+def register_styles():
+    """Add PreliZ's styles to those of ``matplotlib.style``, if it is imported."""
+    if "matplotlib.style" in sys.modules:
+        _add_style_path(sys.modules["matplotlib.style"])
+    elif not any(isinstance(finder, _StyleFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _StyleFinder())
+
+
+def _add_style_path(style):
+    if hasattr(style, "USER_LIBRARY_PATHS"):
+        paths = style.USER_LIBRARY_PATHS
+    else:
+        paths = style.core.USER_LIBRARY_PATHS
+    if STYLE_PATH not in paths:
+        paths.append(STYLE_PATH)
+        style.reload_library()
+
+
+class _StyleFinder(MetaPathFinder):
+    """Import hook adding the styles once ``matplotlib.style`` has been executed."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "matplotlib.style":
+            return None
+        sys.meta_path.remove(self)
+        spec = find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+        exec_module = spec.loader.exec_module
+
+        def exec_and_register(module):
+            exec_module(module)
+            _add_style_path(module)
+
+        spec.loader.exec_module = exec_and_register
+        return spec
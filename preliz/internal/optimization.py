@@ -4,16 +4,23 @@ import warnings
 from copy import copy
 
 import numpy as np
-from scipy.optimize import brentq, least_squares, minimize, minimize_scalar, root_scalar
+from scipy.optimize import least_squares, minimize, minimize_scalar, root_scalar
 from scipy.special import i0, i0e, i1, i1e
 
+from preliz.internal import autodiff
 from preliz.internal.distribution_helper import init_vals as default_vals
+from preliz.internal.parallel import map_fits
+from preliz.internal.rcparams import rc_context, rcParams
+from preliz.internal.solution_atlas import quartile_start
+from preliz.internal.special import sample_lmoments
+from preliz.internal.streaming import ChunkedSample, row_stats
 
 
-def optimize_max_ent(dist, lower, upper, mass, none_idx, fixed_params, fixed_stat):
+def optimize_max_ent(dist, lower, upper, mass, none_idx, fixed_params, fixed_stat, multistart=True):
+    set_params = dist._free_params_setter(none_idx, fixed_params)
+
     def prob_bound(params, dist, lower, upper, mass):
-        params = get_params(dist, params, none_idx, fixed_params)
-        dist._parametrization(**params)
+        set_params(params)
         if dist.kind == "discrete":
             lower -= 1
         cdf0 = dist.cdf(lower)
@@ -24,8 +31,7 @@ def optimize_max_ent(dist, lower, upper, mass, none_idx, fixed_params, fixed_sta
         return loss
 
     def entropy_loss(params, dist):
-        params = get_params(dist, params, none_idx, fixed_params)
-        dist._parametrization(**params)
+        set_params(params)
         return -dist.entropy()
 
     cons = {
@@ -34,24 +40,56 @@ def optimize_max_ent(dist, lower, upper, mass, none_idx, fixed_params, fixed_sta
         "args": (dist, lower, upper, mass),
     }
 
+    # use exact derivatives when available, otherwise minimize uses finite differences
+    entropy_jac = None
+    entropy_grad = autodiff.stat_gradient(dist, "entropy", none_idx)
+    if entropy_grad is not None:
+
+        def entropy_jac(params, dist):
+            set_params(params)
+            return -entropy_grad()[1]
+
+    cdf_jac = None
+    if not fixed_stat:
+        x_bounds = [lower - 1 if dist.kind == "discrete" else lower, upper]
+        cdf_jac = autodiff.x_jacobian(dist, "cdf", none_idx, x_bounds)
+    if cdf_jac is not None:
+
+        def prob_bound_jac(params, dist, lower, upper, mass):
+            set_params(params)
+            jac = cdf_jac()[1]
+            return jac[1] - jac[0]
+
+        cons["jac"] = prob_bound_jac
+
     bounds = np.array(dist.params_support)[none_idx]
     current_params = np.array(dist.params)[none_idx]
 
     init_vals_list = [current_params]
-    for scale in [0.75, 0.9, 1.1, 1.25]:
-        perturbed = np.clip(current_params * scale, [b[0] for b in bounds], [b[1] for b in bounds])
-        init_vals_list.append(perturbed)
+    if multistart:
+        for scale in [0.75, 0.9, 1.1, 1.25]:
+            perturbed = np.clip(
+                current_params * scale, [b[0] for b in bounds], [b[1] for b in bounds]
+            )
+            init_vals_list.append(perturbed)
 
     all_results = []
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", message="Values in x were outside bounds")
 
         try:
-            for init_vals in init_vals_list:
-                opt = minimize(
-                    entropy_loss, x0=init_vals, bounds=bounds, args=(dist,), constraints=cons
-                )
-                all_results.append(opt)
+            # the parameters change on every evaluation, caching the entropy is wasted work
+            with rc_context({"stats.cache": False}):
+                for init_vals in init_vals_list:
+                    opt = minimize(
+                        entropy_loss,
+                        x0=init_vals,
+                        bounds=bounds,
+                        args=(dist,),
+                        constraints=cons,
+                        jac=entropy_jac,
+                    )
+                    all_results.append(opt)
         except Exception:
             pass
 
@@ -69,8 +107,7 @@ def optimize_max_ent(dist, lower, upper, mass, none_idx, fixed_params, fixed_sta
     if best_opt is None:
         best_opt = all_results[0]
 
-    params = get_params(dist, best_opt.x, none_idx, fixed_params)
-    dist._parametrization(**params)
+    set_params(best_opt.x)
     return best_opt
 
 
@@ -91,9 +128,10 @@ def get_params(dist, params, none_idx, fixed):
 
 
 def optimize_quartile(dist, x_vals, none_idx, fixed):
+    set_params = dist._free_params_setter(none_idx, fixed)
+
     def func(params, dist, x_vals):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(params)
         loss = dist.cdf(x_vals) - [0.25, 0.5, 0.75]
         return loss
 
@@ -101,16 +139,22 @@ def optimize_quartile(dist, x_vals, none_idx, fixed):
     bounds = np.array(dist.params_support)[none_idx]
     bounds = list(zip(*bounds))
 
-    opt = least_squares(func, x0=init_vals, args=(dist, x_vals), bounds=bounds)
-    params = get_params(dist, opt["x"], none_idx, fixed)
-    dist._parametrization(**params)
+    opt = least_squares(
+        func,
+        x0=init_vals,
+        args=(dist, x_vals),
+        bounds=bounds,
+        jac=_residuals_jac(dist, "cdf", none_idx, x_vals, set_params),
+    )
+    set_params(opt["x"])
     return opt
 
 
 def optimize_pdf(dist, x_vals, epdf, none_idx, fixed):
+    set_params = dist._free_params_setter(none_idx, fixed)
+
     def func(params, dist, x_vals, epdf):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(params)
         loss = dist.pdf(x_vals) - epdf
         return loss
 
@@ -118,33 +162,53 @@ def optimize_pdf(dist, x_vals, epdf, none_idx, fixed):
     bounds = np.array(dist.params_support)[none_idx]
     bounds = list(zip(*bounds))
 
-    opt = least_squares(func, x0=init_vals, args=(dist, x_vals, epdf), bounds=bounds)
-    params = get_params(dist, opt["x"], none_idx, fixed)
-    dist._parametrization(**params)
+    opt = least_squares(
+        func,
+        x0=init_vals,
+        args=(dist, x_vals, epdf),
+        bounds=bounds,
+        jac=_residuals_jac(dist, "pdf", none_idx, x_vals, set_params),
+    )
+    set_params(opt["x"])
     loss = opt["cost"]
     return loss
 
 
+def _residuals_jac(dist, method, none_idx, x_vals, set_params):
+    """Jacobian of the residuals ``method(x_vals) - target``, or "2-point" if not available."""
+    value_and_jac = autodiff.x_jacobian(dist, method, none_idx, x_vals)
+    if value_and_jac is None:
+        return "2-point"
+
+    def jac(params, *args):
+        set_params(params)
+        return value_and_jac()[1]
+
+    return jac
+
+
 def optimize_moments(dist, moments, target, none_idx, fixed):
+    set_params = dist._free_params_setter(none_idx, fixed)
+
     def func(params):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(params)
         vals = dist.moments(moments)
         return np.sum((vals - target) ** 2)
 
     init_vals = np.array(dist.params)[none_idx]
     bounds = np.array(dist.params_support)[none_idx]
 
-    opt = minimize(func, init_vals, bounds=bounds, method="powell")
-    params = get_params(dist, opt["x"], none_idx, fixed)
-    dist._parametrization(**params)
+    with rc_context({"stats.cache": False}):
+        opt = minimize(func, init_vals, bounds=bounds, method="powell")
+    set_params(opt["x"])
     return opt
 
 
 def optimize_quantiles(dist, quantiles, target, none_idx, fixed):
+    set_params = dist._free_params_setter(none_idx, fixed)
+
     def func(params):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(params)
         vals = dist.ppf(quantiles)
         return np.sum((vals - target) ** 2)
 
@@ -152,15 +216,165 @@ def optimize_quantiles(dist, quantiles, target, none_idx, fixed):
     bounds = np.array(dist.params_support)[none_idx]
 
     opt = minimize(func, init_vals, bounds=bounds, method="powell")
-    params = get_params(dist, opt["x"], none_idx, fixed)
-    dist._parametrization(**params)
+    set_params(opt["x"])
     return opt
 
 
+def optimize_batch(dist, residuals, init_vals, none_idx, fixed, max_iter=100):
+    """Solve many least squares problems at once.
+
+    A Levenberg-Marquardt method run for all the problems together. The free parameters of
+    `dist` are set to arrays with one value per problem, and each iteration evaluates the
+    residuals of all the problems still running with a few calls to `residuals`. Bounded
+    parameters are optimized on an unbounded scale, and the Jacobian is approximated by
+    central differences on that scale.
+
+    Parameters
+    ----------
+    residuals : callable
+        ``residuals(rows)`` returns the residuals of the problems `rows`, with shape
+        ``(n_residuals, len(rows))``, for the parameters currently set in `dist`.
+    init_vals : array
+        Starting values of the free parameters, with one row per problem.
+
+    Returns
+    -------
+    x : array
+        Values of the free parameters, with one row per problem.
+    cost : array
+        Sum of the squared residuals of each problem.
+    nit : array
+        Number of iterations of each problem.
+    """
+    set_params = dist._free_params_setter(none_idx, fixed)
+    bounds = np.array(dist.params_support, dtype=float)[none_idx]
+    n_problems, n_params = init_vals.shape
+
+    def evaluate(u, rows):
+        set_params(list(_from_unbounded(u, bounds).T))
+        with np.errstate(all="ignore"):
+            res = np.asarray(residuals(rows), dtype=float).T
+        cost = np.sum(res**2, axis=1)
+        return res, np.where(np.isfinite(cost), cost, np.inf)
+
+    u = _to_unbounded(init_vals, bounds)
+    res, cost = evaluate(u, np.arange(n_problems))
+    damping = np.full(n_problems, 1e-3)
+    nit = np.zeros(n_problems, dtype=int)
+    active = np.isfinite(cost)
+
+    for _ in range(max_iter):
+        rows = np.flatnonzero(active)
+        if rows.size == 0:
+            break
+        nit[rows] += 1
+
+        jac = np.empty((rows.size, res.shape[1], n_params))
+        for idx in range(n_params):
+            step = 1e-6 * (1 + np.abs(u[rows, idx]))
+            u_step = u[rows].copy()
+            u_step[:, idx] += step
+            res_up, _ = evaluate(u_step, rows)
+            u_step[:, idx] -= 2 * step
+            res_down, _ = evaluate(u_step, rows)
+            jac[:, :, idx] = (res_up - res_down) / (2 * step[:, None])
+        # problems with a non finite Jacobian do not move, their damping grows until they stop
+        bad_jac = ~np.all(np.isfinite(jac), axis=(1, 2))
+        jac[bad_jac] = 0
+
+        jtj = np.einsum("nki,nkj->nij", jac, jac)
+        grad = np.einsum("nki,nk->ni", jac, res[rows])
+        diag = np.maximum(np.einsum("nii->ni", jtj), 1e-12)
+        system = jtj + damping[rows, None, None] * (diag[:, :, None] * np.eye(n_params))
+        delta = -np.linalg.solve(system, grad[:, :, None])[:, :, 0]
+
+        new_u = u[rows] + delta
+        new_res, new_cost = evaluate(new_u, rows)
+        better = new_cost < cost[rows]
+        improvement = cost[rows] - new_cost
+
+        accepted = rows[better]
+        u[accepted] = new_u[better]
+        res[accepted] = new_res[better]
+        cost[accepted] = new_cost[better]
+        damping[accepted] /= 10
+        damping[rows[~better]] *= 10
+
+        converged = (
+            (cost[rows] < 1e-24)
+            | (better & (improvement <= 1e-12 * (1 + new_cost)))
+            | (np.max(np.abs(delta), axis=1) <= 1e-10 * (1 + np.max(np.abs(u[rows]), axis=1)))
+            | (damping[rows] > 1e10)
+        )
+        active[rows[converged]] = False
+
+    x = _from_unbounded(u, bounds)
+    set_params(list(x.T))
+    return x, cost, nit
+
+
+def fit_moments_starts(dist, mean, sigma, none_idx):
+    """Compute starting values of many problems with the heuristic ``_fit_moments``.
+
+    Returns
+    -------
+    array
+        Values of the free parameters matching each element of `mean` and `sigma`, with one row
+        per problem.
+    """
+    try:
+        with np.errstate(all="ignore"):
+            dist._fit_moments(mean=mean, sigma=sigma)
+        starts = np.column_stack(
+            [
+                np.broadcast_to(np.asarray(dist.params[idx], dtype=float), mean.shape)
+                for idx in none_idx
+            ]
+        )
+        if np.all(np.isfinite(starts)):
+            return starts
+    except Exception:  # the heuristic is not vectorized for this family, go row by row
+        pass
+
+    starts = np.empty((len(mean), len(none_idx)))
+    for idx, (mean_i, sigma_i) in enumerate(zip(mean, sigma)):
+        with np.errstate(all="ignore"):
+            dist._fit_moments(mean=mean_i, sigma=sigma_i)
+        starts[idx] = np.asarray(dist.params, dtype=float)[none_idx]
+    return starts
+
+
+def _to_unbounded(x, bounds):
+    """Map parameters inside `bounds` to the real line, the inverse of `_from_unbounded`."""
+    u = np.array(x, dtype=float)
+    for idx, (lower, upper) in enumerate(bounds):
+        with np.errstate(all="ignore"):
+            if np.isfinite(lower) and np.isfinite(upper):
+                ratio = np.clip((u[:, idx] - lower) / (upper - lower), 1e-12, 1 - 1e-12)
+                u[:, idx] = np.log(ratio / (1 - ratio))
+            elif np.isfinite(lower):
+                u[:, idx] = np.log(np.maximum(u[:, idx] - lower, 1e-300))
+            elif np.isfinite(upper):
+                u[:, idx] = np.log(np.maximum(upper - u[:, idx], 1e-300))
+    return u
+
+
+def _from_unbounded(u, bounds):
+    x = np.array(u, dtype=float)
+    for idx, (lower, upper) in enumerate(bounds):
+        with np.errstate(all="ignore"):
+            if np.isfinite(lower) and np.isfinite(upper):
+                x[:, idx] = lower + (upper - lower) / (1 + np.exp(-u[:, idx]))
+            elif np.isfinite(lower):
+                x[:, idx] = lower + np.exp(u[:, idx])
+            elif np.isfinite(upper):
+                x[:, idx] = upper - np.exp(u[:, idx])
+    return x
+
+
 def optimize_mean_sigma(dist, mean, sigma, params=None):
     def func(params, dist, mean, sigma):
-        params = get_params(dist, params, none_idx, fixed)
-        dist._parametrization(**params)
+        set_params(params)
         loss = abs(dist.mean() - mean) + abs(dist.std() - sigma)
         return loss
 
@@ -177,22 +391,41 @@ def optimize_mean_sigma(dist, mean, sigma, params=None):
         else:
             dist._update(**default_vals[name])
 
+    set_params = dist._free_params_setter(none_idx, fixed)
     init_vals = np.array(dist.params)[none_idx]
 
-    if dist.__class__.__name__ in ["HyperGeometric"]:
-        opt = least_squares(func, x0=init_vals, args=(dist, mean, sigma))
-    else:
-        bounds = np.array(dist.params_support)[none_idx]
-        bounds = list(zip(*bounds))
-        if dist.__class__.__name__ in ["DiscreteWeibull"]:
-            opt = least_squares(
-                func, x0=init_vals, args=(dist, mean, sigma), bounds=bounds, loss="soft_l1"
-            )
+    jac = "2-point"
+    mean_grad = autodiff.stat_gradient(dist, "mean", none_idx)
+    std_grad = autodiff.stat_gradient(dist, "std", none_idx)
+    if mean_grad is not None and std_grad is not None:
+
+        def jac(params, dist, mean, sigma):
+            set_params(params)
+            mean_val, mean_jac = mean_grad()
+            std_val, std_jac = std_grad()
+            return [np.sign(mean_val - mean) * mean_jac + np.sign(std_val - sigma) * std_jac]
+
+    with rc_context({"stats.cache": False}):
+        if dist.__class__.__name__ in ["HyperGeometric"]:
+            opt = least_squares(func, x0=init_vals, args=(dist, mean, sigma), jac=jac)
         else:
-            opt = least_squares(func, x0=init_vals, args=(dist, mean, sigma), bounds=bounds)
+            bounds = np.array(dist.params_support)[none_idx]
+            bounds = list(zip(*bounds))
+            if dist.__class__.__name__ in ["DiscreteWeibull"]:
+                opt = least_squares(
+                    func,
+                    x0=init_vals,
+                    args=(dist, mean, sigma),
+                    bounds=bounds,
+                    loss="soft_l1",
+                    jac=jac,
+                )
+            else:
+                opt = least_squares(
+                    func, x0=init_vals, args=(dist, mean, sigma), bounds=bounds, jac=jac
+                )
 
-    params = get_params(dist, opt["x"], none_idx, fixed)
-    dist._parametrization(**params)
+    set_params(opt["x"])
     return opt
 
 
@@ -236,21 +469,73 @@ def optimize_moments_rice(mean, std_dev):
     return float(nu), float(sigma)
 
 
-def optimize_ml(dist, sample):
+def optimize_ml(dist, sample, weights=None):
     def negll(params, dist, sample):
         dist._update(*params)
-        return -dist.logpdf(sample).sum()
+        return -loglik(dist, sample, weights)
 
-    dist._fit_moments(np.mean(sample), np.std(sample))
+    if isinstance(sample, ChunkedSample):
+        dist._fit_moments(sample.mean, sample.std)
+    elif weights is not None:
+        mean = np.average(sample, weights=weights)
+        dist._fit_moments(mean, np.average((sample - mean) ** 2, weights=weights) ** 0.5)
+    else:
+        init_ml(dist, sample)
     init_vals = dist.params
 
-    opt = minimize(negll, x0=init_vals, bounds=dist.params_support, args=(dist, sample))
+    jac = None
+    loglik_grad = autodiff.loglik_gradient(dist, list(range(len(init_vals))), sample, weights)
+    if loglik_grad is not None:
+
+        def jac(params, dist, sample):
+            dist._update(*params)
+            return -loglik_grad()[1]
+
+    opt = minimize(negll, x0=init_vals, bounds=dist.params_support, args=(dist, sample), jac=jac)
 
     dist._update(*opt["x"])
 
     return opt
 
 
+def init_ml(dist, sample):
+    """Initialize `dist` with the best of a moments and an L-moments start for ``optimize_ml``.
+
+    The L-moments start uses the L-location and ``sqrt(pi)`` times the L-scale, the standard
+    deviation of a Normal with that L-scale. The L-scale is less sensitive to the tails than the
+    standard deviation, so for heavy-tailed samples this start is closer to the maximum and the
+    optimizer needs fewer iterations. The start with the largest likelihood is kept.
+    """
+    dist._fit_moments(np.mean(sample), np.std(sample))
+    l_1, l_2, _, _ = sample_lmoments(np.asarray(sample, dtype=float).ravel())
+    if not l_2 > 0:
+        return
+
+    moment_state = dict(dist.__dict__)
+    moment_loglik = loglik(dist, sample)
+    dist._fit_moments(l_1, np.pi**0.5 * l_2)
+    # comparison is False for nan, falling back to the moments start
+    if not loglik(dist, sample) > moment_loglik:
+        dist.__dict__.update(moment_state)
+
+
+def optimize_lmoments(dist, lmoments, target, none_idx, fixed):
+    set_params = dist._free_params_setter(none_idx, fixed)
+
+    def func(params):
+        set_params(params)
+        vals = dist.lmoments(lmoments)
+        return np.sum((np.asarray(vals) - target) ** 2)
+
+    init_vals = np.array(dist.params)[none_idx]
+    bounds = np.array(dist.params_support)[none_idx]
+
+    with rc_context({"stats.cache": False}):
+        opt = minimize(func, init_vals, bounds=bounds, method="powell")
+    set_params(opt["x"])
+    return opt
+
+
 def optimize_dirichlet_mode(lower_bounds, mode, target_mass, _dist):
     def prob_approx(tau, lower_bounds, mode, _dist):
         alpha = [1 + tau * mode_i for mode_i in mode]
@@ -278,40 +563,195 @@ def optimize_dirichlet_mode(lower_bounds, mode, target_mass, _dist):
 
 
 def find_hdi(dist, mass):
-    """Find the highest density interval (HDI) for a distribution."""
+    """Find the highest density interval (HDI) for a distribution.
+
+    For continuous distributions `mass` and the parameters of `dist` can be arrays, the
+    results have their broadcasted shape.
+    """
     if dist.kind == "continuous":
-        lower, upper = continuous_hdi(dist, mass)
-    else:
-        x_vals = dist.xvals("full")
-        if len(x_vals) < 199:
-            lower, upper = discrete_hdi(dist, mass, x_vals)
-        else:
-            # For discrete distributions with many values, use continuous approximation
+        if dist.__class__.__name__ in ["Censored", "Hurdle", "Mixture"]:
             lower, upper = continuous_hdi(dist, mass)
-
+        else:
+            lower, upper, unimodal = unimodal_hdi(dist, mass)
+            if not np.all(unimodal):
+                lower, upper = _multimodal_hdi(dist, mass, lower, upper, unimodal)
+    else:
+        lower, upper = discrete_hdi(dist, mass)
         lower = int(lower)
         upper = int(upper)
 
     return lower, upper
 
 
-def discrete_hdi(dist, mass, x_vals):
-    """Find the highest density interval for a discrete distribution."""
+def discrete_hdi(dist, mass, chunk_size=64):
+    """Find the highest density interval for a discrete distribution.
+
+    Values are added in decreasing order of probability until their mass reaches `mass`. For
+    unimodal distributions this starts from the mode and evaluates the pmf on chunks of
+    increasing size at both sides, so large supports are never materialized. Distributions
+    that can be multimodal, and pmfs found not to decrease away from the mode, are handled by
+    sorting the pmf over the whole support.
+    """
+    if dist.__class__.__name__ in [
+        "Categorical",
+        "Censored",
+        "Hurdle",
+        "Mixture",
+        "ZeroInflatedBinomial",
+        "ZeroInflatedNegativeBinomial",
+        "ZeroInflatedPoisson",
+    ] or (dist.__class__.__name__ == "BetaBinomial" and min(dist.alpha, dist.beta) < 1):
+        return _sorted_discrete_hdi(dist, mass)
+
+    lower_s, upper_s = dist.support
+    mode = _climb_discrete_mode(dist, chunk_size)
+    pmf_mode = dist.pdf(mode)
+    if pmf_mode >= mass:
+        return mode, mode
+
+    while True:
+        left = np.arange(mode - 1, max(mode - chunk_size, lower_s) - 1, -1)
+        right = np.arange(mode + 1, min(mode + chunk_size, upper_s) + 1)
+        left_pmf = dist.pdf(left)
+        right_pmf = dist.pdf(right)
+        # the pmf of multimodal distributions grows again away from the mode
+        rtol = 1e-10 * pmf_mode
+        if np.any(np.diff(left_pmf) > rtol) or np.any(np.diff(right_pmf) > rtol):
+            return _sorted_discrete_hdi(dist, mass)
+        x_vals = np.concatenate([left, right])
+        pmf_vals = np.concatenate([left_pmf, right_pmf])
+
+        # ties are broken by the distance to the mode, so flat pmfs give centered intervals
+        order = np.lexsort((np.abs(x_vals - mode), -pmf_vals))
+        cum_mass = pmf_mode + np.cumsum(pmf_vals[order])
+        idx = np.searchsorted(cum_mass, mass)
+
+        # values outside the chunks are less probable than the last value evaluated at their
+        # side, so the selection is exact if its least probable value is not below those
+        unseen = [
+            pmf[-1]
+            for values, pmf, bound in [(left, left_pmf, lower_s), (right, right_pmf, upper_s)]
+            if values.size and values[-1] != bound
+        ]
+        if idx < cum_mass.size and (not unseen or pmf_vals[order[idx]] >= max(unseen)):
+            selected = x_vals[order[: idx + 1]]
+            return min(selected.min(), mode), max(selected.max(), mode)
+        if not unseen:
+            return x_vals.min(initial=mode), x_vals.max(initial=mode)
+
+        chunk_size *= 4
+
+
+def _climb_discrete_mode(dist, chunk_size):
+    """Return the mode of `dist`, refining it locally if it is only approximated."""
+    try:
+        mode = int(dist.mode())
+    except NotImplementedError:
+        mode = int(find_discrete_mode(dist))
+
+    lower_s, upper_s = dist.support
+    while True:
+        x_vals = np.arange(max(mode - chunk_size, lower_s), min(mode + chunk_size, upper_s) + 1)
+        pmf_vals = dist.pdf(x_vals)
+        idx = np.argmax(pmf_vals)
+        if pmf_vals[idx] <= dist.pdf(mode):
+            return mode
+        mode = int(x_vals[idx])
+
+
+def _sorted_discrete_hdi(dist, mass, tail=1e-12):
+    """Find the HDI by sorting the pmf over the (truncated) support, for multimodal pmfs."""
+    lower_s, upper_s = dist.support
+    if not np.isfinite(lower_s):
+        lower_s = dist.ppf(tail)
+    if not np.isfinite(upper_s):
+        upper_s = dist.ppf(1 - tail)
+    x_vals = np.arange(int(lower_s), int(upper_s) + 1)
     pmf_vals = dist.pdf(x_vals)
 
-    sorted_idx = np.argsort(pmf_vals)[::-1]
-    sorted_vals = x_vals[sorted_idx]
-    sorted_pmf = pmf_vals[sorted_idx]
+    order = np.argsort(-pmf_vals, kind="stable")
+    idx = min(np.searchsorted(np.cumsum(pmf_vals[order]), mass), x_vals.size - 1)
+    selected = x_vals[order[: idx + 1]]
+    return selected.min(), selected.max()
 
-    total = 0.0
-    hdi_vals = []
-    for val, prob in zip(sorted_vals, sorted_pmf):
-        total += prob
-        hdi_vals.append(val)
-        if total >= mass:
-            break
 
-    return min(hdi_vals), max(hdi_vals)
+def unimodal_hdi(dist, mass, tol=1e-10, maxiter=100):
+    """Find the highest density interval of a unimodal continuous distribution.
+
+    The HDI is ``(ppf(p), ppf(p + mass))`` for the `p` at which the pdf at both ends is the
+    same, `p` is found by bisection for all the elements of `mass` and of the parameters of
+    `dist` at once.
+
+    Returns
+    -------
+    lower, upper : arrays
+    unimodal : boolean array
+        False where the density at the ends of the search interval suggests the distribution is
+        not unimodal, the interval is not valid there.
+    """
+    mass = np.asarray(mass, dtype=float)
+    mass = np.broadcast_to(mass, np.broadcast_shapes(mass.shape, dist._params_shape()))
+
+    def density_gap(p):
+        # positive if the density is larger at the lower end of the interval
+        with np.errstate(invalid="ignore"):
+            pdf_lower = dist.pdf(dist.ppf(p))
+            pdf_upper = dist.pdf(dist.ppf(p + mass))
+        return np.where(np.isnan(pdf_lower), 0, pdf_lower) - np.where(
+            np.isnan(pdf_upper), 0, pdf_upper
+        )
+
+    left = np.zeros(mass.shape)
+    right = 1 - mass
+    gap_left = density_gap(left)
+    gap_right = density_gap(right)
+
+    for _ in range(maxiter):
+        if np.all(right - left <= tol):
+            break
+        mid = (left + right) / 2
+        below = density_gap(mid) < 0
+        left = np.where(below, mid, left)
+        right = np.where(below, right, mid)
+
+    # decreasing densities start at the lower bound and increasing ones end at the upper bound,
+    # where the central interval has the same density at both ends it is the HDI, this also
+    # gives the central interval for flat densities, for which the bisection is not defined
+    prob = np.select(
+        [gap_left > 0, gap_right < 0, density_gap((1 - mass) / 2) == 0],
+        [0, 1 - mass, (1 - mass) / 2],
+        (left + right) / 2,
+    )
+    unimodal = ~((gap_left > 0) & (gap_right < 0))
+
+    lower = np.asarray(dist.ppf(prob))
+    upper = np.asarray(dist.ppf(prob + mass))
+    if lower.ndim == 0:
+        return lower[()], upper[()], unimodal[()]
+    return lower, upper, unimodal
+
+
+def _multimodal_hdi(dist, mass, lower, upper, unimodal):
+    """Recompute the HDI with the optimizer where `unimodal` is False."""
+    if np.ndim(unimodal) == 0:
+        return continuous_hdi(dist, mass)
+
+    shape = np.shape(unimodal)
+    lower = np.array(lower, dtype=float).reshape(shape)
+    upper = np.array(upper, dtype=float).reshape(shape)
+    masses = np.broadcast_to(mass, shape)
+    param_sets = dist._unpack_distribution()
+    param_shape = dist._params_shape()
+    for idx in zip(*np.nonzero(~unimodal)):
+        other = copy(dist)
+        if param_shape:
+            param_idx = [
+                pdx if size > 1 else 0
+                for pdx, size in zip(idx[len(shape) - len(param_shape) :], param_shape)
+            ]
+            other._parametrization(**param_sets[np.ravel_multi_index(param_idx, param_shape)])
+        lower[idx], upper[idx] = continuous_hdi(other, masses[idx])
+    return lower, upper
 
 
 def continuous_hdi(dist, mass):
@@ -413,25 +853,52 @@ def fit_to_epdf(selected_distributions, x_vals, epdf, mean, std, x_min, x_max, e
     return fitted.dist
 
 
-def fit_to_sample(selected_distributions, sample, x_min, x_max):
-    """Maximize the likelihood given a sample."""
+def fit_to_sample(selected_distributions, sample, x_min, x_max, weights=None, n_jobs=None):
+    """Maximize the likelihood given a sample, optionally with frequency weights.
+
+    The fit of each family, and of each row of two-dimensional samples, is an independent
+    task. With `n_jobs` the tasks run in a process pool, see :func:`map_fits`. Families that
+    can fit all the rows of a two-dimensional sample at once, see :func:`fit_rows`, are a
+    single task.
+    """
     fitted = Loss(len(selected_distributions))
-    for dist in selected_distributions:
+    tasks = []
+    owners = []
+    for idx, dist in enumerate(selected_distributions):
         if dist.__class__.__name__ in ["BetaScaled", "TruncatedNormal"]:
             update_bounds_beta_scaled(dist, x_min, x_max)
 
-        loss = np.inf
         if dist._check_endpoints(x_min, x_max, raise_error=False):
-            if sample.ndim > 1:
-                dists = []
-                neg_logpdf = 0
-                for s in sample:
-                    dist_i = copy(dist)
-                    dist_i._fit_mle(s)
-                    neg_logpdf += -dist_i.logpdf(s).sum()
-                    dists.append(dist_i)
+            if (
+                isinstance(sample, ChunkedSample)
+                or weights is not None
+                or sample.ndim == 1
+                or batches_rows(dist)
+            ):
+                tasks.append((dist, None))
+                owners.append(idx)
+            else:
+                for row in range(len(sample)):
+                    tasks.append((copy(dist), row))
+                    owners.append(idx)
+
+    results = map_fits(fit_task, tasks, sample, weights, n_jobs)
+
+    for idx, dist in enumerate(selected_distributions):
+        loss = np.inf
+        dist_results = [
+            (row, result) for (_, row), owner, result in zip(tasks, owners, results) if owner == idx
+        ]
+        if dist_results:
+            neg_logpdf = sum(result[1] for _, result in dist_results)
+            row, (fitted_dist, _) = dist_results[0]
+            if row is None:
+                # results computed in another process are copies
+                if fitted_dist is not dist:
+                    dist.__dict__.update(fitted_dist.__dict__)
+            else:
                 new_dict = {}
-                for d in dists:
+                for _, (d, _) in dist_results:
                     params = d.params_dict
                     for k, v in params.items():
                         if k in new_dict:
@@ -440,16 +907,113 @@ def fit_to_sample(selected_distributions, sample, x_min, x_max):
                             new_dict[k] = [v]
 
                 dist._parametrization(**{k: np.asarray(v) for k, v in new_dict.items()})
-            else:
-                dist._fit_mle(sample)
-                neg_logpdf = -dist.logpdf(sample).sum()
-            corr = get_penalization(sample.size, dist)
+            n_obs = sample.size if weights is None else np.sum(weights)
+            corr = get_penalization(n_obs, dist)
             loss = neg_logpdf + corr
         fitted.update(loss, dist)
 
     return fitted
 
 
+def fit_task(dist, row, sample, weights):
+    """Fit `dist` to `sample`, or to one of its rows, returning it and the negative loglik."""
+    if isinstance(sample, ChunkedSample):
+        fit_chunked(dist, sample)
+    elif weights is not None:
+        fit_weighted(dist, sample, weights)
+    elif row is None and sample.ndim == 2:
+        return dist, fit_rows(dist, sample)
+    else:
+        if row is not None:
+            sample = sample[row]
+        dist._fit_mle(sample)
+    return dist, -loglik(dist, sample, weights)
+
+
+def batches_rows(dist):
+    """Return True if `dist` fits all the rows of a two-dimensional sample at once."""
+    # the parameters of Categorical are vectors, a batch of them does not broadcast with x
+    return dist._suff_stats is not None and dist.__class__.__name__ != "Categorical"
+
+
+def fit_rows(dist, sample):
+    """Fit `dist` to each row of a two-dimensional sample, returning the negative loglik.
+
+    The parameters of `dist` become arrays, with one value per row. Families with sufficient
+    statistics compute them for all rows at once and fit them with vectorized closed forms or
+    solvers, without copying `dist` for each row. The rest are fitted row by row.
+    """
+    if batches_rows(dist):
+        with np.errstate(all="ignore"):
+            dist._fit_suff_stats(row_stats(sample, dist._suff_stats))
+        if all(np.all(np.isfinite(param)) for param in dist.params):
+            # parameters have one value per row, they broadcast with the transposed sample
+            return -np.sum(dist.logpdf(sample.T))
+
+    neg_logpdf = 0
+    new_dict = {}
+    for row in sample:
+        row_dist = copy(dist)
+        row_dist._fit_mle(row)
+        neg_logpdf -= loglik(row_dist, row)
+        for k, v in row_dist.params_dict.items():
+            new_dict.setdefault(k, []).append(v)
+    dist._parametrization(**{k: np.asarray(v) for k, v in new_dict.items()})
+    return neg_logpdf
+
+
+def fit_chunked(dist, sample):
+    """Maximize the likelihood of a sample read in chunks.
+
+    Families with sufficient statistics are fitted in a single pass, for the rest, and when the
+    sufficient statistics do not give a valid fit, the likelihood is evaluated chunk by chunk
+    at each step of the optimizer.
+    """
+    if dist._suff_stats is None or not _fit_streaming(dist, sample):
+        optimize_ml(dist, sample)
+
+
+def _fit_streaming(dist, chunks, weights=None):
+    """Fit `dist` from its sufficient statistics, return False if they do not give a fit.
+
+    Values at the boundary of the support, like zeros for the Gamma, make some statistics
+    infinite, the caller then falls back to the estimators used without sufficient statistics.
+    """
+    try:
+        for chunk in chunks:
+            dist.partial_fit(chunk, weights=weights)
+        dist.finalize()
+    except ValueError:
+        dist._stream_stats = None
+        return False
+    return True
+
+
+def fit_weighted(dist, sample, weights):
+    """Maximize the likelihood of a sample with frequency weights.
+
+    Families with sufficient statistics compute them from the weighted sample. For the rest,
+    and when the sufficient statistics do not give a valid fit, integer weights are counts and
+    the sample is expanded, so each family keeps its own ``_fit_mle``, while other weights make
+    each value contribute to the likelihood in proportion to its weight.
+    """
+    if dist._suff_stats is not None and _fit_streaming(dist, [sample], weights):
+        return
+    if np.all(weights == np.floor(weights)):
+        dist._fit_mle(np.repeat(sample, weights.astype(int)))
+    else:
+        optimize_ml(dist, sample, weights)
+
+
+def loglik(dist, sample, weights=None):
+    """Log-likelihood of `sample`, without materializing the logpdf of chunked samples."""
+    if isinstance(sample, ChunkedSample):
+        return sample.reduce(lambda chunk: dist.logpdf(chunk).sum())
+    if weights is not None:
+        return np.sum(dist.logpdf(sample) * weights)
+    return dist.logpdf(sample).sum()
+
+
 def fit_to_quartile(selected_distributions, q1, q2, q3, extra_pros):
     error = np.inf
     fitted_dist = None
@@ -466,7 +1030,11 @@ def fit_to_quartile(selected_distributions, q1, q2, q3, extra_pros):
         if distribution._check_endpoints(q1, q3, raise_error=False):
             none_idx, fixed = get_fixed_params(distribution)
 
-            distribution._fit_moments(mean=q2, sigma=(q3 - q1) / 1.35)
+            start = quartile_start(distribution, q1, q2, q3, none_idx)
+            if start is not None:
+                distribution._parametrization(**get_params(distribution, start, none_idx, fixed))
+            else:
+                distribution._fit_moments(mean=q2, sigma=(q3 - q1) / 1.35)
 
             optimize_quartile(distribution, (q1, q2, q3), none_idx, fixed)
 
@@ -584,45 +1152,118 @@ def find_discrete_mode(dist):
     return int(x_vals[np.argmax(pmf_vals)])
 
 
-def find_ppf(dist, q):
-    q = np.atleast_1d(q)
-    ppf = np.zeros_like(q)
+def find_ppf(dist, q, xtol=None, rtol=None, maxiter=100):
+    """
+    Numerically invert the cdf of `dist`, all the quantiles are solved at once.
+
+    The roots are first bracketed by geometric expansion, then refined with Newton steps,
+    falling back to bisection when a step leaves the bracket. For discrete distributions the
+    bisection is done over integers and returns the smallest value with ``cdf(x) >= q``.
+
+    Parameters
+    ----------
+    dist : PreliZ distribution
+    q : float or array-like
+        Quantiles.
+    xtol : float
+        Absolute tolerance. Defaults to None, which results in the value of
+        rcParams["stats.ppf_xtol"] being used.
+    rtol : float
+        Relative tolerance. Defaults to None, which results in the value of
+        rcParams["stats.ppf_rtol"] being used.
+    maxiter : int
+        Maximum number of refinement iterations.
+    """
+    if xtol is None:
+        xtol = rcParams["stats.ppf_xtol"]
+    if rtol is None:
+        rtol = rcParams["stats.ppf_rtol"]
+
+    q = np.atleast_1d(np.asarray(q, dtype=float))
+    ppf = np.full(q.shape, np.nan)
     lower, upper = dist.support
-    for idx, q_i in enumerate(q):
-        if q_i < 0:
-            ppf[idx] = np.nan
-        elif q_i > 1:
-            ppf[idx] = np.nan
-        elif q_i == 0:
-            if dist.kind == "discrete":
-                ppf[idx] = lower - 1
-            else:
-                ppf[idx] = lower
-        elif q_i == 1:
-            ppf[idx] = upper
-        elif dist.__class__.__name__ in ["HyperGeometric", "BetaBinomial"]:
-            ppf[idx] = _ppf_single(dist, q_i) + 1
-        else:
-            ppf[idx] = _ppf_single(dist, q_i)
-    return ppf[0] if len(ppf) == 1 else ppf
+    discrete = dist.kind == "discrete"
 
+    ppf[q == 0] = lower - 1 if discrete else lower
+    ppf[q == 1] = upper
 
-def _ppf_single(dist, q):
-    def func(x, dist, q):
-        return dist.cdf(x) - q
+    inside = (q > 0) & (q < 1)
+    if np.any(inside):
+        q_in = q[inside]
+        left, right = _bracket_ppf(dist, q_in, discrete)
+        if discrete:
+            ppf[inside] = _discrete_ppf(dist, q_in, left, right)
+        else:
+            ppf[inside] = _continuous_ppf(dist, q_in, left, right, xtol, rtol, maxiter)
 
-    factor = 10.0
-    left, right = dist.support
+    return ppf[0] if ppf.size == 1 else ppf
 
-    left = min(-factor, right)
-    while func(left, dist, q) > 0.0:
-        left, right = left * factor, left
 
-    right = max(factor, left)
-    while func(right, dist, q) < 0.0:
-        left, right = right, right * factor
+def _bracket_ppf(dist, q, discrete, factor=10.0, maxiter=300):
+    """Find `left` and `right` such that ``cdf(left) < q <= cdf(right)``."""
+    lower, upper = dist.support
 
-    return brentq(func, left, right, args=(dist, q))
+    if np.isfinite(lower):
+        left = np.full(q.shape, lower - 1 if discrete else lower, dtype=float)
+    else:
+        left = np.full(q.shape, min(-factor, upper), dtype=float)
+        for _ in range(maxiter):
+            outside = dist.cdf(left) >= q
+            if not np.any(outside):
+                break
+            left = np.where(outside, left * factor, left)
+
+    if np.isfinite(upper):
+        right = np.full(q.shape, upper, dtype=float)
+    else:
+        right = np.full(q.shape, max(factor, np.max(left)), dtype=float)
+        for _ in range(maxiter):
+            outside = dist.cdf(right) < q
+            if not np.any(outside):
+                break
+            right = np.where(outside, right * factor, right)
+
+    return left, right
+
+
+def _discrete_ppf(dist, q, left, right):
+    left = np.floor(left)
+    right = np.ceil(right)
+    active = right - left > 1
+    while np.any(active):
+        idx = np.flatnonzero(active)
+        mid = np.floor((left[idx] + right[idx]) / 2)
+        above = dist.cdf(mid) >= q[idx]
+        right[idx] = np.where(above, mid, right[idx])
+        left[idx] = np.where(above, left[idx], mid)
+        active[idx] = right[idx] - left[idx] > 1
+    return right
+
+
+def _continuous_ppf(dist, q, left, right, xtol, rtol, maxiter):
+    x = (left + right) / 2
+    active = np.ones(q.shape, dtype=bool)
+    for _ in range(maxiter):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        x_a = x[idx]
+        diff = dist.cdf(x_a) - q[idx]
+        below = diff < 0
+        left[idx] = np.where(below, x_a, left[idx])
+        right[idx] = np.where(below, right[idx], x_a)
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            x_new = x_a - diff / dist.pdf(x_a)
+        bisect = ~np.isfinite(x_new) | (x_new <= left[idx]) | (x_new >= right[idx])
+        x_new = np.where(bisect, (left[idx] + right[idx]) / 2, x_new)
+
+        tol = xtol + rtol * np.abs(x_new)
+        done = (diff == 0) | (np.abs(x_new - x_a) <= tol) | (right[idx] - left[idx] <= tol)
+        x[idx] = np.where(diff == 0, x_a, x_new)
+        active[idx[done]] = False
+
+    return x
 
 
 def get_weighted_rvs(target, size, rng):
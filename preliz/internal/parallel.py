@@ -0,0 +1,100 @@
+"""Process pool used to fit several families, or the rows of a sample, in parallel.
+
+The sample (and the weights) are copied once to shared memory, workers attach to it instead of
+receiving a copy with each task. Distributions are sent to the workers, and back, by pickling
+them. Workers use the rcParams of the parent process. Each worker compiles the functions it needs,
+so enabling ``rcParams["compile.cache"]`` reduces the start-up cost. Workers are started with
+"spawn", forking a process that already runs threads, like the ones of BLAS, can deadlock.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing import get_context, resource_tracker, shared_memory
+
+import numpy as np
+
+from preliz.internal.rcparams import rcParams
+
+_WORKER_DATA = {}
+
+
+def map_fits(func, tasks, sample, weights=None, n_jobs=None):
+    """Return ``[func(*task, sample, weights) for task in tasks]``, using `n_jobs` processes.
+
+    Parameters
+    ----------
+    func : callable
+        Module level function, so it can be pickled.
+    tasks : list of tuples
+        Arguments of `func` specific to each task.
+    sample : array or ChunkedSample
+        Sample shared by all tasks. Samples that can not be placed in shared memory, like
+        samples read in chunks, are fitted sequentially.
+    weights : array, optional
+    n_jobs : int, optional
+        Number of processes. Defaults to None, i.e. run sequentially. Use -1 for one process
+        per CPU.
+    """
+    n_workers = _n_workers(n_jobs, len(tasks))
+    shareable = isinstance(sample, np.ndarray) and not sample.dtype.hasobject
+    if n_workers == 1 or not shareable:
+        return [func(*task, sample, weights) for task in tasks]
+
+    with ExitStack() as stack:
+        sample_ref = _to_shared(stack, sample)
+        weights_ref = None if weights is None else _to_shared(stack, np.asarray(weights))
+        executor = stack.enter_context(
+            ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(sample_ref, weights_ref, dict(rcParams)),
+            )
+        )
+        return list(executor.map(_run_task, [func] * len(tasks), tasks))
+
+
+def _n_workers(n_jobs, n_tasks):
+    if n_jobs is None:
+        return 1
+    if not isinstance(n_jobs, int | np.integer) or n_jobs == 0 or n_jobs < -1:
+        raise ValueError("n_jobs must be a positive integer, -1 or None")
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    return max(1, min(n_jobs, n_tasks))
+
+
+def _to_shared(stack, array):
+    """Copy `array` to a shared memory block, released when `stack` is closed."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    stack.callback(shm.unlink)
+    stack.callback(shm.close)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm.name, array.shape, array.dtype.str
+
+
+def _from_shared(ref):
+    name, shape, dtype = ref
+    try:
+        # the parent process owns the block, workers should not unlink it at exit
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # track was added in Python 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        # a resource tracker started by the worker would unlink the block when the worker exits,
+        # the tracker inherited from the parent is left alone, its entry belongs to the parent
+        if resource_tracker._resource_tracker._pid is not None:
+            resource_tracker.unregister(shm._name, "shared_memory")
+    # keep a reference, the array is only valid while the block is open
+    _WORKER_DATA.setdefault("blocks", []).append(shm)
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(sample_ref, weights_ref, params):
+    rcParams.update(params)
+    _WORKER_DATA["sample"] = _from_shared(sample_ref)
+    _WORKER_DATA["weights"] = None if weights_ref is None else _from_shared(weights_ref)
+
+
+def _run_task(func, task):
+    return func(*task, _WORKER_DATA["sample"], _WORKER_DATA["weights"])
@@ -20,10 +20,17 @@ import matplotlib.pyplot as plt
 import numpy as np
 from arviz_stats.base import array_stats
 from matplotlib import _pylab_helpers, get_backend
+from matplotlib import rcParams as mpl_rcParams
 from matplotlib.ticker import MaxNLocator
 
 from preliz.internal.rcparams import rcParams
 
+# Matplotlib is set up the first time a plot is made, not when PreliZ is imported. PreliZ's
+# styles are added to matplotlib's styles by preliz.internal.mpl_styles.
+
+# Allow legend outside plot in maxent to be included in the saved figure
+mpl_rcParams["savefig.bbox"] = "tight"
+
 
 def plot_pointinterval(distribution, interval=None, levels=None, rotated=False, ax=None):
     """
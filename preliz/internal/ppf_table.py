@@ -0,0 +1,111 @@
+"""Tabulated inverse of the cdf, used to speed-up ``ppf`` and ``rvs`` of modified distributions.
+
+The table is built once per frozen distribution and cached on the instance, keyed on the
+parameters of the distribution and of the distribution it modifies. For continuous
+distributions the nodes are refined until, halfway between each pair of nodes in probability,
+the interpolated ppf differs from the exact one less than ``rcParams["stats.ppf_table_tol"]``
+times the larger of the interquartile range and the absolute value of the ppf. If that needs
+more than ``MAX_POINTS`` nodes the exact ppf is used, with a warning. For discrete
+distributions the table holds the exact cdf at every integer, so there is no approximation
+error. Quantiles in the tails, outside the table, use the exact ``ppf``.
+
+The table is disabled by default, use ``rcParams["stats.ppf_table"] = True`` to enable it.
+"""
+
+import warnings
+
+import numpy as np
+
+from preliz.internal.distribution_helper import params_key
+from preliz.internal.rcparams import rcParams
+
+TAIL = 1e-6
+INITIAL_POINTS = 257
+MAX_POINTS = 2**20
+
+
+def tabulated_ppf(dist, q, exact_ppf):
+    """Evaluate the ppf of `dist` by interpolation, falling back to `exact_ppf` in the tails."""
+    q = np.asarray(q, dtype=float)
+    table = _get_table(dist, exact_ppf)
+    if table is None:
+        return exact_ppf(q)
+
+    x_nodes, cdf_nodes = table
+    if dist.kind == "discrete":
+        inside = (q > cdf_nodes[0]) & (q <= cdf_nodes[-1])
+        vals = x_nodes[np.searchsorted(cdf_nodes, np.where(inside, q, cdf_nodes[-1]))]
+    else:
+        inside = (q >= cdf_nodes[0]) & (q <= cdf_nodes[-1])
+        vals = np.interp(q, cdf_nodes, x_nodes)
+
+    if not np.all(inside):
+        vals = np.array(vals, dtype=float)
+        vals[~inside] = exact_ppf(q[~inside])
+    return vals
+
+
+def _get_table(dist, exact_ppf):
+    tol = rcParams["stats.ppf_table_tol"]
+    key = (params_key(dist), tol)
+    cached = getattr(dist, "_ppf_table", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    if dist.kind == "discrete":
+        table = _discrete_table(dist, exact_ppf)
+    else:
+        table = _continuous_table(dist, exact_ppf, tol)
+    dist._ppf_table = (key, table)
+    return table
+
+
+def _discrete_table(dist, exact_ppf):
+    lower, upper = exact_ppf(np.array([TAIL, 1 - TAIL]))
+    if upper - lower + 2 > MAX_POINTS:
+        return None
+    x_nodes = np.arange(lower - 1, upper + 1)
+    return x_nodes, np.maximum.accumulate(dist.cdf(x_nodes))
+
+
+def _continuous_table(dist, exact_ppf, tol):
+    x_nodes = exact_ppf(np.linspace(TAIL, 1 - TAIL, INITIAL_POINTS))
+    x_nodes = np.unique(x_nodes[np.isfinite(x_nodes)])
+    if x_nodes.size < 2:
+        return None
+    cdf_nodes = dist.cdf(x_nodes)
+    lower_q, upper_q = exact_ppf(np.array([0.25, 0.75]))
+    scale = upper_q - lower_q if upper_q > lower_q else x_nodes[-1] - x_nodes[0]
+
+    while True:
+        # between two nodes the interpolated ppf at the mean of their cdf values is the mean
+        # of their values, the nodes are split where it differs from the exact ppf. The error
+        # is never larger than the distance between the nodes, closer nodes are not split, as
+        # where the cdf is almost flat rounding errors can put the exact ppf outside them
+        x_mid = (x_nodes[:-1] + x_nodes[1:]) / 2
+        x_exact = exact_ppf((cdf_nodes[:-1] + cdf_nodes[1:]) / 2)
+        x_tol = tol * np.maximum(scale, np.abs(x_exact))
+        refine = (
+            (cdf_nodes[1:] > cdf_nodes[:-1])
+            & (np.diff(x_nodes) > x_tol)
+            & (np.abs(x_mid - x_exact) > x_tol)
+        )
+        if not np.any(refine):
+            break
+        if x_nodes.size + np.count_nonzero(refine) > MAX_POINTS:
+            warnings.warn(
+                f"The ppf table of {dist.__class__.__name__} needs more than {MAX_POINTS} "
+                "nodes to reach rcParams['stats.ppf_table_tol'], using the exact ppf instead"
+            )
+            return None
+        x_nodes = np.concatenate([x_nodes, x_mid[refine]])
+        cdf_nodes = np.concatenate([cdf_nodes, dist.cdf(x_mid[refine])])
+        order = np.argsort(x_nodes)
+        x_nodes = x_nodes[order]
+        cdf_nodes = cdf_nodes[order]
+
+    # interpolation needs increasing cdf values, in flat regions keep the last node
+    cdf_nodes = np.maximum.accumulate(cdf_nodes)
+    _, last = np.unique(cdf_nodes[::-1], return_index=True)
+    keep = np.sort(cdf_nodes.size - 1 - last)
+    return x_nodes[keep], cdf_nodes[keep]
@@ -0,0 +1,150 @@
+"""Numerical integration of expectations for distributions without closed-form moments.
+
+Expectations ``E[g(X)]`` of continuous distributions are computed in quantile space,
+``E[g(X)] = ∫ g(ppf(u)) du`` over (0, 1), with the tanh-sinh rule. The rule concentrates nodes
+close to 0 and 1, so heavy tails and point masses (as in Censored or Hurdle distributions) are
+handled without a grid over the support. The step is halved, reusing the previous nodes, until
+two consecutive estimates agree within ``rcParams["stats.quad_tol"]``. For discrete
+distributions the expectations are sums over the support, truncated at the ``TAIL`` quantiles
+when the support is unbounded.
+
+Several expectations are computed from the same evaluations of the distribution, for example
+:func:`moments` returns the mean, variance, skewness and kurtosis at once.
+"""
+
+import numpy as np
+
+from preliz.internal.rcparams import rcParams
+
+T_MAX = 3.1  # the smallest quantile is ~1e-15, so 1 - u is still representable
+MIN_LEVEL = 3
+MAX_LEVEL = 10
+TAIL = 1e-12
+MAX_DISCRETE_POINTS = 2**22
+
+
+def integrate(dist, func, tol=None):
+    """
+    Approximate ``E[func(X)]``, with ``X`` distributed as `dist`.
+
+    Parameters
+    ----------
+    dist : PreliZ distribution
+    func : callable
+        Function of the values of `dist`. It can return an array with the values of several
+        integrands stacked along the first axis.
+    tol : float
+        Tolerance. Defaults to None, which results in the value of rcParams["stats.quad_tol"]
+        being used.
+
+    Returns
+    -------
+    value : float or array
+    error : float
+        Estimated absolute error. For discrete distributions this is the largest contribution
+        of the truncated tails, estimated with their probability.
+    """
+    if tol is None:
+        tol = rcParams["stats.quad_tol"]
+
+    if dist.kind == "discrete":
+        x_vals, weights, error = _discrete_nodes(dist)
+        if x_vals is not None:
+            return _weighted_sum(func(x_vals), weights), error
+
+    return _tanh_sinh(dist, func, tol)
+
+
+def moments(dist, tol=None):
+    """Return the mean, variance, skewness and excess kurtosis of `dist`."""
+    # integrating around a value close to the mean reduces cancellation errors
+    center = np.asarray(dist.ppf(0.5), dtype=float)
+    if not np.isfinite(center):
+        center = 0.0
+
+    def powers(x):
+        dev = x - center
+        return np.stack([dev, dev**2, dev**3, dev**4])
+
+    raw, _ = integrate(dist, powers, tol)
+    return raw_to_moments(raw, center)
+
+
+def raw_to_moments(raw, loc=0.0, scale=1.0):
+    """Return the mean, variance, skewness and excess kurtosis of ``loc + scale * Z``.
+
+    `raw` holds the first four raw moments of ``Z``, stacked along the first axis.
+    """
+    raw1, raw2, raw3, raw4 = raw
+    var = raw2 - raw1**2
+    mu3 = raw3 - 3 * raw1 * raw2 + 2 * raw1**3
+    mu4 = raw4 - 4 * raw1 * raw3 + 6 * raw1**2 * raw2 - 3 * raw1**4
+    return loc + scale * raw1, scale**2 * var, mu3 / var**1.5, mu4 / var**2 - 3
+
+
+def entropy(dist, tol=None):
+    """Return the entropy of `dist`, computed from its logpdf."""
+
+    def neg_logpdf(x):
+        logpdf = dist.logpdf(x)
+        return np.where(np.isfinite(logpdf), -logpdf, 0.0)
+
+    value, _ = integrate(dist, neg_logpdf, tol)
+    return value
+
+
+def _weighted_sum(values, weights):
+    values = np.where(weights > 0, values, 0.0)
+    return np.sum(values * weights, axis=-1)
+
+
+def _discrete_nodes(dist):
+    lower, upper = dist.support
+    error = 0.0
+    if not np.isfinite(lower):
+        lower = dist.ppf(TAIL)
+        error += TAIL
+    if not np.isfinite(upper):
+        upper = dist.ppf(1 - TAIL)
+        error += TAIL
+    if upper - lower >= MAX_DISCRETE_POINTS:
+        return None, None, None
+
+    x_vals = np.arange(int(lower), int(upper) + 1)
+    return x_vals, np.nan_to_num(dist.pdf(x_vals)), error
+
+
+def _tanh_sinh_nodes(level):
+    """Nodes of level `level` not present in the previous levels, with their weights."""
+    step = 2.0**-level
+    if level == 0:
+        t_vals = np.arange(-np.floor(T_MAX), np.floor(T_MAX) + 1)
+    else:
+        t_vals = np.arange(step, T_MAX, 2 * step)
+        t_vals = np.concatenate([-t_vals[::-1], t_vals])
+    sinh_t = np.pi * np.sinh(t_vals)
+    u_vals = 1 / (1 + np.exp(-sinh_t))
+    weights = np.pi / 4 * np.cosh(t_vals) / np.cosh(sinh_t / 2) ** 2
+    return u_vals, weights
+
+
+def _tanh_sinh(dist, func, tol):
+    total = 0.0
+    previous = None
+    error = np.inf
+    for level in range(MAX_LEVEL + 1):
+        u_vals, weights = _tanh_sinh_nodes(level)
+        x_vals = np.asarray(dist.ppf(u_vals), dtype=float)
+        finite = np.isfinite(x_vals)
+        with np.errstate(all="ignore"):
+            values = func(np.where(finite, x_vals, 0.0))
+        total = total + _weighted_sum(values, np.where(finite, weights, 0.0))
+        estimate = total * 2.0**-level
+
+        if previous is not None:
+            error = np.max(np.abs(estimate - previous))
+            if level >= MIN_LEVEL and error <= tol * max(1.0, np.max(np.abs(estimate))):
+                break
+        previous = estimate
+
+    return estimate, error
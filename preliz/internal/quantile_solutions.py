@@ -0,0 +1,246 @@
+"""Quantile matching for many problems at once.
+
+:func:`solve_quantiles_batch` solves the problems of :func:`preliz.quartile_batch` and
+:func:`preliz.match_quantiles_batch`, with closed-form solutions when there is one, and with a
+vectorized least squares solver otherwise.
+
+The quantiles of a location-scale family are ``loc + scale * z``, with ``z`` the quantiles of
+the standardized distribution, so the parameters minimizing the squared differences between
+the quantiles and the targets, the objective of :func:`preliz.match_quantiles`, are the
+coefficients of a linear regression of the targets on ``z``. For scale families the regression
+goes through the origin.
+
+Each entry of ``QUANTILE_SOLUTIONS`` maps the name of a distribution to a list of solvers. A
+solver takes the quantiles and an array of targets, with one problem per row, and returns the
+values of the free parameters (in the order given by ``none_idx``), with one row per problem and
+nan for problems without a valid solution, or None if it does not apply, for example because the
+wrong parameters are fixed.
+"""
+
+from copy import copy
+
+import numpy as np
+from scipy.optimize import OptimizeResult
+from scipy.special import ndtri
+
+from preliz.internal.maxent_solutions import _free_names, _standard_ppf
+from preliz.internal.optimization import (
+    fit_moments_starts,
+    get_fixed_params,
+    get_params,
+    optimize_batch,
+    optimize_quantiles,
+    optimize_quartile,
+)
+from preliz.internal.solution_atlas import quartile_starts
+
+QUARTILES = np.array([0.25, 0.5, 0.75])
+
+
+def _to_matrix(dist, none_idx, values):
+    return np.column_stack([values[name] for name in _free_names(dist, none_idx)]).astype(float)
+
+
+def _location_scale(loc, scale):
+    """Solver for location-scale families, a linear regression of the targets."""
+
+    def solver(dist, quantiles, targets, none_idx, fixed):
+        if sorted(_free_names(dist, none_idx)) != sorted([loc, scale]) or len(quantiles) < 2:
+            return None
+        z = _standard_ppf(dist, none_idx, fixed, {loc: 0.0, scale: 1.0}, quantiles)
+        z_centered = z - z.mean()
+        slope = (targets - targets.mean(axis=1, keepdims=True)) @ z_centered
+        slope /= z_centered @ z_centered
+        intercept = targets.mean(axis=1) - slope * z.mean()
+        slope = np.where(slope > 0, slope, np.nan)
+        return _to_matrix(dist, none_idx, {loc: intercept, scale: slope})
+
+    return solver
+
+
+def _scale(name, rate=False):
+    """Solver for scale (or rate) families, a linear regression through the origin."""
+
+    def solver(dist, quantiles, targets, none_idx, fixed):
+        if _free_names(dist, none_idx) != [name]:
+            return None
+        z = _standard_ppf(dist, none_idx, fixed, {name: 1.0}, quantiles)
+        slope = targets @ z / (z @ z)
+        slope = np.where(slope > 0, slope, np.nan)
+        return _to_matrix(dist, none_idx, {name: 1 / slope if rate else slope})
+
+    return solver
+
+
+def _uniform(dist, quantiles, targets, none_idx, fixed):
+    """Solver for the Uniform distribution, the quantiles are ``lower + (upper - lower) * q``."""
+    if _free_names(dist, none_idx) != ["lower", "upper"] or len(quantiles) < 2:
+        return None
+    lower, upper = _location_scale("lower", "upper")(dist, quantiles, targets, none_idx, fixed).T
+    return np.column_stack([lower, lower + upper])
+
+
+QUANTILE_SOLUTIONS = {
+    "AsymmetricLaplace": [_location_scale("mu", "b")],
+    "Cauchy": [_location_scale("alpha", "beta")],
+    "Exponential": [_scale("lam", rate=True), _scale("scale")],
+    "Gamma": [_scale("beta", rate=True)],
+    "Gumbel": [_location_scale("mu", "beta")],
+    "HalfCauchy": [_scale("beta")],
+    "HalfNormal": [_scale("sigma")],
+    "HalfStudentT": [_scale("sigma")],
+    "Laplace": [_location_scale("mu", "b")],
+    "Logistic": [_location_scale("mu", "s")],
+    "Moyal": [_location_scale("mu", "sigma")],
+    "Normal": [_location_scale("mu", "sigma")],
+    "SkewNormal": [_location_scale("mu", "sigma")],
+    "StudentT": [_location_scale("mu", "sigma")],
+    "Uniform": [_uniform],
+    "Weibull": [_scale("beta")],
+}
+
+
+def quantiles_closed_form(dist, quantiles, targets, none_idx, fixed):
+    """Solve quantile matching problems in closed form if a solution is registered for `dist`.
+
+    Parameters
+    ----------
+    quantiles : array
+        Quantiles to match, shared by all the problems.
+    targets : array
+        Values of the quantiles, with one problem per row.
+
+    Returns
+    -------
+    array or None
+        None if no solution applies, otherwise the values of the free parameters, with one row
+        per problem and nan for problems without a valid solution. `dist` is left with the
+        parameters of the standardized distribution.
+    """
+    for solver in QUANTILE_SOLUTIONS.get(dist.__class__.__name__, []):
+        with np.errstate(all="ignore"):
+            x = solver(dist, quantiles, targets, none_idx, fixed)
+        if x is not None:
+            return x
+    return None
+
+
+def solve_quantiles_batch(dist, quantiles, targets, method):
+    """Match the quantiles of `dist` to each row of `targets`.
+
+    Parameters
+    ----------
+    quantiles : array
+        Quantiles to match, shared by all the problems.
+    targets : array
+        Values of the quantiles, with one problem per row.
+    method : str
+        "cdf" minimizes the differences between the cdf at the targets and the quantiles, like
+        :func:`preliz.quartile`. "ppf" minimizes the differences between the ppf at the
+        quantiles and the targets, like :func:`preliz.match_quantiles`.
+
+    Returns
+    -------
+    x : array
+        Values of the free parameters, with one row per problem.
+    opts : list
+        OptimizeResult of each problem.
+    """
+    none_idx, fixed = get_fixed_params(dist)
+    n_problems = len(targets)
+
+    # closed-form solutions are exact for "ppf", and good starting points for "cdf"
+    x = quantiles_closed_form(dist, quantiles, targets, none_idx, fixed)
+    if x is None:
+        x = np.full((n_problems, len(none_idx)), np.nan)
+    closed = np.all(np.isfinite(x), axis=1)
+
+    missing = ~closed
+    if np.any(missing) and np.array_equal(quantiles, QUARTILES):
+        x[missing] = quartile_starts(dist, *targets[missing].T, none_idx)
+        missing = ~np.all(np.isfinite(x), axis=1)
+    if np.any(missing):
+        x[missing] = _moments_starts(dist, quantiles, targets[missing], none_idx)
+
+    solve = ~closed if method == "ppf" else np.ones(n_problems, dtype=bool)
+    cost = np.zeros(n_problems)
+    nit = np.zeros(n_problems, dtype=int)
+    failed = np.zeros(n_problems, dtype=bool)
+    if np.any(solve):
+        sub_targets = targets[solve]
+        max_iter = 100
+        x[solve], cost[solve], nit[solve] = optimize_batch(
+            dist,
+            lambda rows: _residuals(dist, quantiles, sub_targets[rows], method),
+            x[solve],
+            none_idx,
+            fixed,
+            max_iter=max_iter,
+        )
+        failed[solve] = ~np.isfinite(cost[solve]) | (nit[solve] >= max_iter)
+
+    # problems the batched solver could not solve are solved one by one, as the
+    # non-batched functions would do
+    for idx in np.flatnonzero(failed):
+        row_dist = copy(dist)
+        row_dist._parametrization(**get_params(row_dist, x[idx], none_idx, fixed))
+        if not np.all(np.isfinite(row_dist.params)):
+            row_dist._parametrization(
+                **get_params(
+                    row_dist,
+                    _moments_starts(row_dist, quantiles, targets[idx : idx + 1], none_idx)[0],
+                    none_idx,
+                    fixed,
+                )
+            )
+        with np.errstate(all="ignore"):
+            if method == "cdf":
+                opt = optimize_quartile(row_dist, targets[idx], none_idx, fixed)
+                row_cost = np.sum(opt.fun**2)
+            else:
+                opt = optimize_quantiles(row_dist, quantiles, targets[idx], none_idx, fixed)
+                row_cost = opt.fun
+        if np.isfinite(row_cost) and not row_cost >= cost[idx]:
+            x[idx] = opt.x
+            cost[idx] = row_cost
+            nit[idx] += opt.nit if "nit" in opt else opt.nfev
+            failed[idx] = False
+
+    dist._parametrization(**get_params(dist, list(x.T), none_idx, fixed))
+    with np.errstate(all="ignore"):
+        cost = np.sum(_residuals(dist, quantiles, targets, method) ** 2, axis=0)
+
+    opts = [
+        OptimizeResult(
+            x=x[idx],
+            fun=cost[idx],
+            success=not failed[idx],
+            nit=nit[idx],
+            message="Closed-form solution" if closed[idx] and not solve[idx] else "",
+        )
+        for idx in range(n_problems)
+    ]
+    return x, opts
+
+
+def _residuals(dist, quantiles, targets, method):
+    """Residuals of the problems in the rows of `targets`, with one column per problem."""
+    if method == "cdf":
+        return dist.cdf(targets.T) - quantiles[:, None]
+    return dist.ppf(quantiles[:, None]) - targets.T
+
+
+def _moments_starts(dist, quantiles, targets, none_idx):
+    """Start by matching the mean and standard deviation of a Normal with similar quantiles."""
+    if len(quantiles) > 1:
+        z = ndtri(quantiles)
+        z_centered = z - z.mean()
+        sigma = (targets - targets.mean(axis=1, keepdims=True)) @ z_centered
+        sigma /= z_centered @ z_centered
+        mean = targets.mean(axis=1) - sigma * z.mean()
+        sigma = np.where(sigma > 0, sigma, np.ptp(targets, axis=1) + 1)
+    else:
+        mean = targets[:, 0]
+        sigma = np.ones(len(targets))
+
+    return fit_moments_starts(dist, mean, sigma, none_idx)
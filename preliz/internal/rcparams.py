@@ -65,6 +65,32 @@ def _validate_probability(value):
     return value
 
 
+def _validate_positive_float(value):
+    """Validate value is a positive float."""
+    value = _validate_float(value)
+    if value <= 0:
+        raise ValueError("Only positive values are valid.")
+    return value
+
+
+def _validate_positive_int(value):
+    """Validate value is a positive integer."""
+    try:
+        value = int(value)
+    except ValueError as err:
+        raise ValueError("Could not convert to int") from err
+    if value <= 0:
+        raise ValueError("Only positive values are valid.")
+    return value
+
+
+def _validate_path(value):
+    """Validate value is a path or None."""
+    if value is None or isinstance(value, str) and value.lower() == "none":
+        return None
+    return os.path.expanduser(str(value))
+
+
 def _validate_boolean(value):
     """Validate value is a float."""
     if isinstance(value, str):
@@ -98,7 +124,17 @@ def make_iterable_validator(scalar_validator, length=None, allow_none=False, all
 defaultParams = {
     "stats.ci_kind": ("eti", _make_validate_choice({"eti", "hdi"})),
     "stats.ci_prob": (0.89, _validate_probability),
+    "stats.ppf_xtol": (2e-12, _validate_positive_float),
+    "stats.ppf_rtol": (8.9e-16, _validate_positive_float),
+    "stats.ppf_table": (False, _validate_boolean),
+    "stats.ppf_table_tol": (1e-8, _validate_positive_float),
+    "stats.quad_tol": (1e-8, _validate_positive_float),
+    "stats.cache": (True, _validate_boolean),
+    "stats.chunk_size": (2**20, _validate_positive_int),
     "plots.show_plot": (True, _validate_boolean),
+    "compile.cache": (False, _validate_boolean),
+    "compile.cache_dir": (None, _validate_path),
+    "compile.cache_max_mb": (1024.0, _validate_positive_float),
 }
 
 
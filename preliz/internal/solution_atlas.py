@@ -0,0 +1,302 @@
+"""Tabulated solutions of ``maxent`` and ``quartile``, used as starting points.
+
+For some families the solution only depends on a few standardized quantities, so it can be
+computed once on a grid and interpolated:
+
+- Families with a shape and a scale parameter, and support on the positive reals. Multiplying
+  the constraints by a constant multiplies the scale of the solution by the same constant. The
+  maxent solution depends on ``lower / upper`` and the mass, the quartile solution on
+  ``q1 / q3`` and ``(q2 - q1) / (q3 - q1)``.
+- Location-scale families. The maxent solution depends only on the mass, the quartile solution
+  on ``(q2 - q1) / (q3 - q1)``.
+
+The tables hold the solution of the standardized problems, with ``upper = 1`` and ``q3 = 1``
+(and ``lower = 0`` and ``q1 = 0`` for location-scale families), as the log of the shape, or the
+location, and the log of the scale. They are shipped in ``solution_atlas.npz``, in single
+precision, and are generated with :func:`build_atlas`, which must be run again after changing
+the grids, the families or their optimizers. From the root of the repository, in the
+development environment of ``environment-dev.yml``, run::
+
+    python -m preliz.internal.solution_atlas
+
+The interpolated values are starting points for the optimizers, close enough to the solution
+that a single start is enough. Problems outside the grids, problems with fixed parameters and
+families with a different parametrization are not tabulated.
+"""
+
+import os
+from functools import cache
+
+import numpy as np
+from scipy.interpolate import interpn
+
+ATLAS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solution_atlas.npz")
+
+MAXENT_RATIOS = np.linspace(0, 0.9, 37)
+MASSES = np.linspace(0.05, 0.99, 48)
+QUARTILE_RATIOS = np.linspace(0.025, 0.9, 36)
+QUARTILE_POSITIONS = np.linspace(0.05, 0.95, 37)
+
+
+def _identity(first, second):
+    return first, second
+
+
+# kind, parameter names, and the conversions from the shape (or location) and scale to the
+# parameters and back
+FAMILIES = {
+    "Gamma": ("scale", ("alpha", "beta"), lambda k, s: (k, 1 / s), lambda a, b: (a, 1 / b)),
+    "InverseGamma": ("scale", ("alpha", "beta"), _identity, _identity),
+    "LogNormal": (
+        "scale",
+        ("mu", "sigma"),
+        lambda k, s: (np.log(s), k),
+        lambda mu, sigma: (sigma, np.exp(mu)),
+    ),
+    "Weibull": ("scale", ("alpha", "beta"), _identity, _identity),
+    "Gumbel": ("location", ("mu", "beta"), _identity, _identity),
+    "Moyal": ("location", ("mu", "sigma"), _identity, _identity),
+}
+
+
+def maxent_start(dist, lower, upper, mass, none_idx):
+    """Tabulated maxent solution, as the values of the free parameters, or None."""
+    family = _family(dist, none_idx)
+    if family is None:
+        return None
+    if family[0] == "scale":
+        if not 0 <= lower < upper:
+            return None
+        ratio = lower / upper
+        # the problem with lower = 0 is not the limit of the problems with lower > 0, so there
+        # is nothing to interpolate between the first two rows
+        if 0 < ratio < MAXENT_RATIOS[1]:
+            return None
+        return _lookup("maxent", dist, (ratio, mass), 0, upper)
+    return _lookup("maxent", dist, (mass,), lower, upper - lower)
+
+
+def quartile_start(dist, q1, q2, q3, none_idx):
+    """Tabulated quartile solution, as the values of the free parameters, or None."""
+    family = _family(dist, none_idx)
+    if family is None or not q1 < q2 < q3:
+        return None
+    position = (q2 - q1) / (q3 - q1)
+    if family[0] == "scale":
+        if q1 < 0:
+            return None
+        return _lookup("quartile", dist, (q1 / q3, position), 0, q3)
+    return _lookup("quartile", dist, (position,), q1, q3 - q1)
+
+
+def quartile_starts(dist, q1, q2, q3, none_idx):
+    """Tabulated quartile solutions for arrays of quartiles.
+
+    Returns
+    -------
+    array
+        Values of the free parameters, one row per problem, nan for problems without a
+        tabulated solution.
+    """
+    q1, q2, q3 = (np.asarray(q, dtype=float) for q in (q1, q2, q3))
+    starts = np.full((len(q1), len(none_idx)), np.nan)
+    family = _family(dist, none_idx)
+    if family is None:
+        return starts
+
+    name = dist.__class__.__name__
+    valid = (q1 < q2) & (q2 < q3)
+    with np.errstate(all="ignore"):
+        position = (q2 - q1) / (q3 - q1)
+        if family[0] == "scale":
+            valid &= q1 >= 0
+            points, shift, scale = np.column_stack([q1 / q3, position]), 0, q3
+        else:
+            points, shift, scale = position[:, None], q1, q3 - q1
+        values = _lookup_many("quartile", name, np.where(valid[:, None], points, np.nan))
+        if values is not None:
+            starts = _shift_scale(name, values, shift, scale)
+    return starts
+
+
+def grid(problem, name):
+    """Axes of the grid of `problem` ("maxent" or "quartile") for the family `name`."""
+    if FAMILIES[name][0] == "scale":
+        if problem == "maxent":
+            return (MAXENT_RATIOS, MASSES)
+        return (QUARTILE_RATIOS, QUARTILE_POSITIONS)
+    if problem == "maxent":
+        return (MASSES,)
+    return (QUARTILE_POSITIONS,)
+
+
+def standard_problem(problem, name, point):
+    """Constraints of the standardized problem at `point` of the grid."""
+    if problem == "maxent":
+        if FAMILIES[name][0] == "scale":
+            ratio, mass = point
+            return ratio, 1.0, mass
+        return 0.0, 1.0, point[0]
+    if FAMILIES[name][0] == "scale":
+        ratio, position = point
+        return ratio, ratio + position * (1 - ratio), 1.0
+    return 0.0, point[0], 1.0
+
+
+def build_atlas(path=None):
+    """Solve the standardized problems on the grids and save the tables to `path`.
+
+    Each problem is solved with the optimization of ``maxent`` or ``quartile``, starting from
+    the usual heuristic and from the solutions of its neighbours in the grid, and keeps the best
+    solution, the one with the largest entropy or the smallest quartile error. The grid is swept
+    forward and backward, so solutions propagate in both directions. Maxent solutions
+    must meet the mass constraint within the tolerance of ``maxent``. Two parameters can not
+    match three quartiles in general, so quartile solutions are the least squares optima, they
+    only need the optimizer to converge. Problems without a solution are stored as nan and are
+    not used.
+
+    Parameters
+    ----------
+    path : str
+        Defaults to None, which overwrites the tables shipped with PreliZ.
+    """
+    # imported here, the atlas is used by the modules that import these
+    from preliz import distributions
+    from preliz.internal.optimization import (
+        get_fixed_params,
+        optimize_max_ent,
+        optimize_quartile,
+        relative_error,
+    )
+
+    if path is None:
+        path = ATLAS_PATH
+
+    tables = {}
+    for name in FAMILIES:
+        for problem in ("maxent", "quartile"):
+            axes = grid(problem, name)
+            values = np.full((*(len(axis) for axis in axes), 2), np.nan)
+            scores = np.full(values.shape[:-1], -np.inf)
+            dist = getattr(distributions, name)()
+            none_idx, fixed = get_fixed_params(dist)
+            order = list(np.ndindex(scores.shape))
+            for idx in order + order[::-1]:
+                constraints = standard_problem(
+                    problem, name, [axis[i] for axis, i in zip(axes, idx)]
+                )
+                if problem == "maxent":
+                    lower, upper, mass = constraints
+                    dist._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 4) / mass)
+                else:
+                    q1, q2, q3 = constraints
+                    dist._fit_moments(mean=q2, sigma=(q3 - q1) / 1.35)
+                starts = [dist.params]
+                starts.extend(_to_params(name, *value) for value in _neighbours(values, idx))
+
+                for start in starts:
+                    # the heuristics can fail for extreme problems, like the moments of the Weibull
+                    lower_b, upper_b = np.array(dist.params_support).T
+                    if not np.all((lower_b <= start) & (start <= upper_b)):
+                        continue
+                    dist._parametrization(*start)
+                    with np.errstate(all="ignore"):
+                        if problem == "maxent":
+                            optimize_max_ent(dist, *constraints, none_idx, fixed, ())
+                            # the tolerance of maxent, in percent
+                            error, _ = relative_error(dist, *constraints)
+                            score = dist.entropy() if error <= 0.01 else np.nan
+                        else:
+                            opt = optimize_quartile(dist, constraints, none_idx, fixed)
+                            score = -opt.cost if opt.success else np.nan
+                    if score > scores[idx] and np.all(np.isfinite(dist.params)):
+                        scores[idx] = score
+                        values[idx] = _from_params(name, dist.params)
+            # starting points do not need more precision, and the file is half the size
+            tables[f"{problem}/{name}"] = values.astype(np.float32)
+
+    np.savez_compressed(path, **tables)
+    _load_atlas.cache_clear()
+
+
+def _family(dist, none_idx):
+    family = FAMILIES.get(dist.__class__.__name__)
+    if family is None or tuple(dist.param_names) != family[1]:
+        return None
+    if len(none_idx) != len(dist.param_names):
+        return None
+    return family
+
+
+def _from_params(name, params):
+    """Log of the shape, or the location, and log of the scale."""
+    kind, _, _, from_params = FAMILIES[name]
+    first, scale = from_params(*params)
+    if kind == "scale":
+        first = np.log(first)
+    return first, np.log(scale)
+
+
+def _lookup(problem, dist, point, shift, scale):
+    params = _lookup_many(problem, dist.__class__.__name__, np.array([point], dtype=float))
+    if params is None:
+        return None
+    params = _shift_scale(dist.__class__.__name__, params[0], shift, scale)
+    if not np.all(np.isfinite(params)):
+        return None
+    return params
+
+
+def _lookup_many(problem, name, points):
+    """Interpolated solutions at each row of `points`, nan outside the grid, or None."""
+    table = _load_atlas().get(f"{problem}/{name}")
+    if table is None:
+        return None
+    axes = grid(problem, name)
+    inside = np.ones(len(points), dtype=bool)
+    for axis, values in zip(axes, points.T):
+        inside &= (axis[0] <= values) & (values <= axis[-1])
+
+    values = np.full((len(points), 2), np.nan)
+    if np.any(inside):
+        values[inside] = interpn(axes, table, points[inside])
+    return values
+
+
+def _shift_scale(name, values, shift, scale):
+    """Parameters of the solutions in `values` for problems shifted and scaled."""
+    first, log_scale = np.moveaxis(values, -1, 0)
+    return np.stack(_to_params(name, first, log_scale, shift, scale), axis=-1).astype(float)
+
+
+def _to_params(name, first, log_scale, shift=0, scale=1):
+    """Parameters of the solution of a problem shifted by `shift` and scaled by `scale`."""
+    kind, _, to_params, _ = FAMILIES[name]
+    first = np.exp(first) if kind == "scale" else shift + scale * first
+    return to_params(first, scale * np.exp(log_scale))
+
+
+def _neighbours(values, idx):
+    """Solved values next to `idx` in the grid."""
+    neighbours = []
+    for axis in range(len(idx)):
+        for step in (-1, 1):
+            other = list(idx)
+            other[axis] += step
+            if 0 <= other[axis] < values.shape[axis]:
+                value = values[tuple(other)]
+                if np.all(np.isfinite(value)):
+                    neighbours.append(value)
+    return neighbours
+
+
+@cache
+def _load_atlas():
+    if not os.path.exists(ATLAS_PATH):
+        return {}
+    with np.load(ATLAS_PATH) as data:
+        return {key: data[key].astype(float) for key in data.files}
+
+
+if __name__ == "__main__":
+    build_atlas()
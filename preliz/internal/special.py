@@ -69,6 +69,50 @@ def gammaln(x):
     return tmp + np.log(stp * ser)
 
 
+@nb.njit(cache=True)
+def digamma(x):
+    """Digamma function for x > 0, using the recurrence and the asymptotic expansion."""
+    result = 0.0
+    while x < 10:
+        result -= 1 / x
+        x += 1
+    inv2 = 1 / x**2
+    return (
+        result
+        + np.log(x)
+        - 0.5 / x
+        - inv2 * (1 / 12 - inv2 * (1 / 120 - inv2 * (1 / 252 - inv2 * (1 / 240 - inv2 / 132))))
+    )
+
+
+@nb.njit(cache=True)
+def trigamma(x):
+    """Trigamma function for x > 0, using the recurrence and the asymptotic expansion."""
+    result = 0.0
+    while x < 10:
+        result += 1 / x**2
+        x += 1
+    inv2 = 1 / x**2
+    return (
+        result
+        + 1 / x
+        + inv2 / 2
+        + inv2 / x * (1 / 6 - inv2 * (1 / 30 - inv2 * (1 / 42 - inv2 * (1 / 30 - inv2 * 5 / 66))))
+    )
+
+
+@nb.njit(cache=True)
+def inv_digamma(y, iters=5):
+    """Inverse of the digamma function, with the initialization from Minka (2000)."""
+    if y >= -2.22:
+        x = np.exp(y) + 0.5
+    else:
+        x = -1 / (y + 0.5772156649015329)
+    for _ in range(iters):
+        x -= (digamma(x) - y) / trigamma(x)
+    return x
+
+
 @nb.vectorize(nopython=True, cache=True)
 def logit(x):
     if x == 0:
@@ -119,3 +163,86 @@ def mean_and_std(data):
     std = (sum_sq_diff / n) ** 0.5
 
     return mean, std
+
+
+@nb.njit(cache=True)
+def sample_lmoments(data):
+    """
+    Sample L-moments: L-location, L-scale, L-skewness and L-kurtosis.
+
+    As in ``Distribution.lmoments``, L-skewness and L-kurtosis are ratios to the L-scale. The
+    L-moments are linear combinations of the unbiased probability weighted moments of the
+    sorted sample, so the cost is dominated by sorting. Undefined values, like the L-skewness
+    of samples with less than three values, are nan.
+
+    J. R. M. Hosking. L-moments: analysis and estimation of distributions using linear
+    combinations of order statistics. 1990. Journal of the Royal Statistical Society B
+    52:105-124.
+    """
+    x = np.sort(data)
+    n = len(x)
+    b_0 = b_1 = b_2 = b_3 = 0.0
+    for i in range(n):
+        # probability weighted moments, with i the zero-based rank of x[i]
+        w_1 = i / (n - 1) if n > 1 else 0.0
+        w_2 = w_1 * (i - 1) / (n - 2) if n > 2 else 0.0
+        w_3 = w_2 * (i - 2) / (n - 3) if n > 3 else 0.0
+        b_0 += x[i]
+        b_1 += w_1 * x[i]
+        b_2 += w_2 * x[i]
+        b_3 += w_3 * x[i]
+    b_0 /= n
+    b_1 /= n
+    b_2 /= n
+    b_3 /= n
+
+    l_1 = b_0
+    l_2 = 2 * b_1 - b_0 if n > 1 else np.nan
+    if n < 3 or l_2 == 0:
+        return l_1, l_2, np.nan, np.nan
+    t_3 = (6 * b_2 - 6 * b_1 + b_0) / l_2
+    t_4 = (20 * b_3 - 30 * b_2 + 12 * b_1 - b_0) / l_2 if n > 3 else np.nan
+    return l_1, l_2, t_3, t_4
+
+
+@nb.njit(cache=True)
+def sample_moments(data):
+    """
+    Sample mean, variance, skewness and kurtosis, in a single pass over the data.
+
+    The central moments are updated one value at a time, without a second pass to compute the
+    deviations from the mean. As in ``Distribution.moments``, the kurtosis is the excess
+    kurtosis. The estimators are the biased ones, like ``np.var`` and ``scipy.stats.skew``.
+    Undefined values, like the skewness of a constant sample, are nan.
+
+    Timothy B. Terriberry. Computing higher-order moments online. 2007.
+    https://web.archive.org/web/20140423031833/http://people.xiph.org/~tterribe/notes/homs.html
+    """
+    n = 0
+    mean = m_2 = m_3 = m_4 = 0.0
+    for value in data:
+        n_prev = n
+        n += 1
+        delta = value - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term = delta * delta_n * n_prev
+        mean += delta_n
+        m_4 += term * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m_2 - 4 * delta_n * m_3
+        m_3 += term * delta_n * (n - 2) - 3 * delta_n * m_2
+        m_2 += term
+
+    if n == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    if m_2 == 0:
+        return mean, 0.0, np.nan, np.nan
+    return mean, m_2 / n, n**0.5 * m_3 / m_2**1.5, n * m_4 / (m_2 * m_2) - 3
+
+
+@nb.njit(cache=True)
+def sample_moments_rows(data):
+    """Sample mean, variance, skewness and kurtosis of each row of a two-dimensional array."""
+    moments = np.empty((data.shape[0], 4))
+    for idx in range(data.shape[0]):
+        moments[idx] = sample_moments(data[idx])
+    return moments
@@ -0,0 +1,301 @@
+"""Sufficient statistics accumulated one chunk at a time, used by ``partial_fit``.
+
+Families supporting streaming fits declare the statistics they need in the class attribute
+``_suff_stats`` and implement ``_fit_suff_stats(stats)``, the equivalent of ``_fit_mle`` taking
+the output of :func:`summarize` instead of the sample. Memory usage does not depend on the
+size of the sample, except for ``"counts"`` which grows with the largest observed value.
+
+The available statistics are:
+
+- ``"moments"``: mean and variance of x.
+- ``"log_moments"``: mean and variance of log(x).
+- ``"log1m_moments"``: mean and variance of log(1 - x).
+- ``"inv_moments"``: mean and variance of 1 / x.
+- ``"min"`` and ``"max"``: smallest and largest values.
+- ``"counts"``: number of occurrences of each non-negative integer.
+
+Means and variances are merged with the pairwise update of Chan et al. (1979), which avoids
+the loss of precision of accumulating sums of squares over large samples. Observations can have
+frequency weights, so a sample compressed into unique values and counts (see
+:func:`compress_sample`) gives the same statistics as the original one.
+
+:class:`ChunkedSample` reads samples that do not fit in memory, like memory-mapped arrays or
+``.npy`` files, in chunks of ``rcParams["stats.chunk_size"]`` values. :func:`row_stats` computes
+the same summary for every row of a two-dimensional sample at once, so families with sufficient
+statistics fit all rows with a single call to ``_fit_suff_stats``.
+"""
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from preliz.internal.rcparams import rcParams
+
+PATH_TYPES = str | os.PathLike
+
+TRANSFORMS = {
+    "moments": lambda x: x,
+    "log_moments": np.log,
+    "log1m_moments": lambda x: np.log1p(-x),
+    "inv_moments": lambda x: 1 / x,
+}
+
+
+def update_stats(stats, chunk, kinds, weights=None):
+    """Return `stats` updated with the values in `chunk`.
+
+    Parameters
+    ----------
+    stats : dict or None
+        Statistics accumulated so far, None for the first chunk.
+    chunk : array-like
+        New observations.
+    kinds : tuple of str
+        Statistics to accumulate, see the module docstring.
+    weights : array-like, optional
+        Frequency weights of the observations, ``n`` is then the sum of the weights.
+    """
+    chunk = np.asarray(chunk, dtype=float).ravel()
+    if weights is not None:
+        weights = np.broadcast_to(np.asarray(weights, dtype=float).ravel(), chunk.shape)
+        chunk = chunk[weights > 0]
+        weights = weights[weights > 0]
+    if stats is None:
+        stats = {"n": 0}
+    if chunk.size == 0:
+        return stats
+
+    n_old = stats["n"]
+    n_new = chunk.size if weights is None else np.sum(weights)
+    for kind in kinds:
+        if kind in TRANSFORMS:
+            with np.errstate(all="ignore"):
+                values = TRANSFORMS[kind](chunk)
+            stats[kind] = _merge_moments(stats.get(kind), n_old, values, weights)
+        elif kind == "min":
+            stats["min"] = min(stats.get("min", np.inf), np.min(chunk))
+        elif kind == "max":
+            stats["max"] = max(stats.get("max", -np.inf), np.max(chunk))
+        elif kind == "counts":
+            stats["counts"] = _merge_counts(stats.get("counts"), chunk, weights)
+        else:
+            raise ValueError(f"Unknown sufficient statistic {kind}")
+    stats["n"] = n_old + n_new
+    return stats
+
+
+def summarize(stats):
+    """Convert the accumulated statistics into the values used by ``_fit_suff_stats``.
+
+    Returns a dictionary with the keys ``n``, ``min``, ``max`` and ``counts`` (when
+    accumulated), and ``mean``, ``var``, ``mean_log``, ``var_log``, ``mean_log1m``,
+    ``var_log1m``, ``mean_inv`` and ``var_inv`` for the corresponding moments.
+    """
+    summary = {"n": stats["n"]}
+    for kind, value in stats.items():
+        if kind in TRANSFORMS:
+            mean_key, var_key = _moment_keys(kind)
+            mean, m_2 = value
+            summary[mean_key] = mean
+            summary[var_key] = m_2 / stats["n"]
+        elif kind != "n":
+            summary[kind] = value
+    return summary
+
+
+def row_stats(sample, kinds):
+    """Summarize each row of a two-dimensional sample.
+
+    Returns the same keys as :func:`summarize`, with one value per row, computed without
+    looping over the rows. ``counts`` is a two-dimensional array, with one row per row of
+    `sample` and as many columns as the largest value plus one.
+    """
+    sample = np.asarray(sample, dtype=float)
+    if sample.ndim != 2:
+        raise ValueError("row_stats expects a two-dimensional sample")
+    n_rows, n_obs = sample.shape
+    summary = {"n": n_obs}
+    for kind in kinds:
+        if kind in TRANSFORMS:
+            with np.errstate(all="ignore"):
+                values = TRANSFORMS[kind](sample)
+            mean_key, var_key = _moment_keys(kind)
+            summary[mean_key] = np.mean(values, axis=1)
+            summary[var_key] = np.var(values, axis=1)
+        elif kind == "min":
+            summary["min"] = np.min(sample, axis=1)
+        elif kind == "max":
+            summary["max"] = np.max(sample, axis=1)
+        elif kind == "counts":
+            if np.any(sample < 0) or np.any(sample != np.floor(sample)):
+                raise ValueError("counts are only defined for non-negative integers")
+            n_values = int(np.max(sample)) + 1
+            # offset each row, so a single bincount counts all rows
+            offsets = np.arange(n_rows)[:, None] * n_values
+            counts = np.bincount(
+                (sample.astype(int) + offsets).ravel(), minlength=n_rows * n_values
+            )
+            summary["counts"] = counts.reshape(n_rows, n_values)
+        else:
+            raise ValueError(f"Unknown sufficient statistic {kind}")
+    return summary
+
+
+def _moment_keys(kind):
+    suffix = kind.replace("moments", "").rstrip("_")
+    suffix = f"_{suffix}" if suffix else ""
+    return f"mean{suffix}", f"var{suffix}"
+
+
+def _merge_moments(previous, n_old, values, weights=None):
+    """Merge the mean and sum of squared deviations of `values` into `previous`."""
+    if weights is None:
+        n_new = values.size
+        mean_new = np.mean(values)
+        m_2_new = np.sum((values - mean_new) ** 2)
+    else:
+        n_new = np.sum(weights)
+        mean_new = np.sum(weights * values) / n_new
+        m_2_new = np.sum(weights * (values - mean_new) ** 2)
+    if previous is None:
+        return mean_new, m_2_new
+
+    mean_old, m_2_old = previous
+    n_total = n_old + n_new
+    delta = mean_new - mean_old
+    mean = mean_old + delta * n_new / n_total
+    m_2 = m_2_old + m_2_new + delta**2 * n_old * n_new / n_total
+    return mean, m_2
+
+
+def _merge_counts(previous, chunk, weights=None):
+    if np.any(chunk < 0) or np.any(chunk != np.floor(chunk)):
+        raise ValueError("counts are only defined for non-negative integers")
+    counts = np.bincount(chunk.astype(int), weights=weights)
+    if previous is None:
+        return counts
+    if len(previous) < len(counts):
+        previous, counts = counts, previous
+    merged = previous.astype(np.result_type(previous, counts))
+    merged[: len(counts)] += counts
+    return merged
+
+
+def is_chunked(sample):
+    """Return True if `sample` should be read in chunks instead of loaded in memory.
+
+    That is the case for instances of :class:`ChunkedSample`, memory-mapped arrays, paths to
+    ``.npy`` files, lists and tuples of paths, and iterables that are neither sequences nor
+    array-like objects. Other lists and tuples, including lists of arrays, and sequences like
+    ``range`` are samples in memory, arrays must be wrapped in a :class:`ChunkedSample` to be
+    read as chunks.
+    """
+    if isinstance(sample, ChunkedSample | np.memmap | PATH_TYPES):
+        return True
+    if isinstance(sample, list | tuple):
+        return len(sample) > 0 and isinstance(sample[0], PATH_TYPES)
+    if isinstance(sample, Sequence) or hasattr(sample, "__array__"):
+        return False
+    return np.iterable(sample)
+
+
+class ChunkedSample:
+    """One-dimensional sample read in chunks, without loading it in memory.
+
+    Parameters
+    ----------
+    source : np.memmap, path, or iterable
+        Memory-mapped array, path to a ``.npy`` file or iterable of chunks. The chunks can be
+        arrays or paths to ``.npy`` files. Iterables must support being iterated several times,
+        for example a list or an object whose ``__iter__`` method returns a new iterator,
+        generators are not valid.
+    chunk_size : int
+        Maximum number of values per chunk. Defaults to None, which results in the value of
+        rcParams["stats.chunk_size"] being used.
+
+    Attributes
+    ----------
+    size, min, max, mean, std : float
+        Summary of the sample, computed in a first pass over the data.
+    """
+
+    def __init__(self, source, chunk_size=None):
+        if isinstance(source, ChunkedSample):
+            source = source.source
+        if isinstance(source, PATH_TYPES):
+            source = np.load(source, mmap_mode="r")
+        if isinstance(source, np.ndarray) and source.ndim != 1:
+            raise ValueError("Only one-dimensional samples can be read in chunks")
+        if not isinstance(source, np.ndarray) and iter(source) is source:
+            raise ValueError(
+                "The chunks of the sample are read several times, pass a list of chunks or "
+                "an iterable whose __iter__ method returns a new iterator instead of a generator"
+            )
+        if chunk_size is None:
+            chunk_size = rcParams["stats.chunk_size"]
+        self.source = source
+        self.chunk_size = chunk_size
+
+        stats = None
+        for chunk in self:
+            stats = update_stats(stats, chunk, ("moments", "min", "max"))
+        if stats is None or stats["n"] == 0:
+            raise ValueError("The sample is empty")
+        summary = summarize(stats)
+        self.size = summary["n"]
+        self.min = summary["min"]
+        self.max = summary["max"]
+        self.mean = summary["mean"]
+        self.std = summary["var"] ** 0.5
+
+    def __iter__(self):
+        """Iterate over the chunks, reading the next one in a background thread."""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pieces = self._pieces()
+            pending = executor.submit(next, pieces, None)
+            while True:
+                chunk = pending.result()
+                if chunk is None:
+                    break
+                pending = executor.submit(next, pieces, None)
+                yield chunk
+
+    def reduce(self, func):
+        """Return the sum of ``func(chunk)`` over all chunks."""
+        total = 0
+        for chunk in self:
+            total = total + func(chunk)
+        return total
+
+    def _pieces(self):
+        """Yield in-memory copies of at most ``chunk_size`` values."""
+        if isinstance(self.source, np.ndarray):
+            sources = [self.source]
+        else:
+            sources = self.source
+        for source in sources:
+            if isinstance(source, PATH_TYPES):
+                values = np.load(source, mmap_mode="r").ravel()
+            else:
+                values = np.ravel(source)
+            for start in range(0, values.size, self.chunk_size):
+                yield np.array(values[start : start + self.chunk_size])
+
+
+def compress_sample(sample, max_ratio=0.5):
+    """Represent an integer-valued sample by its unique values and their counts.
+
+    Returns None if `sample` is not one-dimensional, has non-integer values, or the number of
+    unique values is larger than ``max_ratio`` times the size of the sample.
+    """
+    if sample.ndim != 1 or sample.size == 0:
+        return None
+    if sample.dtype.kind not in "iu":
+        if sample.dtype.kind != "f" or not np.all(sample == np.floor(sample)):
+            return None
+    values, counts = np.unique(sample, return_counts=True)
+    if values.size > max_ratio * sample.size:
+        return None
+    return values, counts
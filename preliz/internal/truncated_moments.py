@@ -0,0 +1,195 @@
+"""Closed-form moments of truncated and censored distributions for common families.
+
+:class:`preliz.Truncated` and :class:`preliz.Censored` consult ``TRUNCATED_MOMENTS`` before
+falling back to numerical integration. Each entry maps the name of a base distribution to a
+function ``partial_moments(dist, lower, upper)`` returning ``(loc, scale, partial)``, where
+``partial[k]`` is the partial moment ``E[Z**k; lower <= X <= upper]``, for ``k = 0, ..., 4``, of
+the standardized variable ``Z = (X - loc) / scale``. Working with ``Z`` instead of ``X`` reduces
+cancellation errors when computing central moments from raw ones.
+"""
+
+import numpy as np
+from scipy.special import bdtr, gammainc, gammaincc, ndtr, pdtr
+
+from preliz.internal.quadrature import raw_to_moments
+
+ORDERS = np.arange(5)
+
+
+def _normal_partial(z_lower, z_upper):
+    """Partial moments of the standard normal.
+
+    Computed with the recursion
+    ``I_k = z_lower**(k-1) * pdf(z_lower) - z_upper**(k-1) * pdf(z_upper) + (k-1) * I_{k-2}``.
+    """
+
+    def boundary(z_val, power):
+        with np.errstate(all="ignore"):
+            vals = z_val**power * np.exp(-(z_val**2) / 2) / np.sqrt(2 * np.pi)
+        return np.where(np.isfinite(z_val), vals, 0.0)
+
+    # use the survival function in the right tail to avoid cancellation
+    right = z_lower > 0
+    mass = np.where(right, ndtr(-z_lower) - ndtr(-z_upper), ndtr(z_upper) - ndtr(z_lower))
+    partial = [mass, boundary(z_lower, 0) - boundary(z_upper, 0)]
+    for k in range(2, 5):
+        partial.append(
+            boundary(z_lower, k - 1) - boundary(z_upper, k - 1) + (k - 1) * partial[k - 2]
+        )
+    return np.stack(partial)
+
+
+def _normal(dist, lower, upper):
+    return (
+        dist.mu,
+        dist.sigma,
+        _normal_partial((lower - dist.mu) / dist.sigma, (upper - dist.mu) / dist.sigma),
+    )
+
+
+def _halfnormal(dist, lower, upper):
+    lower = np.maximum(lower, 0)
+    return 0.0, dist.sigma, 2 * _normal_partial(lower / dist.sigma, upper / dist.sigma)
+
+
+def _gamma_partial(alpha, z_lower, z_upper):
+    """Partial moments of Gamma(alpha, 1), ``E[Z**k; ...] = alpha^(k) * P(alpha + k, ...)``."""
+    z_lower = np.maximum(z_lower, 0)
+    partial = []
+    rising = 1.0
+    for k in ORDERS:
+        shape = alpha + k
+        right = z_lower > shape
+        mass = np.where(
+            right,
+            gammaincc(shape, z_lower) - gammaincc(shape, z_upper),
+            gammainc(shape, z_upper) - gammainc(shape, z_lower),
+        )
+        partial.append(rising * mass)
+        rising = rising * shape
+    return np.stack(partial)
+
+
+def _gamma(dist, lower, upper):
+    return 0.0, 1 / dist.beta, _gamma_partial(dist.alpha, lower * dist.beta, upper * dist.beta)
+
+
+def _exponential(dist, lower, upper):
+    return 0.0, 1 / dist.lam, _gamma_partial(1.0, lower * dist.lam, upper * dist.lam)
+
+
+def _lognormal(dist, lower, upper):
+    """Partial moments of LogNormal(0, sigma), ``Z = X / exp(mu)``."""
+    sigma = dist.sigma
+    scale = np.exp(dist.mu)
+    with np.errstate(divide="ignore"):
+        h_lower = np.log(np.maximum(lower, 0) / scale) / sigma
+        h_upper = np.log(upper / scale) / sigma
+    partial = np.stack(
+        [
+            np.exp(k**2 * sigma**2 / 2) * (ndtr(h_upper - k * sigma) - ndtr(h_lower - k * sigma))
+            for k in ORDERS
+        ]
+    )
+    return 0.0, scale, partial
+
+
+def _uniform(dist, lower, upper):
+    width = dist.upper - dist.lower
+    z_lower = np.clip((lower - dist.lower) / width, 0, 1)
+    z_upper = np.clip((upper - dist.lower) / width, 0, 1)
+    partial = np.stack([(z_upper ** (k + 1) - z_lower ** (k + 1)) / (k + 1) for k in ORDERS])
+    return dist.lower, width, partial
+
+
+def _factorial_to_raw(factorial):
+    """Convert factorial moments ``E[X(X-1)...(X-k+1)]`` into raw moments."""
+    f_0, f_1, f_2, f_3, f_4 = factorial
+    return np.stack([f_0, f_1, f_2 + f_1, f_3 + 3 * f_2 + f_1, f_4 + 6 * f_3 + 7 * f_2 + f_1])
+
+
+def _interval_mass(cdf, lower, upper):
+    """``P(lower <= Y <= upper)`` for an integer valued `Y`, with ``cdf(k)`` defined for k >= 0."""
+
+    def safe_cdf(k_val):
+        k_val = np.floor(k_val)
+        with np.errstate(invalid="ignore"):
+            vals = cdf(np.where(np.isfinite(k_val), np.maximum(k_val, 0), 0))
+        return np.where(k_val < 0, 0.0, np.where(np.isposinf(k_val), 1.0, vals))
+
+    return safe_cdf(upper) - safe_cdf(np.ceil(lower) - 1)
+
+
+def _poisson(dist, lower, upper):
+    """Factorial moments of the Poisson, ``E[X^(k); a <= X <= b] = mu**k P(a-k <= X <= b-k)``."""
+    mu = dist.mu
+    factorial = [
+        mu**k * _interval_mass(lambda k_val: pdtr(k_val, mu), lower - k, upper - k) for k in ORDERS
+    ]
+    return 0.0, 1.0, _factorial_to_raw(factorial)
+
+
+def _binomial(dist, lower, upper):
+    """Factorial moments of the Binomial, ``E[X^(k); ...] = n^(k) p**k P(... | n - k, p)``."""
+    n, p = dist.n, dist.p
+    factorial = []
+    falling = 1.0
+    for k in ORDERS:
+        n_k = np.maximum(n - k, 0)
+        mass = _interval_mass(
+            lambda k_val, n_k=n_k: bdtr(np.minimum(k_val, n_k), n_k, p), lower - k, upper - k
+        )
+        factorial.append(np.where(falling > 0, falling * p**k * mass, 0.0))
+        falling = falling * np.maximum(n - k, 0)
+    return 0.0, 1.0, _factorial_to_raw(factorial)
+
+
+TRUNCATED_MOMENTS = {
+    "Binomial": _binomial,
+    "Exponential": _exponential,
+    "Gamma": _gamma,
+    "HalfNormal": _halfnormal,
+    "LogNormal": _lognormal,
+    "Normal": _normal,
+    "Poisson": _poisson,
+    "Uniform": _uniform,
+}
+
+
+def _weighted_power(z_val, weight):
+    """``weight * z_val**k`` for k = 0, ..., 4, zero where `weight` is zero."""
+    with np.errstate(all="ignore"):
+        vals = weight * z_val ** ORDERS.reshape((-1,) + (1,) * np.ndim(z_val))
+    return np.where(weight > 0, vals, 0.0)
+
+
+def truncated_moments(dist, lower, upper):
+    """Return the mean, variance, skewness and excess kurtosis of `dist` truncated to the interval.
+
+    Returns None if no closed form is registered for `dist`.
+    """
+    partial_moments = TRUNCATED_MOMENTS.get(dist.__class__.__name__)
+    if partial_moments is None:
+        return None
+    loc, scale, partial = partial_moments(dist, lower, upper)
+    return raw_to_moments(partial[1:] / partial[0], loc, scale)
+
+
+def censored_moments(dist, lower, upper):
+    """Return the mean, variance, skewness and excess kurtosis of `dist` censored to the interval.
+
+    Returns None if no closed form is registered for `dist`.
+    """
+    partial_moments = TRUNCATED_MOMENTS.get(dist.__class__.__name__)
+    if partial_moments is None:
+        return None
+    loc, scale, partial = partial_moments(dist, lower, upper)
+    # for discrete distributions the probability of the bounds is part of the partial moments
+    p_low = dist.cdf(lower - 1) if dist.kind == "discrete" else dist.cdf(lower)
+    p_up = 1 - dist.cdf(upper)
+    total = (
+        partial
+        + _weighted_power((lower - loc) / scale, p_low)
+        + _weighted_power((upper - loc) / scale, p_up)
+    )
+    return raw_to_moments(total[1:] / total[0], loc, scale)
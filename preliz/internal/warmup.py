@@ -0,0 +1,158 @@
+"""Ahead-of-time compilation of the functions behind the distributions' methods."""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from time import perf_counter
+
+import numpy as np
+
+from preliz.internal.distribution_helper import init_vals
+from preliz.internal.rcparams import rcParams
+
+X_METHODS = ["pdf", "cdf", "logpdf", "sf", "logcdf", "logsf"]
+Q_METHODS = ["ppf", "isf"]
+STATS_METHODS = [
+    "entropy",
+    "mean",
+    "median",
+    "mode",
+    "var",
+    "std",
+    "skewness",
+    "kurtosis",
+    "lmoment1",
+    "lmoment2",
+    "lmoment3",
+    "lmoment4",
+]
+ALL_METHODS = X_METHODS + Q_METHODS + STATS_METHODS + ["rvs"]
+
+
+def warmup(distributions=None, methods=None, dtypes=None, workers=None):
+    """
+    Compile ahead of time the functions behind the methods of the distributions.
+
+    Methods are compiled on their first call, this function calls them for the most common
+    signatures (scalar and 1D array inputs) so later calls do not pay for the compilation.
+    Combined with the on-disk cache (``rcParams["compile.cache"] = True``), this can be
+    done once, for example when building a container, and reused by other processes.
+
+    Parameters
+    ----------
+    distributions : list of str
+        Names of the distributions to warm up. Defaults to None, which results in all
+        univariate distributions being used. Modifiers (e.g. Truncated or Mixture) and
+        multivariate distributions are not supported, they reuse the functions of their
+        base distributions.
+    methods : list of str
+        Methods to warm up. Defaults to None, which results in all the methods being used.
+    dtypes : list of str
+        Dtypes of the values passed to ``pdf``, ``cdf``, ``logpdf`` and the like. Defaults to
+        None, which results in ``float64`` for continuous distributions, and ``float64`` and
+        ``int64`` for discrete ones. ``ppf`` and ``isf`` always use ``float64``.
+    workers : int
+        Number of processes used to compile in parallel. Defaults to None, which compiles in
+        the current process. Using more than one worker requires the on-disk cache, so the
+        compiled functions are available to the current process.
+
+    Returns
+    -------
+    dict
+        Time in seconds spent compiling (and evaluating once) each function, keyed by
+        ``(distribution, method, signature)``.
+
+    Examples
+    --------
+    Compile all the methods of the Normal and Gamma distributions
+
+    >>> import preliz as pz
+    >>> pz.warmup(["Normal", "Gamma"])
+    """
+    from preliz.distributions import all_continuous, all_discrete
+
+    univariate = [dist.__name__ for dist in all_continuous + all_discrete]
+    if distributions is None:
+        distributions = univariate
+    else:
+        unsupported = [name for name in distributions if name not in univariate]
+        if unsupported:
+            raise ValueError(
+                f"warmup does not support the following distributions: {', '.join(unsupported)}"
+            )
+
+    if methods is None:
+        methods = ALL_METHODS
+    else:
+        unsupported = [method for method in methods if method not in ALL_METHODS]
+        if unsupported:
+            raise ValueError(f"warmup does not support the following methods: {unsupported}")
+
+    if workers is None or workers <= 1:
+        return _warmup(distributions, methods, dtypes)
+
+    if not rcParams["compile.cache"]:
+        raise ValueError(
+            "Using more than one worker requires the on-disk cache, "
+            'set rcParams["compile.cache"] = True'
+        )
+
+    # spawn new processes instead of forking the current one, as numba is not fork-safe
+    chunks = [distributions[idx::workers] for idx in range(workers)]
+    timings = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        futures = [
+            executor.submit(_warmup_worker, chunk, methods, dtypes, rcParams.copy())
+            for chunk in chunks
+            if chunk
+        ]
+        for future in futures:
+            timings.update(future.result())
+
+    return timings
+
+
+def _warmup_worker(distributions, methods, dtypes, rc):
+    rcParams.update(rc)
+    return _warmup(distributions, methods, dtypes)
+
+
+def _warmup(distributions, methods, dtypes):
+    from preliz import distributions as pz_distributions
+
+    timings = {}
+    for name in distributions:
+        dist = getattr(pz_distributions, name)()
+        dist._parametrization(**init_vals[name])
+
+        if dtypes is None:
+            x_dtypes = ["float64", "int64"] if dist.kind == "discrete" else ["float64"]
+        else:
+            x_dtypes = dtypes
+
+        lower, upper = dist.ppf([0.25, 0.75])
+        for method in methods:
+            if method in X_METHODS:
+                calls = {
+                    f"{dtype}[{shape}]": (x_vals.astype(dtype),)
+                    for dtype in x_dtypes
+                    for shape, x_vals in [
+                        ("", np.asarray(lower)),
+                        ("n", np.array([lower, upper])),
+                    ]
+                }
+            elif method in Q_METHODS:
+                calls = {"float64[]": (0.5,), "float64[n]": (np.array([0.25, 0.75]),)}
+            elif method == "rvs":
+                calls = {"size=None": (None,), "size=n": (10,)}
+            else:
+                calls = {"": ()}
+
+            for signature, args in calls.items():
+                start = perf_counter()
+                try:
+                    getattr(dist, method)(*args)
+                except NotImplementedError:
+                    break
+                timings[(name, method, signature)] = perf_counter() - start
+
+    return timings
@@ -16,6 +16,7 @@ except ImportError:
     warnings.warn("PyMC not installed. PyMC related functions will not work.")
 
 from preliz.internal.distribution_helper import get_distributions
+from preliz.internal.optimization import fit_rows
 
 
 def back_fitting_pymc(prior, preliz_model, var_info, new_families=None):
@@ -30,14 +31,9 @@ def back_fitting_pymc(prior, preliz_model, var_info, new_families=None):
     new_priors = {}
     for rv_name, (_, size, *_) in var_info.items():
         if size > 1:
-            params = []
-            for i in range(size):
-                opt_values = prior[rv_name][:, i]
-                # Not sure how to fit alternative families.
-                dist = preliz_model[rv_name]
-                dist._fit_mle(opt_values)
-                params.append(dist.params)
-            dist._parametrization(*[np.array(x) for x in zip(*params)])
+            # Not sure how to fit alternative families.
+            dist = preliz_model[rv_name]
+            fit_rows(dist, np.asarray(prior[rv_name]).T)
         else:
             opt_values = prior[rv_name]
             dists = set_families(preliz_model[rv_name], rv_name, new_families)
@@ -1,3 +1,5 @@
+from copy import copy
+
 import numpy as np
 import pytest
 from numpy.testing import assert_almost_equal
@@ -13,6 +15,7 @@ from preliz.distributions import (
     BetaBinomial,
     BetaScaled,
     Binomial,
+    Categorical,
     Cauchy,
     Censored,
     ChiSquared,
@@ -54,6 +57,12 @@ from preliz.distributions import (
     ZeroInflatedNegativeBinomial,
     ZeroInflatedPoisson,
 )
+from preliz.internal.optimization import (
+    _sorted_discrete_hdi,
+    continuous_hdi,
+    discrete_hdi,
+    find_hdi,
+)
 
 
 @pytest.fixture(scope="session")
@@ -277,6 +286,71 @@ def test_hdi(distribution, params):
     assert_almost_equal(np.mean((sample >= interval[0]) & (sample < interval[1])), 0.8, decimal=1)
 
 
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Gamma(alpha=np.array([0.5, 1, 2, 30]), beta=1),
+        Beta(np.array([[2], [0.5]]), np.array([5, 0.5])),
+        StudentT(nu=np.array([1, 4, 100]), mu=0, sigma=2),
+        Truncated(Normal(0, 1), -1, 3),
+    ],
+)
+def test_hdi_vectorized(dist):
+    masses = np.array([0.5, 0.89, 0.99]).reshape((3,) + (1,) * len(dist._params_shape()))
+    lower, upper = find_hdi(dist, masses)
+    shape = np.broadcast_shapes(masses.shape, dist._params_shape())
+    assert lower.shape == shape
+    param_sets = dist._unpack_distribution() if dist._params_shape() else [dist.params_dict]
+    for idx in np.ndindex(shape):
+        param_idx = np.ravel_multi_index(
+            [pdx if size > 1 else 0 for pdx, size in zip(idx[1:], dist._params_shape())],
+            dist._params_shape(),
+        )
+        scalar_dist = copy(dist)
+        scalar_dist._parametrization(**param_sets[param_idx])
+        mass = masses.ravel()[idx[0]]
+        assert_almost_equal(scalar_dist.cdf(upper[idx]) - scalar_dist.cdf(lower[idx]), mass, 4)
+        opt_lower, opt_upper = continuous_hdi(scalar_dist, mass)
+        assert upper[idx] - lower[idx] <= opt_upper - opt_lower + 1e-3
+
+
+def test_hdi_flat():
+    # any interval with the right mass is an HDI of a flat density, the central one is returned
+    assert_almost_equal(find_hdi(Uniform(0, 1), 0.94), (0.03, 0.97))
+    lower, upper = find_hdi(Uniform(0, np.array([1, 2])), 0.5)
+    assert_almost_equal(lower, [0.25, 0.5])
+    assert_almost_equal(upper, [0.75, 1.5])
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Poisson(4.5),
+        Poisson(1e5),
+        NegativeBinomial(40000, 5),
+        Binomial(1000, 0.99),
+        DiscreteUniform(-10, 10),
+        Truncated(Poisson(500), 300, 480),
+        BetaBinomial(0.5, 0.5, 150),
+        BetaBinomial(2, 0.8, 150),
+        Categorical(np.r_[0.3, np.full(198, 0.2 / 198), 0.5]),
+    ],
+)
+@pytest.mark.parametrize("mass", (0.1, 0.5, 0.94, 0.999))
+def test_discrete_hdi(dist, mass):
+    lower, upper = discrete_hdi(dist, mass)
+    assert dist.cdf(upper) - dist.cdf(lower - 1) >= mass - 1e-10
+    assert (lower, upper) == _sorted_discrete_hdi(dist, mass) or dist.__class__.__name__ in [
+        "DiscreteUniform"
+    ]
+
+
+def test_discrete_hdi_multimodal():
+    # the most probable values are at both ends of the support
+    assert discrete_hdi(BetaBinomial(0.5, 0.5, 150), 0.3) == (0, 150)
+    assert discrete_hdi(Categorical(np.r_[0.3, np.full(198, 0.2 / 198), 0.5]), 0.7) == (0, 199)
+
+
 @pytest.mark.parametrize("fmt", (".2f", ".1g"))
 @pytest.mark.parametrize("interval", ("hdi", "eti", [0.25, 0.75]))
 @pytest.mark.parametrize("mass", (0.5, 0.95))
@@ -290,8 +364,9 @@ def test_summary_univariate_valid(a_few_poissons):
     d_0, d_1, d_2 = a_few_poissons
     with pytest.raises(ValueError):
         d_0.summary()
-    with pytest.raises(ValueError):
-        d_1.summary()
+    result = d_1.summary()
+    assert_almost_equal(result.mean, [1, 2])
+    assert_almost_equal(result.lower, [0, 0])
     result = d_2.summary()
     assert result.__class__.__name__ == "Poisson"
     assert result.mean == 4.5
@@ -318,12 +393,48 @@ def test_eti(a_few_poissons):
     d_0, d_1, d_2 = a_few_poissons
     with pytest.raises(ValueError):
         d_0.eti()
-    with pytest.raises(ValueError):
-        d_1.eti()
+    lower, upper = d_1.eti()
+    assert_almost_equal(lower, [0, 0])
+    assert_almost_equal(upper, [3, 4])
     result = d_2.eti()
     assert result == (1, 8)
 
 
+@pytest.mark.parametrize(
+    "dist, params",
+    [
+        (Normal, {"mu": np.array([[0.0, 1.0, 2.0], [-1.0, 0.5, 3.0]]), "sigma": 1.5}),
+        (Gamma, {"alpha": np.array([1.5, 2.0, 5.0]), "beta": np.array([[1.0], [2.0]])}),
+        (SkewNormal, {"mu": 0.0, "sigma": 1.0, "alpha": np.array([-2.0, 0.0, 4.0])}),
+        (Poisson, {"mu": np.array([[0.5, 2.0], [4.0, 10.0]])}),
+    ],
+)
+def test_array_params(dist, params):
+    array_dist = dist(**params)
+    shape = np.broadcast_shapes(*(np.shape(value) for value in params.values()))
+    x_vals = array_dist.ppf(np.full(shape, 0.3))
+    summary = array_dist.summary(fmt=".4f")
+    eti = array_dist.eti(fmt="none")
+    hdi = array_dist.hdi(fmt="none")
+    mode = array_dist.mode()
+
+    broadcasted = np.broadcast_arrays(*params.values())
+    for idx in np.ndindex(shape):
+        scalar_dist = dist(**{key: value[idx] for key, value in zip(params, broadcasted)})
+        assert_almost_equal(array_dist.pdf(x_vals)[idx], scalar_dist.pdf(x_vals[idx]))
+        assert_almost_equal(array_dist.cdf(x_vals)[idx], scalar_dist.cdf(x_vals[idx]))
+        assert_almost_equal(array_dist.mean()[idx], scalar_dist.mean())
+        assert_almost_equal(array_dist.var()[idx], scalar_dist.var())
+        assert_almost_equal(array_dist.entropy()[idx], scalar_dist.entropy())
+        assert_almost_equal(mode[idx], scalar_dist.mode(), decimal=4)
+        for actual, expected in zip(summary, scalar_dist.summary(fmt=".4f")):
+            assert_almost_equal(actual[idx], expected)
+        for actual, expected in zip(eti, scalar_dist.eti(fmt="none")):
+            assert_almost_equal(actual[idx], expected)
+        for actual, expected in zip(hdi, scalar_dist.hdi(fmt="none")):
+            assert_almost_equal(actual[idx], expected, decimal=4)
+
+
 def test_cdf(a_few_poissons):
     _, d_1, d_2 = a_few_poissons
     result1 = d_1.cdf(1)
@@ -1,4 +1,24 @@
-from preliz.internal.distribution_helper import process_extra
+from copy import copy
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_almost_equal
+
+from preliz.distributions import (
+    Beta,
+    Gamma,
+    HyperGeometric,
+    NegativeBinomial,
+    Normal,
+    Poisson,
+    StudentT,
+    Truncated,
+    TruncatedNormal,
+)
+from preliz.internal import autodiff, compile_cache, quadrature
+from preliz.internal.distribution_helper import process_extra, pytensor_jit
+from preliz.internal.optimization import get_fixed_params, get_params
+from preliz.internal.rcparams import rc_context
 
 
 def test_process_extra():
@@ -7,3 +27,148 @@ def test_process_extra():
 
     assert process_extra("TruncatedNormal(lower=-3, upper=3)") == ref0
     assert process_extra("StudentT(nu=3.4),Normal(mu=3)") == ref1
+
+
+def _square_plus(x, y):
+    return x**2 + y
+
+
+def test_compile_cache(tmp_path):
+    with rc_context({"compile.cache": True, "compile.cache_dir": str(tmp_path)}):
+        x_vals = np.linspace(0, 1, 5)
+        expected = pytensor_jit(_square_plus)(x_vals, 1.0)
+        entries = list(tmp_path.glob("*/*.pkl"))
+        assert len(entries) == 1
+
+        # a fresh wrapper has an empty in-memory cache, so it has to read from disk
+        actual = pytensor_jit(_square_plus)(x_vals, 1.0)
+        assert_almost_equal(actual, expected)
+        assert len(list(tmp_path.glob("*/*.pkl"))) == 1
+
+        # a new signature is a new entry
+        pytensor_jit(_square_plus)(x_vals, np.ones(5))
+        assert len(list(tmp_path.glob("*/*.pkl"))) == 2
+
+        compile_cache.evict(max_mb=0)
+        assert not list(tmp_path.glob("*/*.pkl"))
+
+
+def test_compile_cache_key_source():
+    namespace = {}
+    exec("def builder(x):\n    return x + 1", namespace)  # noqa: S102
+    old_builder = namespace["builder"]
+    exec("def builder(x):\n    return x + 2", namespace)  # noqa: S102
+    signature = (((False,), np.dtype("float64")),)
+    assert compile_cache.cache_key(old_builder, signature, {}) != compile_cache.cache_key(
+        namespace["builder"], signature, {}
+    )
+    assert "_ptd-" in compile_cache._versions_tag()
+
+
+def test_compile_cache_disabled(tmp_path):
+    with rc_context({"compile.cache": False, "compile.cache_dir": str(tmp_path)}):
+        pytensor_jit(_square_plus)(np.linspace(0, 1, 5), 1.0)
+        assert not list(tmp_path.glob("*/*.pkl"))
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Normal(1e4, 2),
+        Gamma(0.5, 2),
+        Beta(0.5, 3),
+        StudentT(10, 0, 1),
+        Poisson(1000),
+        NegativeBinomial(20, 2),
+    ],
+)
+def test_quadrature(dist):
+    assert_allclose(quadrature.moments(dist), dist.moments("mvsk"), rtol=1e-4, atol=1e-6)
+    assert_allclose(quadrature.entropy(dist), dist.entropy(), rtol=1e-6)
+    with rc_context({"stats.quad_tol": 1e-3}):
+        value, error = quadrature.integrate(dist, lambda x: x)
+    assert_allclose(value, dist.mean(), rtol=1e-3)
+    assert error <= 1e-3 * max(1, abs(value))
+
+
+def test_cached_stats():
+    dist = Truncated(Gamma(2, 1), 1, 5)
+    mean = dist.mean()
+    hdi = dist.hdi()
+    x_vals = dist.xvals("full")
+    x_vals[0] = -1
+    assert dist.mean() == mean
+    assert dist.hdi() == hdi
+    assert dist.xvals("full")[0] == 1
+    assert len(dist._stats_cache[1]) > 3
+
+    dist._parametrization(alpha=3, beta=1, lower=1, upper=5)
+    assert dist.mean() != mean
+    assert_almost_equal(dist.mean(), Truncated(Gamma(3, 1), 1, 5).mean())
+    assert len(dist._stats_cache[1]) == 1
+
+    dist = Normal(0, 1)
+    with rc_context({"stats.cache": False}):
+        dist.mean()
+    assert not hasattr(dist, "_stats_cache")
+
+
+def test_cached_stats_base_and_rcparams():
+    # modifying the base distribution inplace discards the cached values of the modifier
+    dist = Truncated(Gamma(2, 1), 1, 5)
+    mean = dist.mean()
+    dist.dist._parametrization(alpha=3, beta=1)
+    assert dist.mean() != mean
+    assert_almost_equal(dist.mean(), Truncated(Gamma(3, 1), 1, 5).mean())
+
+    # values computed under other settings are not reused
+    key = dist._stats_cache[0]
+    with rc_context({"stats.quad_tol": 1e-6}):
+        dist.mean()
+        assert dist._stats_cache[0] != key
+
+
+@pytest.mark.parametrize(
+    "dist, free_values",
+    [
+        (Gamma(mu=2), [0.5]),
+        (Normal(mu=1), [2.0]),
+        (StudentT(nu=4), [0.5, 2]),
+        (TruncatedNormal(lower=0, upper=5), [1.0, 2.0]),
+        (Truncated(Gamma(alpha=2), 1, 4), [3.0]),
+        (HyperGeometric(k=10, n=20), [80]),
+    ],
+)
+def test_free_params_setter(dist, free_values):
+    none_idx, fixed = get_fixed_params(dist)
+    expected = copy(dist)
+    expected._parametrization(**get_params(dist, free_values, none_idx, fixed))
+
+    dist._free_params_setter(none_idx, fixed)(free_values)
+    assert dist.param_names == expected.param_names
+    assert_allclose(dist.params, expected.params)
+    assert dist.params_support == expected.params_support
+    assert_allclose(dist.mean(), expected.mean())
+
+
+def test_autodiff():
+    dist = Gamma(2, 3)
+    x_vals = np.array([0.5, 1.0])
+    values, jac = autodiff.x_jacobian(dist, "cdf", [0, 1], x_vals)()
+    assert jac.shape == (2, 2)
+    for idx in range(2):
+        params = list(dist.params)
+        params[idx] += 1e-6
+        numeric = (Gamma(*params).cdf(x_vals) - values) / 1e-6
+        assert_allclose(jac[:, idx], numeric, rtol=1e-4)
+
+    value, grads = autodiff.stat_gradient(Normal(0, 2), "entropy", [0, 1])()
+    assert_allclose(grads, [0, 0.5])
+
+    sample = np.array([-1.0, 0.5, 2.0])
+    value, grads = autodiff.loglik_gradient(Normal(1, 2), [0], sample)()
+    assert_allclose(value, Normal(1, 2).logpdf(sample).sum())
+    assert_allclose(grads, [np.sum(sample - 1) / 4])
+
+    assert autodiff.stat_gradient(Gamma(mu=2, sigma=1), "entropy", [0, 1]) is None
+    assert autodiff.stat_gradient(Truncated(Normal(0, 1), -1, 1), "entropy", [0, 1]) is None
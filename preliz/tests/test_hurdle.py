@@ -11,7 +11,9 @@ from preliz.distributions import (
     Poisson,
     Truncated,
 )
+from preliz.internal import ppf_table
 from preliz.internal.distribution_helper import eps
+from preliz.internal.rcparams import rc_context
 
 
 @pytest.mark.parametrize(
@@ -72,3 +74,53 @@ def test_hurdle_vs_random(dist):
     assert_almost_equal(hurdle_dist.mean(), rvs.mean(), decimal=2)
     assert_almost_equal(hurdle_dist.var(), rvs.var(), decimal=0)
     assert_almost_equal(hurdle_dist.std(), rvs.std(), decimal=0)
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Hurdle(Gamma(3, 5), psi=0.7),
+        Hurdle(Poisson(3.5), psi=0.7),
+        Truncated(Normal(0, 2), -1, 3),
+        Truncated(NegativeBinomial(3, 5), 1, np.inf),
+    ],
+)
+def test_ppf_table(dist):
+    q = np.random.default_rng(1).uniform(size=10_000)
+    expected = dist.ppf(q)
+    with rc_context({"stats.ppf_table": True}):
+        actual = dist.ppf(q)
+        rvs = dist.rvs(10_000, random_state=1)
+        # the table is reused
+        table = dist._ppf_table
+        dist.ppf(q)
+        assert dist._ppf_table is table
+
+    if dist.kind == "discrete":
+        assert_almost_equal(actual, expected)
+    else:
+        assert np.max(np.abs(actual - expected)) < 1e-6
+    assert_almost_equal(rvs.mean(), dist.mean(), decimal=1)
+
+
+def test_ppf_table_max_points(monkeypatch):
+    # tables that would need too many nodes are not built
+    monkeypatch.setattr(ppf_table, "MAX_POINTS", 1000)
+    dist = Truncated(Normal(0, 2), -1, 3)
+    q = np.linspace(0.01, 0.99, 50)
+    with rc_context({"stats.ppf_table": True}):
+        with pytest.warns(UserWarning, match="exact ppf"):
+            actual = dist.ppf(q)
+    assert dist._ppf_table[1] is None
+    assert_almost_equal(actual, dist.ppf(q))
+
+
+def test_ppf_table_base_changed():
+    # modifying the base distribution inplace rebuilds the table
+    dist = Truncated(Normal(0, 2), -1, 3)
+    q = np.linspace(0.01, 0.99, 50)
+    with rc_context({"stats.ppf_table": True}):
+        dist.ppf(q)
+        dist.dist._parametrization(mu=1, sigma=1)
+        actual = dist.ppf(q)
+    assert np.max(np.abs(dist.cdf(actual) - q)) < 1e-6
@@ -0,0 +1,66 @@
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import preliz as pz
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "preliz.distributions",
+        "preliz.multidimensional",
+        "preliz.ppls",
+        "preliz.predictive",
+        "preliz.unidimensional",
+    ],
+)
+def test_lazy_attrs(module):
+    for name in import_module(module).__all__:
+        assert name in pz.__all__
+        assert getattr(pz, name) is getattr(import_module(module), name)
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, preliz; "
+        "print(' '.join(m for m in ['matplotlib', 'pytensor', 'preliz.distributions.gamma'] "
+        "if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == ""
+
+
+def test_import_time():
+    code = (
+        "import time; start = time.perf_counter(); import preliz; "
+        "print(time.perf_counter() - start)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    # the actual time is much lower, this only catches heavy imports sneaking back in
+    assert float(output) < 2
+
+
+@pytest.mark.parametrize(
+    "imports",
+    [
+        "import preliz; import matplotlib.pyplot as plt",
+        "import matplotlib.pyplot as plt; import preliz",
+    ],
+)
+def test_style_registered(imports):
+    # the styles are available to matplotlib without accessing preliz.style
+    code = f"{imports}; plt.style.use('preliz-doc')"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_style():
+    assert "preliz-doc" in pz.style.available
+    with pz.style.context("preliz-doc"):
+        pz.Normal(0, 1).plot_pdf()
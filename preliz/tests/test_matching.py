@@ -1,8 +1,17 @@
+from copy import copy
+
 import numpy as np
 import pytest
 
 import preliz as pz
-from preliz.unidimensional.matching import match_moments, match_quantiles
+from preliz.internal.special import sample_lmoments
+from preliz.unidimensional.matching import (
+    match_lmoments,
+    match_moments,
+    match_moments_batch,
+    match_quantiles,
+    match_quantiles_batch,
+)
 
 
 @pytest.fixture
@@ -44,6 +53,53 @@ def test_match_moments_invalid_moments(normal_dist, gamma_dist):
         match_moments(normal_dist, pz.Cauchy())
 
 
+@pytest.mark.parametrize(
+    "to_dist, moments",
+    [
+        (pz.Gamma(), "mv"),
+        (pz.Beta(), "md"),
+        (pz.StudentT(nu=5), "mv"),
+        (pz.SkewNormal(), "mvs"),
+        (pz.Weibull(), "mv"),
+    ],
+)
+def test_match_moments_closed_form(to_dist, moments):
+    from_dist = pz.Beta(2, 5)
+    match_moments(from_dist, to_dist, moments=moments)
+    assert np.allclose(to_dist.moments(moments), from_dist.moments(moments))
+    if to_dist.__class__.__name__ != "Weibull":
+        assert to_dist.opt.message == "Closed-form solution"
+
+
+@pytest.mark.parametrize(
+    "to_dist, moments",
+    [
+        (pz.Gamma(), "mv"),
+        (pz.Weibull(), "mv"),
+        (pz.Gamma(alpha=3), "m"),
+        (pz.SkewNormal(), "mvs"),
+    ],
+)
+def test_match_moments_batch(to_dist, moments):
+    from_dist = pz.Beta([2, 3, 5], [5, 3, 2])
+    expected = [pz.Beta(*params) for params in zip(from_dist.alpha, from_dist.beta)]
+    dists = [copy(to_dist) for _ in expected]
+    match_moments_batch(from_dist, to_dist, moments=moments)
+    for idx, dist in enumerate(dists):
+        match_moments(expected[idx], dist, moments=moments)
+        for name, value in dist.params_dict.items():
+            actual = np.broadcast_to(to_dist.params_dict[name], len(dists))[idx]
+            assert np.isclose(actual, value, rtol=0.05)
+
+
+def test_match_moments_batch_array():
+    samples = pz.Gamma([2, 5], 1).rvs((1000, 2), random_state=123).T
+    dist = match_moments_batch(samples, pz.Normal())
+    assert dist.mu.shape == (2,)
+    assert np.allclose(dist.mu, samples.mean(axis=1))
+    assert np.allclose(dist.sigma, samples.std(axis=1))
+
+
 def test_match_quantiles_basic(normal_dist, gamma_dist):
     match_quantiles(normal_dist, gamma_dist)
     q = np.array([0.25, 0.5, 0.5])
@@ -70,6 +126,37 @@ def test_match_quantiles_invalid_quantiles(normal_dist):
         match_quantiles(normal_dist, to_dist, quantiles=[-0.1, 1.1])
 
 
+@pytest.mark.parametrize(
+    "to_dist, quantiles",
+    [
+        (pz.Normal(), None),
+        (pz.StudentT(nu=5), [0.1, 0.5, 0.9]),
+        (pz.Gamma(), None),
+        (pz.Gamma(alpha=3), [0.1, 0.5, 0.9]),
+        (pz.Beta(), None),
+    ],
+)
+def test_match_quantiles_batch(to_dist, quantiles):
+    from_dist = pz.Beta([2, 3, 5], [5, 3, 2])
+    expected = [pz.Beta(*params) for params in zip(from_dist.alpha, from_dist.beta)]
+    dists = [copy(to_dist) for _ in expected]
+    match_quantiles_batch(from_dist, to_dist, quantiles=quantiles)
+    for idx, dist in enumerate(dists):
+        match_quantiles(expected[idx], dist, quantiles=quantiles)
+        for name, value in dist.params_dict.items():
+            actual = np.broadcast_to(to_dist.params_dict[name], len(dists))[idx]
+            assert np.isclose(actual, value, rtol=0.05)
+
+
+def test_match_quantiles_batch_array():
+    targets = np.array([[[-1, 0, 1], [0, 2, 4]], [[1, 2, 3], [-2, 0, 2]]])
+    dist = match_quantiles_batch(targets, pz.Normal())
+    assert dist.mu.shape == (2, 2)
+    assert np.allclose(
+        np.moveaxis(dist.ppf(np.array([0.25, 0.5, 0.75])[:, None, None]), 0, -1), targets
+    )
+
+
 def test_match_moments_plot(normal_dist, gamma_dist):
     result = match_moments(normal_dist, gamma_dist, plot=True)
     assert isinstance(result, tuple)
@@ -82,3 +169,18 @@ def test_match_quantiles_plot(normal_dist, gamma_dist):
     assert isinstance(result, tuple)
     assert hasattr(result[0], "mean")
     assert hasattr(result[1], "plot")
+
+
+@pytest.mark.parametrize("dist", ["normal_dist", "normal_array"])
+def test_match_lmoments(dist, gamma_dist, request):
+    dist = request.getfixturevalue(dist)
+    match_lmoments(dist, gamma_dist)
+    target = dist.lmoments("12") if hasattr(dist, "lmoments") else sample_lmoments(dist)[:2]
+    assert np.allclose(gamma_dist.lmoments("12"), target, atol=1e-2)
+
+    to_dist = pz.Gumbel()
+    match_lmoments(pz.Gumbel(2, 3), to_dist, lmoments="123")
+    assert np.allclose(to_dist.params, (2, 3), atol=1e-2)
+
+    with pytest.raises(ValueError):
+        match_lmoments(dist, gamma_dist, lmoments="mv")
@@ -1,8 +1,10 @@
+from copy import copy
+
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_almost_equal
 
-from preliz import maxent
+from preliz import maxent, maxent_batch
 from preliz.distributions import (
     AsymmetricLaplace,
     Beta,
@@ -49,6 +51,9 @@ from preliz.distributions import (
     ZeroInflatedNegativeBinomial,
     ZeroInflatedPoisson,
 )
+from preliz.internal.maxent_solutions import maxent_closed_form
+from preliz.internal.optimization import get_fixed_params, optimize_max_ent
+from preliz.internal.solution_atlas import FAMILIES, _load_atlas, grid, maxent_start
 
 
 @pytest.mark.parametrize(
@@ -137,7 +142,7 @@ from preliz.distributions import (
             (-3, 2),
             (-0.076, 1.031),
         ),
-        (Uniform(), -2, 10, 0.9, (-2.666, 10.666), (-2.027, 11.306)),
+        (Uniform(), -2, 10, 0.9, (-2.666, 10.666), (-2.666, 10.666)),
         (VonMises(), -1, 1, 0.9, (-np.pi, np.pi), (0.0, 3.294)),
         (VonMises(mu=0.5), -1, 1, 0.9, (-np.pi, np.pi), (6.997)),
         (Wald(), 0, 10, 0.9, (0, np.inf), (5.061, 7.937)),
@@ -191,5 +196,110 @@ def test_maxent_fixed_stats():
         maxent(dist, 0, 3, 0.8, fixed_stat=("bad", 2))
 
 
+@pytest.mark.parametrize(
+    "dist, lower, upper, mass",
+    [
+        (Cauchy(), -1, 1, 0.6),
+        (Exponential(), 0, 4, 0.9),
+        (Gamma(alpha=3), 0, 10, 0.7),
+        (HalfCauchy(), 0, 10, 0.7),
+        (HalfNormal(), 0, 10, 0.7),
+        (HalfStudentT(nu=7), 0, 10, 0.7),
+        (Laplace(), -1, 1, 0.9),
+        (Logistic(), -1, 1, 0.5),
+        (Normal(), 10, 12, 0.99),
+        (StudentT(nu=7), -1, 1, 0.683),
+        (Uniform(), -2, 10, 0.9),
+        (Weibull(alpha=2), 0, 10, 0.9),
+    ],
+)
+def test_maxent_closed_form(dist, lower, upper, mass):
+    none_idx, fixed = get_fixed_params(dist)
+    opt = maxent_closed_form(dist, lower, upper, mass, none_idx, fixed)
+    assert opt is not None
+    assert_allclose(dist.cdf(upper) - dist.cdf(lower), mass, rtol=1e-6)
+    closed_form_entropy = dist.entropy()
+
+    # compare with the generic optimization
+    dist._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 4) / mass)
+    optimize_max_ent(dist, lower, upper, mass, none_idx, fixed, ())
+    assert closed_form_entropy >= dist.entropy() - 1e-3
+
+
+def test_maxent_closed_form_not_applicable():
+    dist = HalfNormal()
+    none_idx, fixed = get_fixed_params(dist)
+    assert maxent_closed_form(dist, 1, 10, 0.7, none_idx, fixed) is None
+    dist = StudentT()
+    none_idx, fixed = get_fixed_params(dist)
+    assert maxent_closed_form(dist, -1, 1, 0.7, none_idx, fixed) is None
+    dist = Normal()
+    maxent(dist, -1, 1, 0.7, fixed_stat=("mean", 0.1))
+    assert dist.opt.message != "Closed-form solution"
+
+
+@pytest.mark.parametrize(
+    "dist, lower, upper, mass",
+    [
+        (Gamma(), 1, 8, 0.9),
+        (Gamma(), 0, 10, 0.7),
+        (InverseGamma(), 0.5, 4, 0.8),
+        (LogNormal(), 2, 10, 0.7),
+        (Weibull(), 0, 5, 0.9),
+        (Gumbel(), -3, 4, 0.8),
+        (Moyal(), 0, 10, 0.9),
+    ],
+)
+def test_maxent_atlas(dist, lower, upper, mass):
+    none_idx, _ = get_fixed_params(dist)
+    start = maxent_start(dist, lower, upper, mass, none_idx)
+    maxent(dist, lower, upper, mass)
+    assert_allclose(start, dist.params, rtol=0.01)
+
+
+def test_atlas_tables():
+    # the shipped tables must be generated again with build_atlas after changing the grids
+    atlas = _load_atlas()
+    for name in FAMILIES:
+        for problem in ("maxent", "quartile"):
+            axes = grid(problem, name)
+            assert atlas[f"{problem}/{name}"].shape == (*(len(axis) for axis in axes), 2)
+
+
+def test_maxent_atlas_not_applicable():
+    assert maxent_start(Gamma(mu=2), 1, 8, 0.9, [0, 1]) is None
+    assert maxent_start(Gamma(alpha=2), 1, 8, 0.9, [1]) is None
+    assert maxent_start(Gamma(), 1, 8, 0.999, [0, 1]) is None
+    assert maxent_start(Normal(), 1, 8, 0.9, [0, 1]) is None
+
+
+@pytest.mark.parametrize(
+    "dist, lowers, uppers, masses",
+    [
+        (Gamma(), [1, 2, 1, 0.5], [8, 10, 4, 3], 0.9),
+        (StudentT(nu=4), [-1, -2, 0], [1, 3, 5], [0.9, 0.8, 0.7]),
+        (Poisson(), [0, 1, 2], [3, 5, 9], 0.7),
+    ],
+)
+def test_maxent_batch(dist, lowers, uppers, masses):
+    dists = [copy(dist) for _ in lowers]
+    maxent_batch(dist, lowers, uppers, masses)
+    _, _, masses = np.broadcast_arrays(lowers, uppers, masses)
+    for idx, (lower, upper, mass) in enumerate(zip(lowers, uppers, masses)):
+        expected = maxent(dists[idx], lower, upper, mass, plot=False)
+        for name, value in expected.params_dict.items():
+            actual = np.broadcast_to(dist.params_dict[name], len(lowers))[idx]
+            assert_allclose(actual, value, rtol=0.05)
+
+
+def test_maxent_batch_shape():
+    dist = maxent_batch(Normal(), [[-1, -2], [-3, -4]], [[1, 2], [3, 4]], 0.9)
+    assert dist.mu.shape == (2, 2)
+    assert_allclose(dist.mu, 0, atol=1e-3)
+    assert_allclose(
+        dist.cdf(np.array([[1, 2], [3, 4]])) - dist.cdf(-np.array([[1, 2], [3, 4]])), 0.9, rtol=1e-3
+    )
+
+
 def test_maxent_plot():
     maxent(Normal(), plot_kwargs={"support": "restricted", "pointinterval": True})
@@ -1,9 +1,10 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_allclose, assert_almost_equal
 from scipy.stats import kurtosis, skew
 
-from preliz.distributions import Mixture, Normal, Poisson
+from preliz.distributions import BetaBinomial, Gamma, HyperGeometric, Mixture, Normal, Poisson
+from preliz.internal.optimization import find_ppf
 
 
 @pytest.mark.parametrize(
@@ -62,3 +63,33 @@ def test_mixture(dist0, dist1, weights):
     # assert c_l >= d_l
     # assert c_u <= d_u
     # assert_almost_equal(cen_dist_inf.hdi(), dist.hdi())
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [
+        Mixture([Normal(-1.5, 1), Gamma(2, 0.5)], weights=[0.6, 0.4]),
+        Mixture([Poisson(4), Poisson(15)], weights=[0.5, 0.5]),
+    ],
+)
+def test_mixture_ppf(dist):
+    q = np.linspace(0.001, 0.999, 1000)
+    ppf = dist.ppf(q)
+    if dist.kind == "discrete":
+        assert np.all(dist.cdf(ppf) >= q)
+        assert np.all(dist.cdf(ppf - 1) < q)
+    else:
+        assert_allclose(dist.cdf(ppf), q, atol=1e-8)
+    assert np.all(np.diff(ppf) >= 0)
+    assert dist.ppf(0) == (dist.support[0] - 1 if dist.kind == "discrete" else dist.support[0])
+    assert dist.ppf(1) == dist.support[1]
+    assert np.all(np.isnan(dist.ppf([-0.1, 1.1])))
+
+
+@pytest.mark.parametrize(
+    "dist",
+    [Normal(2, 3), Gamma(2, 0.5), Poisson(4), HyperGeometric(20, 7, 12), BetaBinomial(2, 5, 10)],
+)
+def test_find_ppf(dist):
+    q = np.linspace(0.001, 0.999, 1000)
+    assert_allclose(find_ppf(dist, q), dist.ppf(q), atol=1e-6)
@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
@@ -10,6 +11,7 @@ from preliz.distributions import (
     BetaBinomial,
     BetaScaled,
     Binomial,
+    Categorical,
     Cauchy,
     ChiSquared,
     DiscreteUniform,
@@ -49,6 +51,8 @@ from preliz.distributions import (
     ZeroInflatedNegativeBinomial,
     ZeroInflatedPoisson,
 )
+from preliz.internal.optimization import optimize_ml
+from preliz.internal.streaming import is_chunked
 
 
 @pytest.mark.parametrize(
@@ -154,3 +158,223 @@ def test_recover_right():
     idx, ax = pz.mle(dists, sample, plot=3)
     assert idx[0] == 2
     assert len(ax.get_legend().legend_handles) == 3
+
+
+@pytest.mark.parametrize(
+    "distribution, params",
+    [
+        (Bernoulli, (0.3,)),
+        (Beta, (0.5, 3)),
+        (ChiSquared, (3,)),
+        (Gamma, (0.8, 2)),
+        (InverseGamma, (3, 0.5)),
+        (NegativeBinomial, (10, 2.5)),
+        (Pareto, (3, 2)),
+        (StudentT, (3, 1, 2)),
+        (Weibull, (1.5, 3)),
+    ],
+)
+def test_dedicated_mle(distribution, params):
+    sample = distribution(*params).rvs(2000, random_state=123)
+    dist = distribution()
+    dist._fit_mle(sample)
+    generic = distribution()
+    optimize_ml(generic, sample)
+    # the dedicated solvers should be at least as good as the generic optimizer
+    assert dist.logpdf(sample).sum() >= generic.logpdf(sample).sum() - 1e-6
+    assert np.all(np.isfinite(np.concatenate([np.atleast_1d(p) for p in dist.params])))
+
+
+@pytest.mark.parametrize(
+    "distribution, params",
+    [
+        (Bernoulli, (0.3,)),
+        (Beta, (2, 5)),
+        (Binomial, (10, 0.3)),
+        (ChiSquared, (3,)),
+        (Exponential, (2,)),
+        (Gamma, (2, 3)),
+        (Geometric, (0.3,)),
+        (HalfNormal, (2,)),
+        (InverseGamma, (3, 0.5)),
+        (LogNormal, (0, 0.5)),
+        (NegativeBinomial, (10, 2.5)),
+        (Normal, (1, 2)),
+        (Pareto, (3, 2)),
+        (Poisson, (4,)),
+        (Uniform, (-1, 3)),
+        (Wald, (1, 3)),
+    ],
+)
+def test_partial_fit(distribution, params):
+    sample = distribution(*params).rvs(3000, random_state=123)
+    dist = distribution()
+    for chunk in np.array_split(sample, 7):
+        dist.partial_fit(chunk)
+    dist.finalize()
+
+    expected = distribution()
+    expected._fit_mle(sample)
+    assert_allclose(dist.params, expected.params, rtol=1e-4)
+    # scalar fits give scalar parameters, not zero-dimensional arrays
+    assert not any(isinstance(param, np.ndarray) for param in dist.params)
+
+
+def test_partial_fit_categorical():
+    sample = Categorical([0.2, 0.5, 0.3]).rvs(3000, random_state=123)
+    dist = Categorical()
+    for chunk in np.array_split(sample, 7):
+        dist.partial_fit(chunk)
+    dist.finalize()
+    expected = Categorical()
+    expected._fit_mle(sample)
+    assert_allclose(dist.p, expected.p)
+
+    # a later chunk with a new highest category extends the counts
+    dist = Categorical()
+    dist.partial_fit([0, 1, 1, 0]).partial_fit([2, 3, 1]).finalize()
+    assert_allclose(dist.p, [2 / 7, 3 / 7, 1 / 7, 1 / 7])
+    assert dist.support == (0, 3)
+
+    # unless the number of categories is fixed
+    with pytest.raises(ValueError):
+        Categorical([0.5, 0.5]).partial_fit([0, 1]).partial_fit([2]).finalize()
+
+
+def test_partial_fit_errors():
+    with pytest.raises(NotImplementedError):
+        Laplace().partial_fit([1, 2, 3])
+    with pytest.raises(ValueError):
+        Normal().finalize()
+    with pytest.raises(ValueError):
+        Gamma().partial_fit([-1, 2, 3]).finalize()
+
+
+def test_mle_chunked(tmp_path):
+    sample = Gamma(2, 3).rvs(5000, random_state=123)
+    path = tmp_path / "sample.npy"
+    np.save(path, sample)
+    chunk_paths = []
+    for idx, chunk in enumerate(np.array_split(sample, 4)):
+        chunk_paths.append(tmp_path / f"chunk_{idx}.npy")
+        np.save(chunk_paths[-1], chunk)
+
+    expected = [Gamma(), Weibull()]
+    idx_expected, _ = pz.mle(expected, sample, plot=0)
+    with pz.rc_context({"stats.chunk_size": 1000}):
+        for source in [np.load(path, mmap_mode="r"), str(path), chunk_paths]:
+            dists = [Gamma(), Weibull()]
+            idx, _ = pz.mle(dists, source, plot=0)
+            assert_allclose(idx, idx_expected)
+            for dist, exp_dist in zip(dists, expected):
+                assert_allclose(dist.params, exp_dist.params, rtol=1e-2)
+
+    with pytest.raises(ValueError):
+        pz.mle([Gamma()], (chunk for chunk in np.array_split(sample, 4)), plot=0)
+
+
+def test_mle_chunked_arrays():
+    sample = Gamma(2, 3).rvs(4000, random_state=123)
+    chunks = np.array_split(sample, 3)
+    expected = [Gamma(), Weibull()]
+    idx_expected, _ = pz.mle(expected, sample, plot=0)
+
+    # lists of arrays are read in chunks when wrapped in a ChunkedSample
+    dists = [Gamma(), Weibull()]
+    idx, _ = pz.mle(dists, pz.ChunkedSample(chunks, chunk_size=1000), plot=0)
+    assert_allclose(idx, idx_expected)
+    for dist, exp_dist in zip(dists, expected):
+        assert_allclose(dist.params, exp_dist.params, rtol=1e-2)
+
+    # otherwise they are two-dimensional samples, and can not be ragged
+    assert not is_chunked(chunks)
+    assert not is_chunked(range(10))
+    with pytest.raises(ValueError, match="ChunkedSample"):
+        pz.mle([Gamma()], chunks, plot=0)
+
+
+def test_mle_weights():
+    values = np.arange(10)
+    counts = Poisson(4).pdf(values) * 1000
+    counts = counts.round().astype(int)
+    sample = np.repeat(values, counts)
+
+    # explicit weights and the automatic compression of repeated values agree with fitting
+    # the uncompressed sample, also for families with their own estimators
+    families = [Poisson, NegativeBinomial, ZeroInflatedPoisson, Laplace, StudentT]
+    weighted = [family() for family in families]
+    idx_weighted, _ = pz.mle(weighted, values, weights=counts, plot=0)
+    repeated = [family() for family in families]
+    idx_repeated, _ = pz.mle(repeated, sample, plot=0)
+    assert_allclose(idx_weighted, idx_repeated)
+    for family, dist_w, dist_r in zip(families, weighted, repeated):
+        expected = family()
+        expected._fit_mle(sample)
+        assert_allclose(dist_w.params, expected.params, rtol=1e-4)
+        assert_allclose(dist_r.params, expected.params, rtol=1e-4)
+        assert_allclose(
+            -np.sum(dist_r.logpdf(values) * counts), -dist_r.logpdf(sample).sum(), rtol=1e-10
+        )
+
+    # zero weights ignore the values outside the support
+    dist = Gamma()
+    pz.mle([dist], [-1, 1, 2, 3], weights=[0, 1, 1, 1], plot=0)
+    assert dist.is_frozen
+
+    with pytest.raises(ValueError):
+        pz.mle([Poisson()], values, weights=counts[:-1], plot=0)
+
+
+def test_mle_boundary_values():
+    # zeros are valid for the Poisson, but make the sufficient statistics of the Gamma infinite
+    sample = Poisson(1).rvs(500, random_state=123)
+    for source in [sample, pz.ChunkedSample([sample])]:
+        dists = [Poisson(), Gamma()]
+        idx, _ = pz.mle(dists, source, plot=0)
+        assert idx[0] == 0
+        assert dists[0].is_frozen
+
+
+def test_mle_n_jobs():
+    sample = Gamma(2, 3).rvs(2000, random_state=123)
+    expected = [Normal(), Gamma(), Weibull(), LogNormal()]
+    idx_expected, _ = pz.mle(expected, sample, plot=0)
+    dists = [Normal(), Gamma(), Weibull(), LogNormal()]
+    idx, _ = pz.mle(dists, sample, plot=0, n_jobs=2)
+    assert_allclose(idx, idx_expected)
+    for dist, exp_dist in zip(dists, expected):
+        assert_allclose(dist.params, exp_dist.params)
+
+    sample = Normal(10, 0.5).rvs((3, 500), random_state=123)
+    expected = [Normal(), Gamma()]
+    pz.mle(expected, sample, plot=0)
+    dists = [Normal(), Gamma()]
+    pz.mle(dists, sample, plot=0, n_jobs=-1)
+    for dist, exp_dist in zip(dists, expected):
+        assert_allclose(dist.params, exp_dist.params)
+        assert dist.params[0].shape == (3,)
+
+    with pytest.raises(ValueError):
+        pz.mle([Normal()], sample, plot=0, n_jobs=0)
+
+
+@pytest.mark.parametrize(
+    "distribution, params",
+    [
+        (Beta, (2, 5)),
+        (Gamma, (2, 3)),
+        (NegativeBinomial, (8, 4)),
+        (Normal, (2, 3)),
+        (Poisson, (4.5,)),
+    ],
+)
+def test_mle_rows(distribution, params):
+    sample = distribution(*params).rvs((4, 300), random_state=123)
+    dist = distribution()
+    pz.mle([dist], sample, plot=0)
+    for idx, row in enumerate(sample):
+        expected = distribution()
+        expected._fit_mle(row)
+        for param, exp_param in zip(dist.params, expected.params):
+            assert param.shape == (4,)
+            assert_allclose(param[idx], exp_param, rtol=1e-5)
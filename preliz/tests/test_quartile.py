@@ -1,9 +1,11 @@
 import sys
+from copy import copy
 
+import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from preliz import quartile
+from preliz import quartile, quartile_batch
 from preliz.distributions import (
     AsymmetricLaplace,
     Beta,
@@ -47,6 +49,8 @@ from preliz.distributions import (
     ZeroInflatedNegativeBinomial,
     ZeroInflatedPoisson,
 )
+from preliz.internal.optimization import get_fixed_params
+from preliz.internal.solution_atlas import quartile_start
 
 
 @pytest.mark.parametrize(
@@ -112,3 +116,48 @@ def test_quartile(distribution, q1, q2, q3, result):
     quartile(distribution, q1, q2, q3)
 
     assert_allclose(distribution.opt.x, result, rtol=0.1, atol=0.01)
+
+
+@pytest.mark.parametrize(
+    "distribution, q1, q2, q3",
+    [
+        (Gamma(), 2, 4, 7),
+        (InverseGamma(), 1, 1.5, 2.5),
+        (LogNormal(), 1, 2, 5),
+        (Weibull(), 1, 2, 3),
+        (Gumbel(), -1, 0, 2),
+        (Moyal(), 0, 1, 3),
+    ],
+)
+def test_quartile_atlas(distribution, q1, q2, q3):
+    none_idx, _ = get_fixed_params(distribution)
+    start = quartile_start(distribution, q1, q2, q3, none_idx)
+    quartile(distribution, q1, q2, q3)
+    assert_allclose(start, distribution.params, rtol=0.01)
+
+
+@pytest.mark.parametrize(
+    "distribution, q1, q2, q3",
+    [
+        (Normal(), [-1, 0, 2], [0, 1, 3], [1, 3, 5]),
+        (StudentT(nu=4), [-1, 0], [0, 1], [1, 3]),
+        (Gamma(), [2, 1, 0.5], [4, 1.5, 1], [7, 2.5, 3]),
+        (Beta(), [0.2, 0.5], [0.3, 0.6], [0.5, 0.8]),
+        (Poisson(), [2, 4], [3, 5], [5, 7]),
+    ],
+)
+def test_quartile_batch(distribution, q1, q2, q3):
+    dists = [copy(distribution) for _ in q1]
+    quartile_batch(distribution, q1, q2, q3)
+    for idx, args in enumerate(zip(q1, q2, q3)):
+        expected = quartile(dists[idx], *args)
+        for name, value in expected.params_dict.items():
+            actual = np.broadcast_to(distribution.params_dict[name], len(q1))[idx]
+            assert_allclose(actual, value, rtol=0.05)
+
+
+def test_quartile_batch_shape():
+    dist = quartile_batch(Normal(), [[-1, -2], [-3, -4]], 0, [[1, 2], [3, 4]])
+    assert dist.mu.shape == (2, 2)
+    assert_allclose(dist.mu, 0, atol=1e-6)
+    assert_allclose(dist.cdf(np.array([[1, 2], [3, 4]])), 0.75)
@@ -1,6 +1,7 @@
 import numpy as np
 from numpy.testing import assert_almost_equal
 from scipy import special as sc_special
+from scipy import stats
 
 from preliz.internal import special as pz_special
 
@@ -23,3 +24,38 @@ def test_logit():
 def test_expit():
     x = np.linspace(-20, 10, 500)
     assert_almost_equal(sc_special.expit(x), pz_special.expit(x))
+
+
+def test_digamma():
+    x = np.linspace(0.01, 50, 500)
+    assert_almost_equal(sc_special.digamma(x), [pz_special.digamma(x_i) for x_i in x])
+
+
+def test_trigamma():
+    x = np.linspace(0.01, 50, 500)
+    assert_almost_equal(sc_special.polygamma(1, x), [pz_special.trigamma(x_i) for x_i in x])
+
+
+def test_inv_digamma():
+    x = np.linspace(0.01, 50, 500)
+    assert_almost_equal(x, [pz_special.inv_digamma(y_i) for y_i in sc_special.digamma(x)])
+
+
+def test_sample_lmoments():
+    # L-moments of the standard exponential
+    sample = np.random.default_rng(123).exponential(size=200_000)
+    assert_almost_equal(pz_special.sample_lmoments(sample), [1, 1 / 2, 1 / 3, 1 / 6], decimal=2)
+    assert np.isnan(pz_special.sample_lmoments(np.array([1.0, 2.0]))[2])
+
+
+def test_sample_moments():
+    sample = np.random.default_rng(123).gamma(2, 3, size=(4, 1000)) + 1e6
+    expected = [
+        np.mean(sample, axis=1),
+        np.var(sample, axis=1),
+        stats.skew(sample, axis=1),
+        stats.kurtosis(sample, axis=1),
+    ]
+    assert_almost_equal(pz_special.sample_moments_rows(sample), np.transpose(expected), decimal=5)
+    assert_almost_equal(pz_special.sample_moments(sample[0]), np.transpose(expected)[0], decimal=5)
+    assert np.isnan(pz_special.sample_moments(np.ones(3))[2])
@@ -1,7 +1,22 @@
 import numpy as np
-from numpy.testing import assert_almost_equal
-
-from preliz.distributions import Normal, Truncated, TruncatedNormal
+import pytest
+from numpy.testing import assert_allclose, assert_almost_equal
+
+from preliz.distributions import (
+    Binomial,
+    Censored,
+    Exponential,
+    Gamma,
+    HalfNormal,
+    LogNormal,
+    Normal,
+    Poisson,
+    Truncated,
+    TruncatedNormal,
+    Uniform,
+)
+from preliz.internal import quadrature
+from preliz.internal.truncated_moments import TRUNCATED_MOMENTS
 
 
 def test_truncated():
@@ -61,3 +76,25 @@ def test_truncated():
     actual_entropy = custom_truncnorm_dist.entropy()
     expected_entropy = genera_truncnorm_dist.entropy()
     assert_almost_equal(actual_entropy, expected_entropy, decimal=2)
+
+
+@pytest.mark.parametrize(
+    "dist, lower, upper",
+    [
+        (Normal(1, 2), -1, np.inf),
+        (Normal(0, 1), 3, 5),
+        (HalfNormal(2), 0.5, 3),
+        (Exponential(1.5), 1, np.inf),
+        (Gamma(3, 2), 0.5, 2),
+        (LogNormal(0.3, 0.5), -np.inf, 2),
+        (Uniform(-1, 3), 0, 5),
+        (Poisson(4.5), 2, 6),
+        (Binomial(10, 0.3), 1, np.inf),
+    ],
+)
+def test_truncated_closed_form_moments(dist, lower, upper):
+    assert dist.__class__.__name__ in TRUNCATED_MOMENTS
+    for modified in [Truncated(dist, lower, upper), Censored(dist, lower, upper)]:
+        actual = [modified.mean(), modified.var(), modified.skewness(), modified.kurtosis()]
+        expected = quadrature.moments(modified)
+        assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,23 @@
+import pytest
+
+import preliz as pz
+
+
+def test_warmup():
+    timings = pz.warmup(["Normal", "Poisson"], methods=["pdf", "ppf", "mean", "rvs"])
+    assert ("Normal", "pdf", "float64[]") in timings
+    assert ("Normal", "pdf", "float64[n]") in timings
+    assert ("Poisson", "pdf", "int64[n]") in timings
+    assert ("Normal", "ppf", "float64[n]") in timings
+    assert ("Poisson", "mean", "") in timings
+    assert ("Poisson", "rvs", "size=n") in timings
+    assert all(time >= 0 for time in timings.values())
+
+
+def test_warmup_invalid():
+    with pytest.raises(ValueError):
+        pz.warmup(["Mixture"])
+    with pytest.raises(ValueError):
+        pz.warmup(["Normal"], methods=["plot_pdf"])
+    with pz.rc_context({"compile.cache": False}), pytest.raises(ValueError):
+        pz.warmup(["Normal"], workers=2)
@@ -1,20 +1,33 @@
+from preliz.internal.streaming import ChunkedSample
 from preliz.unidimensional.combine import combine
 from preliz.unidimensional.combine_roulette import combine_roulette
-from preliz.unidimensional.matching import match_moments, match_quantiles
-from preliz.unidimensional.maxent import maxent
+from preliz.unidimensional.matching import (
+    match_lmoments,
+    match_moments,
+    match_moments_batch,
+    match_quantiles,
+    match_quantiles_batch,
+)
+from preliz.unidimensional.maxent import maxent, maxent_batch
 from preliz.unidimensional.mle import mle
-from preliz.unidimensional.quartile import quartile
+from preliz.unidimensional.quartile import quartile, quartile_batch
 from preliz.unidimensional.quartile_int import QuartileInt
 from preliz.unidimensional.roulette import Roulette
 
 __all__ = [
+    "ChunkedSample",
     "combine",
     "combine_roulette",
+    "match_lmoments",
     "match_moments",
+    "match_moments_batch",
     "match_quantiles",
+    "match_quantiles_batch",
     "maxent",
+    "maxent_batch",
     "mle",
     "quartile",
+    "quartile_batch",
     "QuartileInt",
     "Roulette",
 ]
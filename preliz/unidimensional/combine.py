@@ -19,6 +19,8 @@ def combine(
 
     Fit a weighted sample from ``distributions`` into the distributions listed in ``dist_names`.
     The fit is done using maximum likelihood estimation, and the best match is plotted.
+    The same number of values is drawn from each distribution, and each value is weighted by
+    the weight of the distribution it comes from.
     Notice that the result is NOT a Mixture distribution, but a single distribution
     that best fits the weighted sample.
 
@@ -34,7 +36,8 @@ def combine(
         List of distributions to fit the weighted sample.
         Defaults to ``["Normal", "Gamma", "LogNormal", "StudentT"]``.
     sample_size : int
-        Number of total samples to generate for the fit.
+        Number of total samples to generate for the fit. Distributions with zero weight are
+        ignored.
     rng : int or numpy.random.Generator, optional
         Random number generator or seed. Defaults to ``0``.
     plot : int
@@ -66,17 +69,32 @@ def combine(
 
     weights /= weights.sum()
 
-    n_size = (sample_size * weights).astype(int)
-
     if dist_names is None:
         dist_names = ["Normal", "Gamma", "LogNormal", "StudentT"]
 
+    n_dists = np.sum(weights > 0)
+    n_size = sample_size // n_dists
+
     sample = []
-    for dist, n in zip(distributions, n_size):
-        sample.append(dist.rvs(n, random_state=rng))
+    sample_weights = []
+    for dist, weight in zip(distributions, weights):
+        if weight > 0:
+            sample.append(dist.rvs(n_size, random_state=rng))
+            # scaled so the weights add up to the number of values
+            sample_weights.append(np.full(n_size, weight * n_dists))
+    sample_weights = np.concatenate(sample_weights)
+    if np.all(sample_weights == 1):
+        sample_weights = None
 
     distributions = get_distributions(dist_names)
 
-    idx, ax = mle(distributions, np.concatenate(sample), plot=plot, plot_kwargs=plot_kwargs, ax=ax)
+    idx, ax = mle(
+        distributions,
+        np.concatenate(sample),
+        plot=plot,
+        plot_kwargs=plot_kwargs,
+        ax=ax,
+        weights=sample_weights,
+    )
 
     return np.array(distributions)[idx], ax
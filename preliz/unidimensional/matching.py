@@ -1,10 +1,21 @@
 import warnings
 
 import numpy as np
+from scipy.optimize import OptimizeResult
 
 from preliz.internal.distribution_helper import valid_distribution
-from preliz.internal.optimization import get_fixed_params, optimize_moments, optimize_quantiles
+from preliz.internal.moment_solutions import moments_closed_form, solve_moments_batch
+from preliz.internal.optimization import (
+    get_fixed_params,
+    get_params,
+    optimize_lmoments,
+    optimize_moments,
+    optimize_quantiles,
+)
+from preliz.internal.quantile_solutions import solve_quantiles_batch
 from preliz.internal.rcparams import rcParams
+from preliz.internal.solution_atlas import quartile_start
+from preliz.internal.special import sample_lmoments, sample_moments, sample_moments_rows
 from preliz.ppls.pymc_io import if_pymc_get_preliz
 
 
@@ -52,6 +63,7 @@ def match_moments(
 
     See Also
     --------
+    match_lmoments : Match the distribution to the specified L-moments.
     match_quantiles : Match the distribution to the specified quantiles.
 
     Examples
@@ -100,20 +112,9 @@ def match_moments(
             std = from_dist.std()
             is_array_like = False
     else:
-        target_values = []
-        mean = np.mean(from_dist)
-        std = np.std(from_dist)
-        if "m" in moments:
-            target_values.append(mean)
-        if "v" in moments:
-            target_values.append(np.var(from_dist))
-        if "d" in moments:
-            target_values.append(std)
-        if "s" in moments:
-            target_values.append(np.mean(((from_dist - mean) / std) ** 3))
-        if "k" in moments:
-            target_values.append(np.mean(((from_dist - mean) / std) ** 4))
-        target_values = np.array(target_values)
+        target_values, mean, std = _sample_moments(
+            np.ravel(np.asarray(from_dist, dtype=float)), moments
+        )
         is_array_like = True
 
     if not np.any(np.isfinite(target_values)):
@@ -121,21 +122,256 @@ def match_moments(
             f"At least one of the requested moments ({moments}) of `from_dist` is not finite."
         )
 
+    # Some families invert the moments in closed form. Otherwise initialize `to_dist` to a
+    # distribution matching the mean and standard deviation of `from_dist`. The ``_fit_moments``
+    # method is correct for some distributions, but just a heuristic for others.
+    x = moments_closed_form(to_dist, moments, target_values[None], none_idx)
+    if x is not None and np.all(np.isfinite(x)):
+        to_dist._parametrization(**get_params(to_dist, x[0], none_idx, fixed))
+        opt = OptimizeResult(
+            x=x[0],
+            fun=np.sum((np.array(to_dist.moments(moments)) - target_values) ** 2),
+            success=True,
+            status=0,
+            message="Closed-form solution",
+            nit=0,
+        )
+    else:
+        to_dist._fit_moments(mean, std)
+        opt = optimize_moments(to_dist, moments, target_values, none_idx, fixed)
+    to_dist.opt = opt
+    requested_moments = to_dist.moments(moments)
+
+    if not np.all(np.isfinite(requested_moments)):
+        raise ValueError(
+            f"At least one of the requested moments ({moments}) of `to_dist` is not finite."
+        )
+
+    _check_relative_error(moments, target_values, requested_moments)
+
+    if plot:
+        if not is_array_like:
+            ax = from_dist.plot_pdf(**plot_kwargs)
+        to_dist.plot_pdf(ax=ax, **plot_kwargs)
+        return to_dist, ax
+
+    return to_dist
+
+
+def match_moments_batch(from_dist, to_dist, moments="mv"):
+    """
+    Find the distributions `to_dist` that match many sets of moments at once.
+
+    Equivalent to calling :func:`match_moments` for each set of moments, but faster. Families
+    with analytic expressions for their parameters in terms of the moments are solved in closed
+    form. The rest of the problems are solved together by a vectorized least squares solver,
+    and only the problems it can not solve are solved one by one.
+
+    Parameters
+    ----------
+    from_dist : PreliZ or PyMC distribution or array-like
+        Instance of a fully parametrized PreliZ distribution with array parameters, with a
+        problem for each element of the parameters, or an array with a sample along the last
+        axis for each problem.
+    to_dist : PreliZ distribution or PyMC distribution
+        Instance of a distribution to be fitted to match the moments of `from_dist`.
+        If a PreliZ distribution then it can have some parameters fixed.
+        PreliZ distributions are updated inplace.
+    moments : str
+        The type of moments to compute, as in :func:`match_moments`. Default is 'mv'
+        (mean and variance).
+
+    Returns
+    -------
+    PreliZ distribution
+        Distribution with array parameters, with the shape of the parameters of `from_dist`, or
+        the shape of the array without the last axis.
+
+    Notes
+    -----
+    After calling this function the attribute `opt` of the distribution will be updated with a
+    list of the OptimizeResult objects of the problems.
+
+    See Also
+    --------
+    match_moments : Match the distribution to the specified moments.
+
+    Examples
+    --------
+    Find the Gamma distributions with the mean and variance of three Normal distributions:
+
+    >>> import preliz as pz
+    >>> pz.match_moments_batch(pz.Normal([10, 14, 20], [1, 2, 3]), pz.Gamma())
+    """
+    from_dist = if_pymc_get_preliz(from_dist)
+    to_dist = if_pymc_get_preliz(to_dist)
+
+    valid_distribution(to_dist)
+
+    if hasattr(from_dist, "is_frozen"):
+        if not from_dist.is_frozen:
+            raise ValueError("`from_dist` must be a fully parametrized distribution.")
+        shape = from_dist._params_shape()
+        values = np.broadcast_arrays(
+            *from_dist.moments(moments), from_dist.mean(), from_dist.std(), np.empty(shape)
+        )
+        targets = np.stack(values[: len(moments)], axis=-1).reshape(-1, len(moments))
+        means = values[-3].ravel()
+        stds = values[-2].ravel()
+    else:
+        samples = np.asarray(from_dist, dtype=float)
+        shape = samples.shape[:-1]
+        targets, means, stds = _sample_moments(samples.reshape(-1, samples.shape[-1]), moments)
+
+    if not np.all(np.any(np.isfinite(targets), axis=1)):
+        raise ValueError(
+            f"At least one of the requested moments ({moments}) of `from_dist` is not finite."
+        )
+
+    if to_dist.is_frozen:
+        raise ValueError("All parameters are fixed, at least one should be free")
+
+    none_idx, fixed = get_fixed_params(to_dist)
+    params, opts = solve_moments_batch(to_dist, moments, targets, means, stds)
+
+    requested = np.array(np.broadcast_arrays(*to_dist.moments(moments))).T
+    errors = abs((requested - targets) / (targets + 1e-6) * 100)
+    for opt, error in zip(opts, errors):
+        opt.success = opt.success and not np.any(error > 0.01)
+
+    n_failed = sum(not opt.success for opt in opts)
+    if n_failed:
+        warnings.warn(
+            f"\nThe moments were not matched for {n_failed} out of {len(opts)} problems",
+            stacklevel=2,
+        )
+
+    columns = [column.reshape(shape) for column in params.T]
+    to_dist._parametrization(**get_params(to_dist, columns, none_idx, fixed))
+    to_dist.opt = opts
+    return to_dist
+
+
+def match_lmoments(
+    from_dist,
+    to_dist,
+    lmoments="12",
+    plot=None,
+    plot_kwargs=None,
+    ax=None,
+):
+    """
+    Find the distribution `to_dist` that matches the L-moments of `from_dist`.
+
+    L-moments are linear combinations of order statistics. Sample L-moments are less sensitive
+    to outliers than sample moments, and they exist whenever the mean exists, so they are a
+    good choice for heavy-tailed data.
+
+    Parameters
+    ----------
+    from_dist : PreliZ or PyMC distribution or array-like
+        Instance of a fully parametrized PreliZ distribution or array-like data.
+        We will take the L-moments from this distribution or data.
+    to_dist : PreliZ distribution or PyMC distribution
+        Instance of a distribution to be fitted to match the L-moments of `from_dist`.
+        If a PreliZ distribution then it can have some parameters fixed.
+        PreliZ distributions are updated inplace.
+    lmoments : str
+        The L-moments to match. Default is '12' (L-location and L-scale).
+        Valid combinations are any subset of '1234', where '1' = L-location (mean),
+        '2' = L-scale, '3' = L-skewness and '4' = L-kurtosis.
+    plot : bool
+        Whether to plot the distributions. Defaults to None, which results in
+        the value of rcParams["plots.show_plot"] being used.
+    plot_kwargs : dict
+        Dictionary passed to the method ``plot_pdf()`` of ``from_dist`` and ``to_dist``.
+    ax : matplotlib axes
+
+    Returns
+    -------
+    dict: PreliZ distribution
+    axes: matplotlib axes (only if `plot=True`)
+
+    Notes
+    -----
+    After calling this function the attribute `opt` of the distribution will be updated with the
+    OptimizeResult object from the optimization step.
+
+    See Also
+    --------
+    match_moments : Match the distribution to the specified moments.
+
+    Examples
+    --------
+    L-moment matching between a sample with outliers and a Gumbel distribution:
+
+    .. plot::
+        :context: close-figs
+        :include-source: true
+
+        >>> import preliz as pz
+        >>> pz.style.use('preliz-doc')
+        >>> sample = pz.StudentT(3, 10, 2).rvs(1000, random_state=123)
+        >>> pz.match_lmoments(sample, pz.Gumbel())
+    """
+    from_dist = if_pymc_get_preliz(from_dist)
+    to_dist = if_pymc_get_preliz(to_dist)
+
+    valid_distribution(from_dist)
+    valid_distribution(to_dist)
+
+    if not lmoments or any(lm_t not in "1234" for lm_t in lmoments):
+        raise ValueError("The L-moments should only contain the letters '1', '2', '3', or '4'.")
+
+    if plot is None:
+        plot = rcParams["plots.show_plot"]
+
+    if plot_kwargs is None:
+        plot_kwargs = {}
+
+    none_idx, fixed = get_fixed_params(to_dist)
+
+    if hasattr(from_dist, "is_frozen"):
+        if not from_dist.is_frozen:
+            raise ValueError("`from_dist` must be a fully parametrized distribution.")
+        else:
+            target_values = np.array(from_dist.lmoments(lmoments))
+            mean = from_dist.mean()
+            std = from_dist.std()
+            is_array_like = False
+    else:
+        sample = np.asarray(from_dist, dtype=float).ravel()
+        all_lmoments = sample_lmoments(sample)
+        target_values = np.array([all_lmoments[int(lm_t) - 1] for lm_t in lmoments])
+        mean = np.mean(sample)
+        std = np.std(sample)
+        is_array_like = True
+
+    if not np.any(np.isfinite(target_values)):
+        raise ValueError(
+            f"At least one of the requested L-moments ({lmoments}) of `from_dist` is not finite."
+        )
+
     # Initialize `to_dist` to a distribution matching the mean and standard deviation
     # of `from_dist`. The ``_fit_moments`` method is correct for some distributions,
     # but just a heuristic for others.
     to_dist._fit_moments(mean, std)
 
-    opt = optimize_moments(to_dist, moments, target_values, none_idx, fixed)
+    try:
+        opt = optimize_lmoments(to_dist, lmoments, target_values, none_idx, fixed)
+    except NotImplementedError as err:
+        raise ValueError(
+            f"The L-moments of {to_dist.__class__.__name__} are not implemented."
+        ) from err
     to_dist.opt = opt
-    requested_moments = to_dist.moments(moments)
+    requested_lmoments = np.array(to_dist.lmoments(lmoments))
 
-    if not np.all(np.isfinite(requested_moments)):
+    if not np.all(np.isfinite(requested_lmoments)):
         raise ValueError(
-            f"At least one of the requested moments ({moments}) of `to_dist` is not finite."
+            f"At least one of the requested L-moments ({lmoments}) of `to_dist` is not finite."
         )
 
-    _check_relative_error(moments, target_values, requested_moments)
+    _check_relative_error(lmoments, target_values, requested_lmoments)
 
     if plot:
         if not is_array_like:
@@ -249,8 +485,14 @@ def match_quantiles(
 
     # Initialize `to_dist` to a distribution matching the mean and standard deviation
     # of `from_dist`. The ``_fit_moments`` method is correct for some distributions,
-    # but just a heuristic for others.
-    to_dist._fit_moments(mean, std)
+    # but just a heuristic for others. For the quartiles there may be a tabulated solution.
+    start = None
+    if np.array_equal(quantiles, [0.25, 0.5, 0.75]):
+        start = quartile_start(to_dist, *target_values, none_idx)
+    if start is not None:
+        to_dist._parametrization(**get_params(to_dist, start, none_idx, fixed))
+    else:
+        to_dist._fit_moments(mean, std)
 
     opt = optimize_quantiles(to_dist, quantiles, target_values, none_idx, fixed)
     to_dist.opt = opt
@@ -267,6 +509,120 @@ def match_quantiles(
     return to_dist
 
 
+def match_quantiles_batch(from_dist, to_dist, quantiles=None):
+    """
+    Find the distributions `to_dist` that match many sets of quantiles at once.
+
+    Equivalent to calling :func:`match_quantiles` for each set of quantiles, but faster.
+    Location-scale families, and scale families, are solved in closed form. The rest of the
+    problems are solved together by a vectorized least squares solver, and only the problems it
+    can not solve are solved one by one.
+
+    Parameters
+    ----------
+    from_dist : PreliZ or PyMC distribution or array-like
+        Instance of a fully parametrized PreliZ distribution with array parameters, with a
+        problem for each element of the parameters, or an array with the values of the
+        quantiles along the last axis.
+    to_dist : PreliZ distribution or PyMC distribution
+        Instance of a distribution to be fitted to match the quantiles of `from_dist`.
+        If a PreliZ distribution then it can have some parameters fixed.
+        PreliZ distributions are updated inplace.
+    quantiles : array-like, optional
+        Quantiles to match. Default is [0.25, 0.5, 0.75].
+
+    Returns
+    -------
+    PreliZ distribution
+        Distribution with array parameters, with the shape of the parameters of `from_dist`, or
+        the shape of the array without the last axis.
+
+    Notes
+    -----
+    After calling this function the attribute `opt` of the distribution will be updated with a
+    list of the OptimizeResult objects of the problems.
+
+    See Also
+    --------
+    match_quantiles : Match the distribution to the specified quantiles.
+
+    Examples
+    --------
+    Find the Gamma distributions with quartiles 3, 6 and 8, and 2, 3 and 5:
+
+    >>> import preliz as pz
+    >>> pz.match_quantiles_batch([[3, 6, 8], [2, 3, 5]], pz.Gamma())
+    """
+    from_dist = if_pymc_get_preliz(from_dist)
+    to_dist = if_pymc_get_preliz(to_dist)
+
+    valid_distribution(to_dist)
+
+    if quantiles is None:
+        quantiles = np.array([0.25, 0.5, 0.75])
+    else:
+        quantiles = np.asarray(quantiles, dtype=float)
+        if np.any((quantiles <= 0) | (quantiles >= 1)):
+            raise ValueError("Quantiles must be between 0 and 1.")
+
+    if hasattr(from_dist, "is_frozen"):
+        if not from_dist.is_frozen:
+            raise ValueError("`from_dist` must be a fully parametrized distribution.")
+        shape = from_dist._params_shape()
+        target_values = np.moveaxis(
+            np.asarray(from_dist.ppf(quantiles.reshape(-1, *[1] * len(shape))), dtype=float),
+            0,
+            -1,
+        )
+        target_values = np.broadcast_to(target_values, (*shape, len(quantiles)))
+    else:
+        target_values = np.asarray(from_dist, dtype=float)
+        if target_values.shape[-1:] != quantiles.shape:
+            raise ValueError(
+                "The last axis of `from_dist` should have one value for each quantile."
+            )
+        shape = target_values.shape[:-1]
+    targets = target_values.reshape(-1, len(quantiles))
+
+    if to_dist.is_frozen:
+        raise ValueError("All parameters are fixed, at least one should be free")
+
+    none_idx, fixed = get_fixed_params(to_dist)
+    params, opts = solve_quantiles_batch(to_dist, quantiles, targets, "ppf")
+
+    requested = np.moveaxis(to_dist.ppf(quantiles[:, None]), 0, -1)
+    errors = abs((requested - targets) / (targets + 1e-6) * 100)
+    for opt, error in zip(opts, errors):
+        opt.success = opt.success and not np.any(error > 0.1)
+
+    n_failed = sum(not opt.success for opt in opts)
+    if n_failed:
+        warnings.warn(
+            f"\nThe quantiles were not matched for {n_failed} out of {len(opts)} problems",
+            stacklevel=2,
+        )
+
+    columns = [column.reshape(shape) for column in params.T]
+    to_dist._parametrization(**get_params(to_dist, columns, none_idx, fixed))
+    to_dist.opt = opts
+    return to_dist
+
+
+def _sample_moments(samples, moments):
+    """Compute the requested moments, mean and standard deviation of a sample, or of each row.
+
+    All the moments are computed in a single pass over each sample.
+    """
+    if samples.ndim == 1:
+        mean, var, skewness, kurtosis = sample_moments(samples)
+    else:
+        mean, var, skewness, kurtosis = sample_moments_rows(samples).T
+    std = var**0.5
+    values = {"m": mean, "v": var, "d": std, "s": skewness, "k": kurtosis}
+    target_values = np.array([values[m_t] for m_t in moments if m_t in values])
+    return target_values.T, mean, std
+
+
 def _check_relative_error(values, target_values, requested_moments, tol=0.01):
     errors = abs((requested_moments - target_values) / (target_values + 1e-6) * 100)
 
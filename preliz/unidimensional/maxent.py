@@ -1,9 +1,21 @@
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from multiprocessing import get_context
+
+import numpy as np
 
 from preliz.distributions.normal import Normal
 from preliz.internal.distribution_helper import valid_distribution
-from preliz.internal.optimization import get_fixed_params, optimize_max_ent, relative_error
+from preliz.internal.maxent_solutions import maxent_closed_form
+from preliz.internal.optimization import (
+    get_fixed_params,
+    get_params,
+    optimize_max_ent,
+    relative_error,
+)
 from preliz.internal.rcparams import rcParams
+from preliz.internal.solution_atlas import maxent_start
 from preliz.ppls.pymc_io import if_pymc_get_preliz
 
 
@@ -64,7 +76,10 @@ def maxent(
     Notes
     -----
     After calling this function the attribute `opt` of the distribution will be updated with the
-    OptimizeResult object from the optimization step.
+    OptimizeResult object from the optimization step. For some families, like Normal, StudentT or
+    HalfNormal, the solution is computed in closed form, when no ``fixed_stat`` is used, and the
+    optimization step is skipped. For others, like Gamma, LogNormal or Weibull, the optimization
+    starts from a tabulated solution of a standardized problem.
 
     See Also
     --------
@@ -139,6 +154,46 @@ def maxent(
     # Find which parameters has been fixed
     none_idx, fixed_params = get_fixed_params(distribution)
 
+    opt = None
+    if not fixed_stat:
+        opt = maxent_closed_form(distribution, lower, upper, mass, none_idx, fixed_params)
+
+    if opt is None:
+        opt = _maxent_optimize(distribution, lower, upper, mass, none_idx, fixed_params, fixed_stat)
+    distribution.opt = opt
+
+    r_error, computed_mass = relative_error(distribution, lower, upper, mass)
+
+    if r_error > 0.01:
+        warnings.warn(
+            f"\nThe requested mass is {mass:.3g},\nbut the computed one is {computed_mass:.3g}",
+            stacklevel=2,
+        )
+
+    if plot:
+        ax = distribution.plot_pdf(**plot_kwargs)
+        if plot_kwargs.get("pointinterval"):
+            cid = -4
+        else:
+            cid = -1
+        ax.plot([lower, upper], [0, 0], "o", color=ax.get_lines()[cid].get_c(), alpha=0.5)
+        return distribution, ax
+
+    return distribution
+
+
+def _maxent_optimize(distribution, lower, upper, mass, none_idx, fixed_params, fixed_stat):
+    # Tabulated solutions are close enough to the optimum to skip the multistart
+    start = None if fixed_stat else maxent_start(distribution, lower, upper, mass, none_idx)
+    if start is not None:
+        distribution._parametrization(**get_params(distribution, start, none_idx, fixed_params))
+        opt = optimize_max_ent(
+            distribution, lower, upper, mass, none_idx, fixed_params, (), multistart=False
+        )
+        r_error, _ = relative_error(distribution, lower, upper, mass)
+        if r_error <= 0.01:
+            return opt
+
     # Heuristic to provide an initial guess for the optimization step
     # We obtain those guesses by first approximating the mean and standard deviation
     # from intervals and mass and then use those values for moment matching
@@ -152,29 +207,208 @@ def maxent(
                 f"{distribution.__class__.__name__} does not have a mode method"
             ) from exc
 
-    opt = optimize_max_ent(distribution, lower, upper, mass, none_idx, fixed_params, fixed_stat)
-    distribution.opt = opt
+    return optimize_max_ent(distribution, lower, upper, mass, none_idx, fixed_params, fixed_stat)
 
-    r_error, computed_mass = relative_error(distribution, lower, upper, mass)
 
-    if r_error > 0.01:
+def maxent_batch(
+    distribution=None,
+    lower=-1,
+    upper=1,
+    mass=None,
+    fixed_params=None,
+    workers=None,
+):
+    """
+    Find the maximum entropy distributions that satisfy many constraints at once.
+
+    Equivalent to calling :func:`maxent` for each element of `lower`, `upper` and `mass`, but
+    faster. Similar problems are solved one after the other, using the solution of a problem as
+    the starting point of the next one.
+
+    Parameters
+    ----------
+    distribution : PreliZ or PyMC distribution
+        PreliZ distribution are updated inplace, while PyMC distributions are converted
+        to PreliZ distributions. Parameters can be fixed as in :func:`maxent`.
+    lower : array-like
+        Lower end-points.
+    upper: array-like
+        Upper end-points.
+    mass: float or array-like
+        Probability mass between ``lower`` and ``upper`` bounds. Defaults to None,
+        which results in the value of rcParams["stats.ci_prob"] being used.
+    fixed_params: dict
+        Dictionary with parameter names as keys and the values to fix them to as values.
+        Defaults to None.
+    workers : int
+        Number of processes used to solve the problems. Defaults to None, which solves them in
+        the current process. Each process compiles its own functions, unless the on-disk cache
+        is enabled (``rcParams["compile.cache"] = True``).
+
+    Returns
+    -------
+    PreliZ distribution
+        Distribution with array parameters, with the broadcasted shape of `lower`, `upper` and
+        `mass`.
+
+    Notes
+    -----
+    After calling this function the attribute `opt` of the distribution will be updated with a
+    list of the OptimizeResult objects from the optimization steps.
+
+    See Also
+    --------
+    maxent : Find the maximum entropy distribution with a given mass inside a user defined interval.
+
+    Examples
+    --------
+    Calculate the maxent Gamma distributions with 90 % of the mass between 1 and 8, 2 and 10,
+    and 1 and 4:
+
+    >>> import preliz as pz
+    >>> pz.maxent_batch(pz.Gamma(), [1, 2, 1], [8, 10, 4], 0.9)
+    """
+    distribution = if_pymc_get_preliz(distribution)
+    valid_distribution(distribution)
+
+    if fixed_params is not None:
+        distribution._parametrization(**fixed_params)
+
+    if mass is None:
+        mass = rcParams["stats.ci_prob"]
+
+    lowers, uppers, masses = np.broadcast_arrays(lower, upper, mass)
+    shape = lowers.shape
+    lowers = lowers.ravel()
+    uppers = uppers.ravel()
+    masses = masses.ravel()
+
+    if not np.all((masses > 0) & (masses <= 1)):
+        raise ValueError("mass should be larger than 0 and smaller or equal to 1")
+
+    if np.any(uppers <= lowers):
+        raise ValueError("upper should be larger than lower")
+
+    if distribution is None:
+        distribution = Normal()
+
+    if distribution.is_frozen:
+        raise ValueError("All parameters are fixed, at least one should be free")
+
+    distribution._check_endpoints(lowers.min(), uppers.max())
+
+    none_idx, fixed = get_fixed_params(distribution)
+
+    # Neighbouring problems in this order have similar solutions
+    order = np.lexsort((uppers, lowers, masses))
+
+    if workers is None or workers <= 1:
+        params, opts = _maxent_sequence(
+            copy(distribution), lowers[order], uppers[order], masses[order]
+        )
+    else:
+        chunks = [chunk for chunk in np.array_split(order, workers) if chunk.size]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+            futures = [
+                executor.submit(
+                    _maxent_sequence,
+                    distribution,
+                    lowers[chunk],
+                    uppers[chunk],
+                    masses[chunk],
+                    rcParams.copy(),
+                )
+                for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+        params = np.concatenate([result[0] for result in results])
+        opts = [opt for result in results for opt in result[1]]
+
+    unsorted_params = np.empty_like(params)
+    unsorted_params[order] = params
+    unsorted_opts = [None] * len(opts)
+    for idx, opt in zip(order, opts):
+        unsorted_opts[idx] = opt
+
+    n_failed = sum(not opt.success for opt in unsorted_opts)
+    if n_failed:
         warnings.warn(
-            f"\nThe requested mass is {mass:.3g},\nbut the computed one is {computed_mass:.3g}",
+            f"\nThe requested mass was not reached for {n_failed} out of {len(opts)} problems",
             stacklevel=2,
         )
 
-    if plot:
-        ax = distribution.plot_pdf(**plot_kwargs)
-        if plot_kwargs.get("pointinterval"):
-            cid = -4
+    new_params = {}
+    fdx = 0
+    for idx, name in enumerate(distribution.param_names):
+        if idx in none_idx:
+            new_params[name] = unsorted_params[:, none_idx.index(idx)].reshape(shape)
         else:
-            cid = -1
-        ax.plot([lower, upper], [0, 0], "o", color=ax.get_lines()[cid].get_c(), alpha=0.5)
-        return distribution, ax
+            new_params[name] = fixed[fdx]
+            fdx += 1
 
+    distribution._parametrization(**new_params)
+    distribution.opt = unsorted_opts
     return distribution
 
 
+def _maxent_sequence(distribution, lowers, uppers, masses, rc=None):
+    """Solve a sequence of maxent problems, warm-starting each one from the previous solution.
+
+    The `success` attribute of the returned OptimizeResults is set to False if the mass of the
+    solution differs from the requested one.
+    """
+    if rc is not None:
+        rcParams.update(rc)
+
+    none_idx, fixed = get_fixed_params(distribution)
+    params = np.empty((len(lowers), len(none_idx)))
+    opts = []
+    prev_x = None
+    for idx, (lower, upper, mass) in enumerate(zip(lowers, uppers, masses)):
+        opt = maxent_closed_form(distribution, lower, upper, mass, none_idx, fixed)
+        if opt is not None:
+            params[idx] = opt.x
+            opts.append(opt)
+            continue
+
+        # a tabulated solution is a better start than the heuristic or the previous solution
+        start = maxent_start(distribution, lower, upper, mass, none_idx)
+        if start is not None:
+            distribution._parametrization(**get_params(distribution, start, none_idx, fixed))
+            multistart = False
+        else:
+            distribution._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 4) / mass)
+            multistart = True
+        if start is None and prev_x is not None:
+            heuristic_x = np.array(distribution.params)[none_idx]
+            heuristic_error, _ = relative_error(distribution, lower, upper, mass)
+            distribution._parametrization(**get_params(distribution, prev_x, none_idx, fixed))
+            prev_error, _ = relative_error(distribution, lower, upper, mass)
+            if prev_error <= heuristic_error:
+                multistart = False
+            else:
+                distribution._parametrization(
+                    **get_params(distribution, heuristic_x, none_idx, fixed)
+                )
+
+        opt = optimize_max_ent(
+            distribution, lower, upper, mass, none_idx, fixed, (), multistart=multistart
+        )
+        r_error, _ = relative_error(distribution, lower, upper, mass)
+        if r_error > 0.01 and not multistart:
+            # the warm start was not good enough, try again as maxent would do
+            distribution._fit_moments(mean=(lower + upper) / 2, sigma=((upper - lower) / 4) / mass)
+            opt = optimize_max_ent(distribution, lower, upper, mass, none_idx, fixed, ())
+            r_error, _ = relative_error(distribution, lower, upper, mass)
+
+        opt.success = opt.success and r_error <= 0.01
+        params[idx] = opt.x
+        opts.append(opt)
+        prev_x = opt.x
+
+    return params, opts
+
+
 def end_points_ints(lower, upper):
     return is_integer_num(lower) and is_integer_num(upper)
 
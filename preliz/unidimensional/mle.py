@@ -5,6 +5,7 @@ import numpy as np
 from preliz.internal.distribution_helper import valid_distribution
 from preliz.internal.optimization import fit_to_sample
 from preliz.internal.rcparams import rcParams
+from preliz.internal.streaming import ChunkedSample, compress_sample, is_chunked
 from preliz.ppls.pymc_io import if_pymc_get_preliz
 
 
@@ -14,6 +15,8 @@ def mle(
     plot=1,
     plot_kwargs=None,
     ax=None,
+    weights=None,
+    n_jobs=None,
 ):
     """
     Find the maximum likelihood distribution given a list of distributions and one sample.
@@ -30,8 +33,16 @@ def mle(
         All parameters will be estimated from the data, no parameter can be fixed.
         For PreliZ distributions, pass uninitialized distributions.
         For some PyMC distributions, you may need to pass `np.nan` for parameters.
-    sample : list or 1D array-like
-        Data used to estimate the distribution parameters.
+    sample : list, 1D array-like, np.memmap, path or iterable of chunks
+        Data used to estimate the distribution parameters. Samples that do not fit in memory
+        can be passed as memory-mapped arrays, paths to ``.npy`` files, lists of paths, or
+        iterables of chunks (arrays or paths) that are not lists or tuples, they are read in
+        chunks of ``rcParams["stats.chunk_size"]`` values. A list of arrays is a
+        two-dimensional sample, to read it in chunks wrap it in a :class:`~preliz.ChunkedSample`.
+        Families with sufficient statistics are fitted in a single pass over the data, for the
+        rest, or when the sufficient statistics do not give a valid fit, the likelihood is
+        evaluated chunk by chunk. Iterables of chunks are read several times, so they can not
+        be generators.
     plot : int
         Number of distributions to plots. Defaults to ``1`` (i.e. plot the best match)
         If larger than the number of passed distributions it will plot all of them.
@@ -41,6 +52,17 @@ def mle(
     plot_kwargs : dict
         Dictionary passed to the method ``plot_pdf()`` of ``distribution``.
     ax : matplotlib axes
+    weights : array-like, optional
+        Frequency weights for each value in a one-dimensional ``sample``, for example the
+        number of times each value was observed. Defaults to None, i.e. each value counts once.
+        Integer-valued samples with repeated values are compressed automatically into unique
+        values and counts, giving the same estimates at a lower cost for families with
+        sufficient statistics.
+    n_jobs : int, optional
+        Number of processes used to fit the distributions, and the rows of two-dimensional
+        samples, in parallel. Defaults to None, i.e. fit them sequentially. Use ``-1`` to use
+        all CPUs. Each process compiles the functions it needs, so this pays off for large
+        samples or many distributions. Samples read in chunks are always fitted sequentially.
 
     Returns
     -------
@@ -73,11 +95,37 @@ def mle(
         valid_distribution(dist_)
         dists.append(dist_)
 
-    sample = np.array(sample)
-    x_min = sample.min()
-    x_max = sample.max()
-
-    fitted = fit_to_sample(dists, sample, x_min, x_max)
+    if is_chunked(sample):
+        if weights is not None:
+            raise ValueError("weights are not supported for samples read in chunks")
+        if not isinstance(sample, ChunkedSample):
+            sample = ChunkedSample(sample)
+        x_min = sample.min
+        x_max = sample.max
+    else:
+        try:
+            sample = np.array(sample)
+        except ValueError as err:
+            raise ValueError(
+                "The rows of a two-dimensional sample must have the same size, to read a list "
+                "of arrays in chunks wrap it in a preliz.ChunkedSample"
+            ) from err
+        if weights is None:
+            compressed = compress_sample(sample)
+            if compressed is not None:
+                sample, weights = compressed
+        else:
+            weights = np.asarray(weights, dtype=float)
+            if sample.ndim != 1 or weights.shape != sample.shape:
+                raise ValueError("weights must have the same shape as a one-dimensional sample")
+            if np.any(weights < 0):
+                raise ValueError("The weights must be positive.")
+            sample = sample[weights > 0]
+            weights = weights[weights > 0]
+        x_min = sample.min()
+        x_max = sample.max()
+
+    fitted = fit_to_sample(dists, sample, x_min, x_max, weights, n_jobs)
 
     plot = min(plot, len(dists))
 
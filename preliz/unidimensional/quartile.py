@@ -4,8 +4,15 @@ import numpy as np
 
 from preliz.distributions.normal import Normal
 from preliz.internal.distribution_helper import valid_distribution
-from preliz.internal.optimization import get_fixed_params, optimize_quartile, relative_error
+from preliz.internal.optimization import (
+    get_fixed_params,
+    get_params,
+    optimize_quartile,
+    relative_error,
+)
+from preliz.internal.quantile_solutions import QUARTILES, solve_quantiles_batch
 from preliz.internal.rcparams import rcParams
+from preliz.internal.solution_atlas import quartile_start
 from preliz.ppls.pymc_io import if_pymc_get_preliz
 
 
@@ -116,10 +123,14 @@ def quartile(
     # Find which parameters has been fixed
     none_idx, fixed = get_fixed_params(distribution)
 
-    # Heuristic to provide an initial guess for the optimization step
+    # Start from the tabulated solution if there is one, otherwise use a heuristic
     # We obtain those guesses by first approximating the mean and standard deviation
     # from the quartiles and then use those values for moment matching
-    distribution._fit_moments(mean=q2, sigma=(q3 - q1) / 1.35)
+    start = quartile_start(distribution, q1, q2, q3, none_idx)
+    if start is not None:
+        distribution._parametrization(**get_params(distribution, start, none_idx, fixed))
+    else:
+        distribution._fit_moments(mean=q2, sigma=(q3 - q1) / 1.35)
 
     opt = optimize_quartile(distribution, quartiles, none_idx, fixed)
 
@@ -146,3 +157,92 @@ def quartile(
         return distribution, ax
 
     return distribution
+
+
+def quartile_batch(distribution=None, q1=-1, q2=0, q3=1, fixed_params=None):
+    """
+    Find the distributions with many specified quartiles at once.
+
+    Equivalent to calling :func:`quartile` for each element of `q1`, `q2` and `q3`, but faster.
+    Location-scale families, and scale families for positive quartiles, start from a
+    closed-form solution. All the problems are then solved together by a vectorized least
+    squares solver, and only the problems it can not solve are solved one by one.
+
+    Parameters
+    ----------
+    distribution : PreliZ or PyMC distribution
+        PreliZ distribution are updated inplace, while PyMC distributions are converted
+        to PreliZ distributions. Parameters can be fixed as in :func:`quartile`.
+    q1 : array-like
+        First quartiles.
+    q2 : array-like
+        Second quartiles.
+    q3 : array-like
+        Third quartiles.
+    fixed_params: dict
+        Dictionary with parameter names as keys and the values to fix them to as values.
+        Defaults to None.
+
+    Returns
+    -------
+    PreliZ distribution
+        Distribution with array parameters, with the broadcasted shape of `q1`, `q2` and `q3`.
+
+    Notes
+    -----
+    After calling this function the attribute `opt` of the distribution will be updated with a
+    list of the OptimizeResult objects of the problems.
+
+    See Also
+    --------
+    quartile : Find the distribution with the specified quartiles.
+
+    Examples
+    --------
+    Calculate the Gamma distributions with quartiles 3, 6 and 8, and 2, 3 and 5:
+
+    >>> import preliz as pz
+    >>> pz.quartile_batch(pz.Gamma(), [3, 2], [6, 3], [8, 5])
+    """
+    distribution = if_pymc_get_preliz(distribution)
+    valid_distribution(distribution)
+
+    if fixed_params is not None:
+        distribution._parametrization(**fixed_params)
+
+    q1s, q2s, q3s = np.broadcast_arrays(
+        np.asarray(q1, dtype=float), np.asarray(q2, dtype=float), np.asarray(q3, dtype=float)
+    )
+    shape = q1s.shape
+    targets = np.column_stack([q1s.ravel(), q2s.ravel(), q3s.ravel()])
+
+    if not np.all((targets[:, 0] < targets[:, 1]) & (targets[:, 1] < targets[:, 2])):
+        raise ValueError("The order of the quartiles should be q1 < q2 < q3")
+
+    if distribution is None:
+        distribution = Normal()
+
+    if distribution.is_frozen:
+        raise ValueError("All parameters are fixed, at least one should be free")
+
+    distribution._check_endpoints(targets[:, 0].min(), targets[:, 2].max())
+
+    none_idx, fixed = get_fixed_params(distribution)
+    params, opts = solve_quantiles_batch(distribution, QUARTILES, targets, "cdf")
+
+    # relative_error shifts the lower bound of discrete distributions inplace
+    r_errors, _ = relative_error(distribution, targets[:, 0].copy(), targets[:, 2], 0.5)
+    for opt, r_error in zip(opts, r_errors):
+        opt.success = opt.success and r_error <= 0.01
+
+    n_failed = sum(not opt.success for opt in opts)
+    if n_failed:
+        warnings.warn(
+            f"\nThe expected masses were not reached for {n_failed} out of {len(opts)} problems",
+            stacklevel=2,
+        )
+
+    columns = [column.reshape(shape) for column in params.T]
+    distribution._parametrization(**get_params(distribution, columns, none_idx, fixed))
+    distribution.opt = opts
+    return distribution